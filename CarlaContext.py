@@ -1,31 +1,88 @@
 import time
 import signal
+import weakref
+import warnings
 import carla
-from typing import Union, List
+from threading import Thread, Event, RLock, current_thread
+from typing import Union, List, Callable, Dict
 
-from .manager import RunningManager, ActorManager
+from .actor import Actor
+from .core import Blueprint, Transform
+from .manager import RunningManager, ActorManager, TickPacer
 
 
 class CarlaContext:
+    """
+    A connection to a carla server, with the managers working on it.
+
+    Connection liveness is checked by a background heartbeat every heartbeat_interval seconds. is_alive(),
+    carla_world and carla_world_ref read the result of the latest heartbeat without any RPC. The world handle
+    is only replaced when the episode id of the server changes. Heartbeat failures are reported to the callbacks
+    added by add_heartbeat_failure_callback().
+
+    With auto reconnect, a failed heartbeat starts reconnecting with exponential backoff. If the server came back
+    with a new episode, the registered actor tree is spawned again in one batch from the last known transforms,
+    and sync settings are applied again by the RunningManager. A new episode seen by a successful heartbeat, after a
+    restart shorter than heartbeat_interval, is restored the same way unless it comes from use_map() or reload_world().
+    Heartbeats, restores and reconnect attempts run under one lock, whether they come from the heartbeat thread or
+    from is_alive(fresh=True), so a recovery is never run twice.
+    """
+
+    D_HEARTBEAT_INTERVAL = 1.0  # in seconds
+    D_RECONNECT_BACKOFF_INITIAL = 0.5  # in seconds
+    D_RECONNECT_BACKOFF_MAX = 8.0  # in seconds
 
     def __init__(self,
                  host: str = '127.0.0.1',
                  port: int = 2000,
-                 timeout: float = 2.0):
+                 timeout: float = 2.0,
+                 heartbeat_interval: float = D_HEARTBEAT_INTERVAL):
         # basic
         self._host = host
         self._port = port
         self.timeout = timeout
+        self.heartbeat_interval = heartbeat_interval
         # carla
-        self._carla_client = None  # type: Union[carla.Client, None]
+        self._carla_client_ref = [None]  # type: List[Union[carla.Client, None]]  # mutable reference, len===1
         self._carla_world_ref = [None]  # type: List[Union[carla.World, None]]  # mutable reference, len===1
+        # heartbeat
+        self._heartbeat_alive = False
+        self._heartbeat_error = None  # type: Union[Exception, None]  # error of the latest failed heartbeat
+        self._heartbeat_failure_callbacks = []  # type: List[Callable[[CarlaContext, Exception], None]]
+        self._event_heartbeat_wakeup = Event()
+        self._lock_heartbeat = RLock()  # held by heartbeats, restores and reconnect attempts
+        self._count_heartbeats = 0
+        # auto reconnect
+        self._option_auto_reconnect = False
+        self._reconnect_backoff_initial = self.D_RECONNECT_BACKOFF_INITIAL
+        self._reconnect_backoff_max = self.D_RECONNECT_BACKOFF_MAX
+        self._reconnect_callbacks = []  # type: List[Callable[[CarlaContext, float], None]]
+        self._world_id = None  # type: Union[int, None]  # episode id of the latest heartbeat
+        self._flag_world_changing = False  # set while use_map() or reload_world() changes the episode
+        self._lost_world_id = None  # type: Union[int, None]  # episode id when the connection was lost
+        self._lost_transforms = {}  # type: Dict[Actor, Transform]  # last known transforms of root actors
+        self._count_reconnects = 0
+        self._time_last_recovery = 0.0  # in seconds
+        self._reconnect_error = None  # type: Union[Exception, None]  # error of the last actor restore
         # flags
         self._flag_internal_exit = False
+        self._flag_heartbeat_exit = False
         # managers
-        self.actors = ActorManager(self.carla_world_ref)
-        self.running = RunningManager(self.carla_world_ref)
+        self.running = RunningManager(self.carla_world_ref, self._carla_client_ref)
+        self.actors = ActorManager(self.carla_world_ref,
+                                   self._carla_client_ref,
+                                   self.running.snapshot_cache,
+                                   self.running.control_batcher)
+        self.running.invoke_bind_actor_registry(self.actors.registry)
+        # heartbeat, the thread only holds a weak reference so that the context can be collected
+        self._heartbeat_thread = Thread(target=CarlaContext._heartbeat_thread_func,
+                                        args=(weakref.ref(self),),
+                                        daemon=True)
+        self._heartbeat_thread.start()
 
     def __del__(self):
+        # stop the heartbeat first, it must not replace the world reference during teardown
+        self._invoke_heartbeat_stop()
         self.invoke_connection_stop()
 
     def __enter__(self):
@@ -53,14 +110,13 @@ class CarlaContext:
         """
         [Immutable] Get the carla client
         """
-        return self._carla_client
+        return self._carla_client_ref[0]
 
     @property
     def carla_world(self) -> carla.World:
         """
-        [Immutable] Get the carla client
+        [Immutable] Get the carla world, as of the latest heartbeat
         """
-        self._update_carla_world_ref()
         return self._carla_world_ref[0]
 
     @property
@@ -68,31 +124,129 @@ class CarlaContext:
         """
         [Immutable] Get the carla world reference with 1 element list.
         """
-        self._update_carla_world_ref()
         return self._carla_world_ref
 
-    def is_alive(self, *, raise_exception: bool = False) -> bool:
+    @property
+    def count_heartbeats(self) -> int:
+        """
+        [Read-Only] Number of liveness checks sent to the server.
+        """
+        return self._count_heartbeats
+
+    @property
+    def option_auto_reconnect(self) -> bool:
+        """
+        [Read-Write] Whether the context reconnects and restores its actors after a failed heartbeat.
+        """
+        return self._option_auto_reconnect
+
+    @property
+    def count_reconnects(self) -> int:
+        """
+        [Read-Only] Number of successful automatic reconnections, server restarts seen by a heartbeat included.
+        """
+        return self._count_reconnects
+
+    @property
+    def time_last_recovery(self) -> float:
+        """
+        [Read-Only] Seconds from the detected failure to the restored connection and actors, in the last recovery.
+        """
+        return self._time_last_recovery
+
+    @property
+    def reconnect_error(self) -> Union[Exception, None]:
+        """
+        [Read-Only] The error of the last actor restore, None if every actor was restored.
+        """
+        return self._reconnect_error
+
+    def is_alive(self, *, raise_exception: bool = False, fresh: bool = False) -> bool:
         """
         Check that the carla client connection in CarlaContext is good.
+
+        The result of the latest heartbeat is returned, use fresh=True to check the server right now.
+        A fresh check waits up to timeout seconds for a running heartbeat or reconnect attempt, and returns its
+        result if it is still running then.
+
         :param raise_exception: whether to raise exceptions if check failed.
+        :param fresh: whether to send a liveness check instead of reading the latest heartbeat.
         :return: check result
         :except ConnectionError: if raise_exception is True and connection check failed.
         """
         if not isinstance(self.carla_client, carla.Client):
-            return False
-        try:
-            # try to get carla server version
-            self.carla_client.get_server_version()
-            self._update_carla_world_ref()
-        except RuntimeError as e:
-            # RuntimeError means that connection is not good, raise exceptions on request.
             if raise_exception:
-                raise ConnectionError(e) from e
-            else:
-                return False
-        else:
-            # if no exceptions happened
-            return True
+                raise ConnectionError('Not connected to carla server.')
+            return False
+        if fresh and self._lock_heartbeat.acquire(timeout=self.timeout):
+            try:
+                self._invoke_heartbeat()
+            finally:
+                self._lock_heartbeat.release()
+        if not self._heartbeat_alive and raise_exception:
+            # the heartbeat failed, raise exceptions on request.
+            error = self._heartbeat_error
+            raise ConnectionError(error if error is not None else 'Connection is not checked yet.') from error
+        return self._heartbeat_alive
+
+    def add_heartbeat_failure_callback(self, callback: Callable[['CarlaContext', Exception], None]) -> 'CarlaContext':
+        """
+        Add a callback called in the heartbeat thread when a liveness check fails.
+
+        :param callback: a callable taking the context and the error as arguments
+        :return: return self for method chaining.
+        """
+        self._heartbeat_failure_callbacks.append(callback)
+        return self
+
+    def remove_heartbeat_failure_callback(self,
+                                          callback: Callable[['CarlaContext', Exception], None]) -> 'CarlaContext':
+        """
+        Remove a callback added by add_heartbeat_failure_callback. No effect if it is not added.
+        :param callback: the callable to remove
+        :return: return self for method chaining.
+        """
+        if callback in self._heartbeat_failure_callbacks:
+            self._heartbeat_failure_callbacks.remove(callback)
+        return self
+
+    def use_auto_reconnect(self, option: bool = True, *,
+                           backoff_initial: float = D_RECONNECT_BACKOFF_INITIAL,
+                           backoff_max: float = D_RECONNECT_BACKOFF_MAX) -> 'CarlaContext':
+        """
+        Enable or disable the automatic reconnection.
+
+        :param option: True to reconnect and restore actors after a failed heartbeat.
+        :param backoff_initial: seconds to wait before the first attempt, doubled after each failed attempt.
+        :param backoff_max: maximum seconds between two attempts.
+        :return: return self for method chaining.
+        """
+        if backoff_initial <= 0.0 or backoff_max < backoff_initial:
+            raise ValueError("backoff_initial must be greater than 0 and not greater than backoff_max.")
+        self._option_auto_reconnect = option
+        self._reconnect_backoff_initial = backoff_initial
+        self._reconnect_backoff_max = backoff_max
+        return self
+
+    def add_reconnect_callback(self, callback: Callable[['CarlaContext', float], None]) -> 'CarlaContext':
+        """
+        Add a callback called in the heartbeat thread after an automatic reconnection or a restored server restart.
+
+        :param callback: a callable taking the context and the recovery time in seconds as arguments
+        :return: return self for method chaining.
+        """
+        self._reconnect_callbacks.append(callback)
+        return self
+
+    def remove_reconnect_callback(self, callback: Callable[['CarlaContext', float], None]) -> 'CarlaContext':
+        """
+        Remove a callback added by add_reconnect_callback. No effect if it is not added.
+        :param callback: the callable to remove
+        :return: return self for method chaining.
+        """
+        if callback in self._reconnect_callbacks:
+            self._reconnect_callbacks.remove(callback)
+        return self
 
     def use_map(self, map_name: str) -> 'CarlaContext':
         """
@@ -105,7 +259,16 @@ class CarlaContext:
         :except RuntimeError: if map_name is not a valid carla map name.
         """
         self.is_alive(raise_exception=True)
-        self.carla_client.load_world(map_name)
+        self._flag_world_changing = True
+        world_id_old = self._world_id
+        try:
+            world = self.carla_client.load_world(map_name)
+            self._carla_world_ref[0] = world
+            self._world_id = world.id
+        finally:
+            self._flag_world_changing = False
+        # only the replaced world, other contexts keep their entries
+        Blueprint.BLUEPRINT_CACHE.invalidate(world_id_old)
         return self
 
     def reload_world(self, reset_settings: bool = False) -> 'CarlaContext':
@@ -116,7 +279,16 @@ class CarlaContext:
         :return: return self for method chaining.
         """
         self.is_alive(raise_exception=True)
-        self.carla_client.reload_world(reset_settings=reset_settings)
+        self._flag_world_changing = True
+        world_id_old = self._world_id
+        try:
+            world = self.carla_client.reload_world(reset_settings=reset_settings)
+            self._carla_world_ref[0] = world
+            self._world_id = world.id
+        finally:
+            self._flag_world_changing = False
+        # only the replaced world, other contexts keep their entries
+        Blueprint.BLUEPRINT_CACHE.invalidate(world_id_old)
         return self
 
     def wait_for_ticks(self, count: int = 1, timeout: float = 0.0) -> 'CarlaContext':
@@ -126,16 +298,7 @@ class CarlaContext:
         :param count: tick count to wait
         :return: return self for method chaining.
         """
-        time_start = time.time()
-        for _ in range(count):
-            if timeout > 0:
-                time_left = timeout - (time.time() - time_start)
-            else:
-                time_left = None
-            if self.running.event_carla_tick.wait(timeout=time_left):
-                continue
-            else:
-                raise TimeoutError(f'Timeout waiting for {count} ticks.')
+        self.running.wait_for_ticks(count, timeout=timeout if timeout > 0 else None)
         return self
 
     def wait_for_seconds(self, seconds: float) -> 'CarlaContext':
@@ -177,16 +340,16 @@ class CarlaContext:
         :return: return self for method chaining.
         """
         # directly return if already connected
-        if self.is_alive():
+        if self.is_alive(fresh=True):
             return self
         # create carla client
-        self._carla_client = carla.Client(self.host, self.port)
+        self._carla_client_ref[0] = carla.Client(self.host, self.port)
         self.carla_client.set_timeout(self.timeout)
         # test connection
         try:
-            self.is_alive(raise_exception=True)
+            self.is_alive(raise_exception=True, fresh=True)
         except ConnectionError as e:
-            self._carla_client = None
+            self._carla_client_ref[0] = None
             raise e
         # and return
         return self
@@ -198,22 +361,211 @@ class CarlaContext:
         if not self.is_alive():
             return self
         self.running.use_sync_primary_mode(False)
-        self.actors.invoke_actor_destroy(self.actors.registry)
-        self.wait_for_ticks(5, timeout=2.0)
+        self.actors.invoke_actor_destroy_batch(self.actors.registry)
+        try:
+            self.wait_for_ticks(1, timeout=2.0)  # let the server apply the destroy batch
+        except TimeoutError:
+            # the control thread may be gone already, e.g. on interpreter exit
+            pass
         # release client
-        self._carla_client = None
+        self._carla_client_ref[0] = None
+        self._carla_world_ref[0] = None
+        self._world_id = None
+        self._heartbeat_alive = False
         return self
 
-    def _update_carla_world_ref(self):
+    def invoke_reset(self) -> 'CarlaContext':
         """
-        Update the carla world reference.
+        Bring the context back to its state right after connection, e.g. before the next scenario on the same server.
 
-        This method is called before accessing the carla world.
-        Do not call this method directly.
+        Registered actors are destroyed in one batch and removed from the registry, the running options are set back
+        to their defaults and the callbacks added to the context and its running manager are removed.
+        The connection is kept.
+
+        :return: return self for method chaining.
         """
-        if not self.is_alive():
+        self.running.use_sensor_barrier(False) \
+            .use_sync_primary_mode(False) \
+            .use_tick_pacing(TickPacer.PACING_REALTIME)
+        for callback in self.running.tick_scheduler.callbacks:
+            self.running.remove_tick_callback(callback)
+        if self.is_alive():
+            self.actors.invoke_actor_destroy_batch(self.actors.registry)
+            try:
+                self.wait_for_ticks(1, timeout=2.0)  # let the server apply the destroy batch
+            except TimeoutError:
+                pass
+        # the registry is shared with the running manager, clear it in place
+        self.actors.registry.clear()
+        self._heartbeat_failure_callbacks.clear()
+        self._reconnect_callbacks.clear()
+        self.use_auto_reconnect(False)
+        return self
+
+    def _invoke_heartbeat(self) -> bool:
+        """
+        Check the connection and update the carla world reference.
+
+        get_server_version() is the liveness probe, get_world() then reads the episode id. The world reference is
+        only replaced when the episode id changes. With auto reconnect, a new episode that does not come from
+        use_map() or reload_world() means that the server restarted, the actors are restored.
+        Do not call this method directly, use is_alive(fresh=True). The heartbeat lock must be held by the caller.
+
+        :return: check result
+        """
+        client = self.carla_client
+        if client is None:
+            self._heartbeat_alive = False
             self._carla_world_ref[0] = None
+            return False
+        self._count_heartbeats += 1
         try:
-            self._carla_world_ref[0] = self.carla_client.get_world()
-        except (RuntimeError, ConnectionError, AttributeError):
+            client.get_server_version()
+            world = client.get_world()
+        except RuntimeError as e:
+            # RuntimeError means that connection is not good
+            if self._heartbeat_alive:
+                self._invoke_capture_lost_state()
+            self._heartbeat_alive = False
+            self._heartbeat_error = e
             self._carla_world_ref[0] = None
+            self._invoke_callbacks('Heartbeat failure', self._heartbeat_failure_callbacks, e)
+            return False
+        self._heartbeat_alive = True
+        self._heartbeat_error = None
+        # read the flag after get_world(), use_map() and reload_world() set the episode id before clearing it
+        if not self._flag_world_changing and world.id != self._world_id:
+            if self._world_id is not None and self.option_auto_reconnect:
+                # the server restarted between two heartbeats, keep the state before the new world is used
+                time_begin = time.perf_counter()
+                self._invoke_capture_lost_state()
+                self._invoke_restore_world(world)
+                self._invoke_finish_recovery(time_begin)
+                return True
+            self._world_id = world.id
+        world_current = self._carla_world_ref[0]
+        if world_current is None or world_current.id != world.id:
+            self._carla_world_ref[0] = world
+        return True
+
+    def _invoke_capture_lost_state(self):
+        """
+        Keep the episode id and the last known transforms of root actors before the world reference is dropped.
+        :return: None
+        """
+        self._lost_world_id = self._world_id
+        self._lost_transforms = {}
+        snapshot = self.running.snapshot_cache.snapshot
+        if snapshot is None:
+            return
+        for actor in list(self.actors.registry):
+            # children keep their transform relative to the parent
+            if actor.carla_actor is None or actor.parent is not None:
+                continue
+            actor_snapshot = snapshot.find(actor.carla_actor.id)
+            if actor_snapshot is not None:
+                self._lost_transforms[actor] = Transform.from_carla_transform(actor_snapshot.get_transform())
+
+    def _invoke_reconnect(self) -> bool:
+        """
+        Reconnect with exponential backoff and restore the actors if the server lost them.
+
+        Each attempt takes the heartbeat lock, the backoff waits do not hold it.
+
+        :return: whether the connection is restored
+        """
+        time_begin = time.perf_counter()
+        backoff = self._reconnect_backoff_initial
+        while self._flag_heartbeat_exit is False and self.option_auto_reconnect and self.carla_client is not None:
+            self._event_heartbeat_wakeup.wait(backoff)
+            backoff = min(backoff * 2.0, self._reconnect_backoff_max)
+            with self._lock_heartbeat:
+                if self._heartbeat_alive:
+                    # recovered by is_alive(fresh=True) during the backoff
+                    return True
+                try:
+                    client = carla.Client(self.host, self.port)
+                    client.set_timeout(self.timeout)
+                    client.get_server_version()
+                    world = client.get_world()
+                except RuntimeError as e:
+                    self._heartbeat_error = e
+                    continue
+                # restore the connection
+                self._carla_client_ref[0] = client
+                self._heartbeat_alive = True
+                self._heartbeat_error = None
+                self._invoke_restore_world(world)
+                self._invoke_finish_recovery(time_begin)
+                return True
+        return False
+
+    def _invoke_restore_world(self, world: carla.World):
+        """
+        Use the world of a recovered connection, and spawn the actors again if the episode changed.
+        :return: None
+        """
+        self._carla_world_ref[0] = world
+        self._world_id = world.id
+        # a new episode lost every actor, sync settings are applied again by the RunningManager on the new world
+        self._reconnect_error = None
+        if world.id != self._lost_world_id:
+            Blueprint.BLUEPRINT_CACHE.invalidate(self._lost_world_id)
+            lost_actors = [a for a in list(self.actors.registry) if a.carla_actor is not None]
+            for actor in lost_actors:
+                actor.invoke_unbind_carla_actor()
+            for actor, transform in self._lost_transforms.items():
+                actor.set_transform(transform)
+            try:
+                self.actors.invoke_actor_spawn_batch(lost_actors)
+            except RuntimeError as e:
+                self._reconnect_error = e
+
+    def _invoke_finish_recovery(self, time_begin: float):
+        """
+        Count a recovery and call the reconnect callbacks.
+        :param time_begin: perf_counter() timestamp of the detected failure
+        :return: None
+        """
+        self._count_reconnects += 1
+        self._time_last_recovery = time.perf_counter() - time_begin
+        self._invoke_callbacks('Reconnect', self._reconnect_callbacks, self._time_last_recovery)
+
+    def _invoke_callbacks(self, kind: str, callbacks: List[Callable], *args):
+        """
+        Call callbacks in the heartbeat thread. An exception is turned into a RuntimeWarning,
+        so one failing callback does not stop the heartbeat.
+        """
+        for callback in tuple(callbacks):
+            try:
+                callback(self, *args)
+            except Exception as e:
+                warnings.warn(f'{kind} callback {callback!r} raised {type(e).__name__}: {e}', RuntimeWarning)
+
+    def _invoke_heartbeat_stop(self):
+        """
+        Stop the heartbeat thread and wait for it to exit.
+        :return: None
+        """
+        self._flag_heartbeat_exit = True
+        self._event_heartbeat_wakeup.set()
+        # the last reference may be dropped by the heartbeat thread itself
+        if self._heartbeat_thread is not current_thread():
+            self._heartbeat_thread.join()
+
+    @staticmethod
+    def _heartbeat_thread_func(context_ref: 'weakref.ref[CarlaContext]'):
+        while True:
+            context = context_ref()
+            if context is None or context._flag_heartbeat_exit:
+                return
+            if context.carla_client is not None:
+                with context._lock_heartbeat:
+                    alive = context._invoke_heartbeat()
+                if not alive and context.option_auto_reconnect:
+                    context._invoke_reconnect()
+            event_wakeup = context._event_heartbeat_wakeup
+            heartbeat_interval = context.heartbeat_interval
+            # do not keep the context alive while waiting
+            del context
+            event_wakeup.wait(heartbeat_interval)
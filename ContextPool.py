@@ -0,0 +1,422 @@
+import time
+import pickle
+import queue
+from collections import deque
+from concurrent.futures import Future
+from threading import Thread, Lock
+from multiprocessing import Process, Queue
+from typing import Union, List, Dict, Tuple, Callable, Sequence, Deque
+
+
+class ContextPool:
+    """
+    A pool of worker processes, each one owning a CarlaContext connected to one carla server.
+
+    Submitted jobs wait in the pool, which hands the next one to the first free worker through the worker's own
+    inbox, so a free server always takes the next job and the pool always knows which job each worker holds.
+    A job is a picklable callable taking the worker's CarlaContext as first argument, its return value is sent
+    back to the Future returned by submit(). A failed job is queued again up to max_retries times, possibly taken
+    by another server. A worker process that dies is restarted, the job it holds is counted as failed, even if the
+    worker died before starting it.
+
+    After each job, the worker resets its CarlaContext with CarlaContext.invoke_reset(), so the next job on that
+    server starts without the actors, running options and callbacks of the previous one.
+
+    Endpoints are "host:port" strings or (host, port) tuples. The same endpoint can be listed several times to run
+    several workers on one server.
+
+    The initializer is called in each worker process before its CarlaContext is created. Worker processes are
+    started with the default multiprocessing start method, so a stand-in carla module installed in the parent
+    process is also used by the workers.
+    """
+
+    D_MAX_RETRIES = 2
+    D_RECONNECT_DELAY = 1.0  # in seconds, a worker waits that long after failing to connect
+    D_COLLECTOR_INTERVAL = 0.1  # in seconds
+    D_PROCESS_JOIN_TIMEOUT = 2.0  # in seconds
+
+    MSG_DONE = 'done'
+    MSG_FAILED = 'failed'
+
+    class Job:
+        """
+        A submitted job with its retry state.
+        """
+        def __init__(self, job_id: int, function: Callable, args: tuple, kwargs: dict, future: Future):
+            self.job_id = job_id
+            self.function = function
+            self.args = args
+            self.kwargs = kwargs
+            self.future = future
+            self.attempt = 0  # number of failed attempts
+
+    class Worker:
+        """
+        A worker process with the statistics of its server.
+        """
+        def __init__(self, index: int, host: str, port: int):
+            self.index = index
+            self.host = host
+            self.port = port
+            self.process = None  # type: Union[Process, None]
+            self.inbox = None  # type: Union[Queue, None]  # jobs handed to the process, one at a time
+            self.job_id = None  # type: Union[int, None]  # job handed to the process and not finished yet
+            self.time_job_begin = 0.0
+            # statistics
+            self.count_done = 0
+            self.count_failed = 0
+            self.count_restarts = 0
+            self.time_busy = 0.0  # in seconds
+
+        @property
+        def endpoint(self) -> str:
+            return f'{self.host}:{self.port}'
+
+    def __init__(self,
+                 endpoints: Sequence[Union[str, Tuple[str, int]]],
+                 *,
+                 timeout: float = 2.0,
+                 max_retries: int = D_MAX_RETRIES,
+                 initializer: Union[Callable, None] = None,
+                 initargs: tuple = ()):
+        """
+        Construct a ContextPool instance and start one worker process per endpoint.
+
+        :param endpoints: "host:port" strings or (host, port) tuples
+        :param timeout: carla client timeout of each CarlaContext, in seconds
+        :param max_retries: times a failed job is queued again before its Future fails
+        :param initializer: Optional, a picklable callable called with initargs in each worker process
+        :param initargs: arguments of the initializer
+        """
+        if len(endpoints) == 0:
+            raise ValueError("At least one endpoint is required.")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative.")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._initializer = initializer
+        self._initargs = initargs
+        # queues
+        self._result_queue = Queue()
+        # jobs
+        self._jobs = {}  # type: Dict[int, ContextPool.Job]  # job id -> submitted job not finished yet
+        self._queued = deque()  # type: Deque[int]  # ids of jobs waiting for a free worker
+        self._count_submitted = 0
+        self._count_retries = 0
+        self._lock = Lock()
+        # workers
+        self._workers = [ContextPool.Worker(index, *self._parse_endpoint(endpoint))
+                         for index, endpoint in enumerate(endpoints)]
+        self._time_start = time.perf_counter()
+        # flags
+        self._flag_shutdown = False
+        for worker in self._workers:
+            self._invoke_start_worker(worker)
+        # collector
+        self._collector_thread = Thread(target=self._collector_thread_func, daemon=True)
+        self._collector_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.invoke_shutdown()
+
+    @property
+    def endpoints(self) -> List[str]:
+        """
+        [Read-Only] "host:port" of each worker, in the construction order.
+        """
+        return [worker.endpoint for worker in self._workers]
+
+    @property
+    def count_pending(self) -> int:
+        """
+        [Read-Only] Number of jobs submitted and not finished yet, running ones included.
+        """
+        with self._lock:
+            return len(self._jobs)
+
+    @property
+    def count_retries(self) -> int:
+        """
+        [Read-Only] Number of times a failed job was queued again.
+        """
+        return self._count_retries
+
+    @property
+    def statistics(self) -> Dict[str, dict]:
+        """
+        [Read-Only] Utilization of each worker since the pool started.
+
+        :return: "host:port#index" -> {'done': count, 'failed': count, 'restarts': count,
+                                       'busy': seconds holding jobs, 'utilization': busy / elapsed,
+                                       'running': whether a job is held, 'alive': whether the process runs}
+        """
+        now = time.perf_counter()
+        elapsed = max(now - self._time_start, 1e-9)
+        result = {}
+        with self._lock:
+            for worker in self._workers:
+                busy = worker.time_busy
+                if worker.job_id is not None:
+                    busy += now - worker.time_job_begin
+                result[f'{worker.endpoint}#{worker.index}'] = {
+                    'done': worker.count_done,
+                    'failed': worker.count_failed,
+                    'restarts': worker.count_restarts,
+                    'busy': busy,
+                    'utilization': busy / elapsed,
+                    'running': worker.job_id is not None,
+                    'alive': worker.process is not None and worker.process.is_alive(),
+                }
+        return result
+
+    def submit(self, function: Callable, *args, **kwargs) -> Future:
+        """
+        Submit a scenario job, run by the first free worker as function(context, *args, **kwargs).
+
+        :param function: a picklable callable taking a connected CarlaContext as first argument
+        :return: a Future resolved with the return value, or the exception of the last attempt
+        """
+        if self._flag_shutdown:
+            raise RuntimeError("Cannot submit a job to a ContextPool that is shut down.")
+        future = Future()
+        with self._lock:
+            job = ContextPool.Job(self._count_submitted, function, args, kwargs, future)
+            self._count_submitted += 1
+            self._jobs[job.job_id] = job
+            self._queued.append(job.job_id)
+            self._invoke_dispatch()
+        return future
+
+    def map(self, function: Callable, *iterables) -> List[Future]:
+        """
+        Submit one job per item of the iterables, like the built-in map().
+
+        :param function: a picklable callable taking a connected CarlaContext as first argument
+        :return: the Futures, in the order of the items
+        """
+        return [self.submit(function, *args) for args in zip(*iterables)]
+
+    def invoke_shutdown(self, wait: bool = True) -> 'ContextPool':
+        """
+        Stop the workers. Queued jobs not taken by a worker yet are cancelled.
+
+        :param wait: wait for the running jobs to finish
+        :return: return self for method chaining.
+        """
+        if self._flag_shutdown:
+            return self
+        # cancel queued jobs, no job is handed to a worker after the flag is set
+        with self._lock:
+            self._flag_shutdown = True
+            jobs = [self._jobs.pop(job_id) for job_id in self._queued if job_id in self._jobs]
+            self._queued.clear()
+        for job in jobs:
+            if not job.future.cancel():
+                # a retried job is already running
+                job.future.set_exception(RuntimeError("ContextPool was shut down before the job finished."))
+        # stop workers after their running jobs
+        for worker in self._workers:
+            if worker.inbox is not None:
+                worker.inbox.put(None)
+        for worker in self._workers:
+            if worker.process is None:
+                continue
+            if wait:
+                worker.process.join()
+            else:
+                worker.process.join(self.D_PROCESS_JOIN_TIMEOUT)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        self._collector_thread.join()
+        # fail jobs left by terminated workers
+        with self._lock:
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+        for job in jobs:
+            if not job.future.done():
+                job.future.set_exception(RuntimeError("ContextPool was shut down before the job finished."))
+        return self
+
+    def _invoke_start_worker(self, worker: 'ContextPool.Worker'):
+        """
+        Start the process of a worker with a new inbox.
+        """
+        worker.inbox = Queue()
+        worker.process = Process(target=_worker_process_func,
+                                 args=(worker.index, worker.host, worker.port, self.timeout,
+                                       worker.inbox, self._result_queue,
+                                       self._initializer, self._initargs),
+                                 daemon=True)
+        worker.process.start()
+
+    def _invoke_dispatch(self):
+        """
+        Hand queued jobs to free workers. The lock must be held by the caller.
+        """
+        for worker in self._workers:
+            if not self._queued or self._flag_shutdown:
+                return
+            if worker.job_id is not None or worker.process is None or not worker.process.is_alive():
+                continue
+            while self._queued:
+                job = self._jobs.get(self._queued.popleft())
+                if job is None:
+                    continue
+                if job.attempt == 0 and not job.future.set_running_or_notify_cancel():
+                    # cancelled while queued
+                    self._jobs.pop(job.job_id)
+                    continue
+                worker.job_id = job.job_id
+                worker.time_job_begin = time.perf_counter()
+                worker.inbox.put((job.job_id, job.function, job.args, job.kwargs))
+                break
+
+    def _invoke_handle_message(self, message: tuple):
+        """
+        Update the jobs and the worker statistics with a message from a worker process.
+        """
+        kind, index, job_id = message[:3]
+        worker = self._workers[index]
+        with self._lock:
+            job = self._jobs.get(job_id)
+            # the job finished on the worker
+            if worker.job_id == job_id:
+                worker.time_busy += time.perf_counter() - worker.time_job_begin
+                worker.job_id = None
+            if kind == self.MSG_DONE:
+                worker.count_done += 1
+            else:
+                worker.count_failed += 1
+        if job is not None:
+            if kind == self.MSG_DONE:
+                self._invoke_finish_job(job, result=message[3])
+            else:
+                self._invoke_retry_job(job, message[3])
+        with self._lock:
+            self._invoke_dispatch()
+
+    def _invoke_finish_job(self, job: 'ContextPool.Job', *,
+                           result=None,
+                           exception: Union[BaseException, None] = None):
+        """
+        Resolve the Future of a job.
+        """
+        with self._lock:
+            self._jobs.pop(job.job_id, None)
+        if exception is None:
+            job.future.set_result(result)
+        else:
+            job.future.set_exception(exception)
+
+    def _invoke_retry_job(self, job: 'ContextPool.Job', exception: BaseException):
+        """
+        Queue a failed job again, or fail its Future after max_retries.
+        """
+        job.attempt += 1
+        with self._lock:
+            retry = job.attempt <= self.max_retries and not self._flag_shutdown
+            if retry:
+                self._count_retries += 1
+                self._queued.append(job.job_id)
+        if not retry:
+            self._invoke_finish_job(job, exception=exception)
+
+    def _invoke_check_workers(self):
+        """
+        Restart dead worker processes, counting the job they hold as failed.
+        """
+        for worker in self._workers:
+            if worker.process is None or worker.process.is_alive():
+                continue
+            with self._lock:
+                job_id = worker.job_id
+                job = self._jobs.get(job_id) if job_id is not None else None
+                if job_id is not None:
+                    worker.time_busy += time.perf_counter() - worker.time_job_begin
+                    worker.job_id = None
+                    worker.count_failed += 1
+                worker.count_restarts += 1
+            exit_code = worker.process.exitcode
+            if job is not None:
+                self._invoke_retry_job(job, RuntimeError(
+                    f'Worker of {worker.endpoint} exited with code {exit_code} while holding the job.'))
+            self._invoke_start_worker(worker)
+            with self._lock:
+                self._invoke_dispatch()
+
+    def _collector_thread_func(self):
+        # workers are checked on a fixed interval, whether results keep coming or not
+        time_check = time.perf_counter() + self.D_COLLECTOR_INTERVAL
+        while True:
+            try:
+                message = self._result_queue.get(timeout=max(time_check - time.perf_counter(), 0.0))
+            except queue.Empty:
+                if self._flag_shutdown and not any(w.process.is_alive() for w in self._workers):
+                    break
+            else:
+                self._invoke_handle_message(message)
+            if time.perf_counter() >= time_check:
+                time_check = time.perf_counter() + self.D_COLLECTOR_INTERVAL
+                if not self._flag_shutdown:
+                    self._invoke_check_workers()
+
+    @staticmethod
+    def _parse_endpoint(endpoint: Union[str, Tuple[str, int]]) -> Tuple[str, int]:
+        """
+        Get the host and the port of an endpoint.
+        """
+        if isinstance(endpoint, str):
+            host, _, port = endpoint.rpartition(':')
+            if not host:
+                raise ValueError(f'Endpoint {endpoint} is not "host:port".')
+            return host, int(port)
+        host, port = endpoint
+        return host, int(port)
+
+
+def _worker_process_func(index: int, host: str, port: int, timeout: float,
+                         inbox: Queue, result_queue: Queue,
+                         initializer: Union[Callable, None], initargs: tuple):
+    """
+    Run jobs from the inbox with a CarlaContext until a None job is received.
+    """
+    if initializer is not None:
+        initializer(*initargs)
+    from .CarlaContext import CarlaContext
+    context = CarlaContext(host, port, timeout)
+    while True:
+        item = inbox.get()
+        if item is None:
+            break
+        job_id, function, args, kwargs = item
+        try:
+            if not context.is_alive():
+                try:
+                    context.invoke_connection_start()
+                except ConnectionError:
+                    # leave the next jobs to the other servers for a while
+                    time.sleep(ContextPool.D_RECONNECT_DELAY)
+                    raise
+            result = function(context, *args, **kwargs)
+            message = (ContextPool.MSG_DONE, index, job_id, result)
+            pickle.dumps(message)  # the queue feeder thread would drop an unpicklable message silently
+        except Exception as e:
+            error = e
+            try:
+                pickle.dumps(error)
+            except Exception:
+                error = RuntimeError(f'{type(e).__name__}: {e}')
+            error.__cause__ = None
+            error.__context__ = None
+            message = (ContextPool.MSG_FAILED, index, job_id, error)
+        # clean up before the next job is taken, the result is already sent
+        result_queue.put(message)
+        try:
+            context.invoke_reset()
+        except RuntimeError:
+            # the server did not answer, its actors are gone with the connection or with the next episode
+            pass
+    context.invoke_connection_stop()
@@ -1,6 +1,8 @@
 from .CarlaContext import CarlaContext
+from .ContextPool import ContextPool
 
 
 __all__ = [
     'CarlaContext',
+    'ContextPool',
 ]
\ No newline at end of file
@@ -2,12 +2,16 @@ import uuid
 import carla
 from typing import List, Union
 
-from ..core import Transform, Vector3, Blueprint
+from ..core import Transform, Vector3, Blueprint, WorldSnapshotCache
 
 
 class Actor:
     """
     Actor is a wrapper class for carla.Actor.
+
+    Once bound to a WorldSnapshotCache by the actor manager, transform, velocity, angular_velocity and acceleration
+    are served from the snapshot of the latest tick instead of one RPC each.
+    Use use_snapshot_cache(option=False) for fresh values from the server.
     """
 
     def __init__(self, blueprint_name: str, **kwargs):
@@ -25,8 +29,11 @@ class Actor:
         self._children = []
         # carla actor instance
         self._carla_actor = None
+        # world snapshot cache
+        self._snapshot_cache = None  # type: Union[WorldSnapshotCache, None]
         # options
         self._option_carla_physics = True
+        self._option_snapshot_cache = True
 
     def __del__(self):
         self.invoke_destroy(no_hook=True)
@@ -83,6 +90,9 @@ class Actor:
         """
         if not self.is_alive():
             return self.transform_init
+        actor_snapshot = self._get_actor_snapshot()
+        if actor_snapshot is not None:
+            return Transform.from_carla_transform(actor_snapshot.get_transform())
         else:
             return Transform.from_carla_transform(self.carla_actor.get_transform())
 
@@ -99,10 +109,13 @@ class Actor:
         [Read-only] Velocity of the actor.
         :return: current velocity of the actor. Vector3(0, 0, 0) if the actor is not alive.
         """
-        if self.is_alive():
-            return Vector3.from_carla_vector3d(self.carla_actor.get_velocity())
-        else:
+        if not self.is_alive():
             return Vector3()
+        actor_snapshot = self._get_actor_snapshot()
+        if actor_snapshot is not None:
+            return Vector3.from_carla_vector3d(actor_snapshot.get_velocity())
+        else:
+            return Vector3.from_carla_vector3d(self.carla_actor.get_velocity())
 
     @property
     def angular_velocity(self) -> Vector3:
@@ -110,10 +123,13 @@ class Actor:
         [Read-only] Angular velocity of the actor.
         :return: current angular velocity of the actor. Vector3(0, 0, 0) if the actor is not alive.
         """
-        if self.is_alive():
-            return Vector3.from_carla_vector3d(self.carla_actor.get_angular_velocity())
-        else:
+        if not self.is_alive():
             return Vector3()
+        actor_snapshot = self._get_actor_snapshot()
+        if actor_snapshot is not None:
+            return Vector3.from_carla_vector3d(actor_snapshot.get_angular_velocity())
+        else:
+            return Vector3.from_carla_vector3d(self.carla_actor.get_angular_velocity())
 
     @property
     def acceleration(self) -> Vector3:
@@ -121,10 +137,27 @@ class Actor:
         [Read-only] Acceleration of the actor.
         :return: current acceleration of the actor. Vector3(0, 0, 0) if the actor is not alive.
         """
-        if self.is_alive():
-            return Vector3.from_carla_vector3d(self.carla_actor.get_acceleration())
-        else:
+        if not self.is_alive():
             return Vector3()
+        actor_snapshot = self._get_actor_snapshot()
+        if actor_snapshot is not None:
+            return Vector3.from_carla_vector3d(actor_snapshot.get_acceleration())
+        else:
+            return Vector3.from_carla_vector3d(self.carla_actor.get_acceleration())
+
+    @property
+    def option_snapshot_cache(self) -> bool:
+        """
+        [Read-Write] Whether kinematics are served from the world snapshot cache of the latest tick.
+        """
+        return self._option_snapshot_cache
+
+    @property
+    def snapshot_cache(self) -> Union[WorldSnapshotCache, None]:
+        """
+        [Immutable] The world snapshot cache the actor is bound to, None if not bound.
+        """
+        return self._snapshot_cache
 
     @property
     def attributes(self) -> dict:
@@ -159,6 +192,7 @@ class Actor:
         :param raise_exception: Optional, if True, raise exception when the actor is not alive.
         :return: True if the actor is alive, otherwise False.
         """
+        # the local flag of the carla actor, the snapshot of the latest tick may still list a destroyed actor
         if self.carla_actor and self.carla_actor.is_alive:
             return True
         elif raise_exception:
@@ -264,6 +298,28 @@ class Actor:
             self.carla_actor.set_simulate_physics(option)
         return self
 
+    def use_snapshot_cache(self, *, option=True) -> 'Actor':
+        """
+        Enable or disable serving kinematics from the world snapshot cache.
+
+        :param option: True to read the snapshot of the latest tick, False to send an RPC on every access.
+        :return: return self for method chaining.
+        """
+        self._option_snapshot_cache = option
+        return self
+
+    def invoke_bind_snapshot_cache(self, snapshot_cache: Union[WorldSnapshotCache, None]) -> 'Actor':
+        """
+        Bind a WorldSnapshotCache instance to the actor.
+
+        This method is used internally by the actor manager.
+
+        :param snapshot_cache: a WorldSnapshotCache instance, None to unbind
+        :return: return self for method chaining.
+        """
+        self._snapshot_cache = snapshot_cache
+        return self
+
     def invoke_bind_carla_actor(self, carla_actor: carla.Actor, *, no_hook=False) -> 'Actor':
         """
         Bind a carla.Actor instance to the actor.
@@ -286,6 +342,18 @@ class Actor:
             self.on_actor_bind()
         return self
 
+    def invoke_unbind_carla_actor(self) -> 'Actor':
+        """
+        Unbind the carla.Actor instance without destroying it.
+
+        This method is used internally by the actor manager during batch destroy,
+        the carla actor is destroyed by a batch command instead.
+
+        :return: return self for method chaining.
+        """
+        self._carla_actor = None
+        return self
+
     def invoke_destroy(self, *, no_hook=False) -> 'Actor':
         """
         Destroy the actor.
@@ -302,6 +370,17 @@ class Actor:
         self._carla_actor = None
         return self
 
+    def _get_actor_snapshot(self) -> Union[carla.ActorSnapshot, None]:
+        """
+        Get the snapshot of the bound carla actor in the latest tick.
+
+        :return: carla.ActorSnapshot instance, None if the cache is disabled, not bound or misses the actor.
+        """
+        carla_actor = self.carla_actor
+        if carla_actor is None or self._snapshot_cache is None or not self.option_snapshot_cache:
+            return None
+        return self._snapshot_cache.find(carla_actor.id)
+
     def on_actor_bind(self):
         """
         A hook method that will be called after the actor is bound to a carla.Actor instance.
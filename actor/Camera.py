@@ -1,5 +1,3 @@
-import carla
-
 from .Sensor import Sensor
 from ..core.data import ImageData
 
@@ -9,10 +7,14 @@ class Camera(Sensor):
     A camera sensor.
     """
 
+    D_IMAGE_SIZE_X = 800  # carla default
+    D_IMAGE_SIZE_Y = 600  # carla default
+
     def __init__(self, blueprint_name: str, **kwargs):
         super().__init__(blueprint_name, **kwargs)
         if 'sensor.camera' not in blueprint_name:
             raise TypeError(f'Blueprint {blueprint_name} is not a camera blueprint')
+        self._sensor_data_class = ImageData
 
     @property
     def data(self) -> ImageData:
@@ -20,19 +22,12 @@ class Camera(Sensor):
         A sensor data snapshot.
         :return:
         """
-        return self._data
+        return super().data
 
-    def listener(self, measurement: carla.Image):
+    def estimate_frame_size(self) -> int:
         """
-        The main listener function for the sensor.
-
-        This method will update data and raise event_data_update.
-
-        :param measurement: Sensor data, given by the carla.Sensor.listen() function callback.
-        :return:
+        BGRA image size in bytes.
         """
-        # dump sensor data
-        self._data = ImageData.from_carla_measurements(measurement)
-        # flash the event
-        self._event_data_update.set()
-        self._event_data_update.clear()
\ No newline at end of file
+        width = self._get_attribute_number('image_size_x', self.D_IMAGE_SIZE_X)
+        height = self._get_attribute_number('image_size_y', self.D_IMAGE_SIZE_Y)
+        return int(width) * int(height) * 4
@@ -1,5 +1,3 @@
-import carla
-
 from .Sensor import Sensor
 from ..core.data import GnssData
 
@@ -10,25 +8,11 @@ class Gnss(Sensor):
         super().__init__(blueprint_name, **kwargs)
         if 'sensor.other.gnss' not in blueprint_name:
             raise TypeError(f'Blueprint {blueprint_name} is not a gnss blueprint')
+        self._sensor_data_class = GnssData
 
     @property
     def data(self) -> GnssData:
         """
         A sensor data snapshot.
         """
-        return self._data
-
-    def listener(self, measurement: carla.GnssMeasurement):
-        """
-        The main listener function for the sensor.
-
-        This method will update data and raise event_data_update.
-
-        :param measurement: Sensor data, given by the carla.Sensor.listen() function callback.
-        :return:
-        """
-        # dump sensor data
-        self._data = GnssData.from_carla_measurements(measurement)
-        # flash the event
-        self._event_data_update.set()
-        self._event_data_update.clear()
\ No newline at end of file
+        return super().data
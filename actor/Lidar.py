@@ -1,5 +1,3 @@
-import carla
-
 from .Sensor import Sensor
 from ..core.data import LidarData
 
@@ -9,10 +7,14 @@ class Lidar(Sensor):
     A lidar sensor.
     """
 
+    D_POINTS_PER_SECOND = 56000  # carla default
+    D_ROTATION_FREQUENCY = 10.0  # carla default
+
     def __init__(self, blueprint_name: str, **kwargs):
         super().__init__(blueprint_name, **kwargs)
         if 'sensor.lidar.' not in blueprint_name:
             raise TypeError(f'Blueprint {blueprint_name} is not a lidar blueprint')
+        self._sensor_data_class = LidarData
 
     @property
     def data(self) -> LidarData:
@@ -20,19 +22,12 @@ class Lidar(Sensor):
         A sensor data snapshot.
         :return:
         """
-        return self._data
+        return super().data
 
-    def listener(self, measurement: carla.LidarMeasurement):
+    def estimate_frame_size(self) -> int:
         """
-        The main listener function for the sensor.
-
-        This method will update data and raise event_data_update.
-
-        :param measurement: Sensor data, given by the carla.Sensor.listen() function callback.
-        :return:
+        Point buffer size of one rotation in bytes.
         """
-        # dump sensor data
-        self._data = LidarData.from_carla_measurements(measurement)
-        # flash the event
-        self._event_data_update.set()
-        self._event_data_update.clear()
\ No newline at end of file
+        points_per_second = self._get_attribute_number('points_per_second', self.D_POINTS_PER_SECOND)
+        rotation_frequency = self._get_attribute_number('rotation_frequency', self.D_ROTATION_FREQUENCY)
+        return int(points_per_second / max(rotation_frequency, 1.0)) * LidarData.POINT_DTYPE.itemsize
@@ -1,18 +1,19 @@
-import carla
-
 from .Sensor import Sensor
 from ..core.data import RadarData
 
 
 class Radar(Sensor):
     """
-    A camera sensor.
+    A radar sensor.
     """
 
+    D_POINTS_PER_SECOND = 1500  # carla default
+
     def __init__(self, blueprint_name: str, **kwargs):
         super().__init__(blueprint_name, **kwargs)
         if 'sensor.other.radar' not in blueprint_name:
             raise TypeError(f'Blueprint {blueprint_name} is not a radar blueprint')
+        self._sensor_data_class = RadarData
 
     @property
     def data(self) -> RadarData:
@@ -20,19 +21,11 @@ class Radar(Sensor):
         A sensor data snapshot.
         :return:
         """
-        return self._data
+        return super().data
 
-    def listener(self, measurement: carla.Image):
+    def estimate_frame_size(self) -> int:
         """
-        The main listener function for the sensor.
-
-        This method will update data and raise event_data_update.
-
-        :param measurement: Sensor data, given by the carla.Sensor.listen() function callback.
-        :return:
+        Detection buffer size in bytes, bounded by one second of detections.
         """
-        # dump sensor data
-        self._data = RadarData.from_carla_measurements(measurement)
-        # flash the event
-        self._event_data_update.set()
-        self._event_data_update.clear()
\ No newline at end of file
+        points_per_second = self._get_attribute_number('points_per_second', self.D_POINTS_PER_SECOND)
+        return int(points_per_second) * RadarData.DETECTION_DTYPE.itemsize
@@ -1,15 +1,34 @@
 import carla
-from threading import Event
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from threading import Event, Lock, Condition
+from typing import Union, List, Callable, Deque, Tuple
 
 from .Actor import Actor
-from ..core.data import SensorData
+from ..core.data import SensorData, BufferPool, FrameHistory, MeasurementSnapshot
+
+
+def _decode_snapshot(sensor_data_class: type, snapshot: MeasurementSnapshot) -> SensorData:
+    """
+    Decode a measurement snapshot in a worker process.
+    """
+    return sensor_data_class.from_carla_measurements(snapshot)
 
 
 class Sensor(Actor):
     """
     Sensor is a wrapper class for carla.Sensor.
+
+    By default, every measurement is converted to SensorData in the carla callback thread.
+    In lazy decode mode, the listener only keeps the latest measurement and conversion happens on the first read of
+    data, once per frame. Frames replaced before anyone reads them are never converted.
+    In history mode, the latest frames are decoded straight into a FrameHistory ring preallocated from the blueprint
+    attributes. The ring never overwrites a frame that is still held, data stays valid as long as it is referenced.
+    With a decode executor, measurements are converted in a worker pool and published in frame order.
     """
 
+    D_DECODE_MAX_PENDING = 4  # measurements waiting in the decode executor
+
     def __init__(self, blueprint_name: str, **kwargs):
         """
         Construct a Sensor instance.
@@ -18,9 +37,32 @@ class Sensor(Actor):
         super().__init__(blueprint_name, **kwargs)
         self._data = None
         self._event_data_update = Event()
+        self._condition_data_update = Condition()
+        self._data_seq = 0  # increased on every measurement
+        self._buffer_pool = BufferPool()
         self._sensor_data_class = SensorData
         if not issubclass(self._sensor_data_class, SensorData):
             raise ValueError("sensor_data_class must be a subclass of SensorData.")
+        # lazy decode
+        self._option_lazy_decode = False
+        self._pending_measurement = None  # type: Union[carla.SensorData, None]
+        self._lock_pending = Lock()  # guards the pending measurement, held shortly by the listener
+        self._lock_decode = Lock()  # serializes readers decoding the pending measurement
+        # history
+        self._history = None  # type: Union[FrameHistory, None]
+        # callbacks
+        self._update_callbacks = []  # type: List[Callable[[Sensor], None]]
+        # decode executor
+        self._decode_executor = None  # type: Union[Executor, None]
+        self._decode_max_pending = self.D_DECODE_MAX_PENDING
+        self._decode_queue = deque()  # type: Deque[Tuple[int, Future]]  # (frame, future) in arrival order
+        self._lock_decode_queue = Lock()  # guards the decode queue, held shortly by the listener
+        self._lock_decode_publish = Lock()  # keeps the frame order of publishing, never waited for
+        self._flag_decode_publish = False  # set when the head of the decode queue may be ready
+        # counters
+        self._count_frames_decoded = 0
+        self._count_frames_skipped = 0
+        self._count_frames_dropped = 0
 
     @property
     def carla_actor(self) -> carla.Sensor:
@@ -33,11 +75,39 @@ class Sensor(Actor):
     @property
     def data(self) -> SensorData:
         """
-        A sensor data snapshot.
+        A sensor data snapshot, it owns its buffer and is never overwritten by later frames.
+
+        In lazy decode mode, the latest measurement is converted here on first access.
         :return:
         """
+        if self._pending_measurement is not None:
+            self._invoke_decode_pending()
         return self._data
 
+    @property
+    def data_frame(self) -> int:
+        """
+        [Read-Only] The frame id of the latest measurement, without decoding it. 0 if nothing received.
+        """
+        pending = self._pending_measurement
+        if pending is not None:
+            return pending.frame
+        return self._data.frame if self._data is not None else 0
+
+    @property
+    def data_seq(self) -> int:
+        """
+        [Read-Only] A sequence number increased on every measurement, see wait_for_data_update().
+        """
+        return self._data_seq
+
+    @property
+    def buffer_pool(self) -> BufferPool:
+        """
+        [Immutable] The pool that raw data buffers of this sensor are taken from.
+        """
+        return self._buffer_pool
+
     @property
     def event_data_update(self) -> Event:
         """
@@ -46,6 +116,147 @@ class Sensor(Actor):
         """
         return self._event_data_update
 
+    @property
+    def option_lazy_decode(self) -> bool:
+        """
+        [Read-Write] Whether measurements are converted on the first read of data instead of in the listener.
+        """
+        return self._option_lazy_decode
+
+    @property
+    def decode_executor(self) -> Union[Executor, None]:
+        """
+        [Immutable] The executor measurements are decoded in, None to decode in the carla callback thread.
+        """
+        return self._decode_executor
+
+    @property
+    def history(self) -> Union[FrameHistory, None]:
+        """
+        [Immutable] The frame history ring, None if history mode is disabled.
+        """
+        return self._history
+
+    @property
+    def count_frames_decoded(self) -> int:
+        """
+        [Read-Only] Number of measurements converted to SensorData.
+        """
+        return self._count_frames_decoded
+
+    @property
+    def count_frames_skipped(self) -> int:
+        """
+        [Read-Only] Number of measurements replaced in lazy decode mode before anyone read them.
+        """
+        return self._count_frames_skipped
+
+    @property
+    def count_frames_dropped(self) -> int:
+        """
+        [Read-Only] Number of measurements dropped because the decode executor fell behind.
+        """
+        return self._count_frames_dropped
+
+    def wait_for_data_update(self, seq: int, timeout: Union[float, None] = None) -> int:
+        """
+        Wait until data_seq is greater than seq.
+
+        Unlike event_data_update, no update is missed by a waiter that is not blocked at the moment of the update.
+
+        :param seq: the last data_seq seen by the caller
+        :param timeout: seconds to wait, None to wait forever
+        :return: the current data_seq, equal to seq on timeout
+        """
+        with self._condition_data_update:
+            self._condition_data_update.wait_for(lambda: self._data_seq > seq, timeout=timeout)
+            return self._data_seq
+
+    def use_lazy_decode(self, option: bool = True) -> 'Sensor':
+        """
+        Enable or disable the lazy decode mode.
+
+        :param option: True to convert measurements on first read of data, False to convert them in the listener.
+        :return: return self for method chaining.
+        """
+        self._option_lazy_decode = option
+        # flush the pending measurement so that data stays available after disabling
+        if not option and self._pending_measurement is not None:
+            self._invoke_decode_pending()
+        return self
+
+    def use_history(self, option: bool = True, *, capacity: int = FrameHistory.D_CAPACITY) -> 'Sensor':
+        """
+        Enable or disable the history mode.
+
+        The history ring is preallocated with estimate_frame_size() bytes per frame, and every frame is decoded
+        straight into its slot. A frame still held when its slot comes round again keeps its storage,
+        see FrameHistory.
+        Every frame has to be converted to be kept, so lazy decode mode has no effect while history mode is enabled.
+
+        :param option: True to keep the latest frames in a ring, False to drop the ring.
+        :param capacity: number of frames kept in the ring.
+        :return: return self for method chaining.
+        """
+        if option:
+            self._history = FrameHistory(capacity, self.estimate_frame_size())
+        else:
+            self._history = None
+        return self
+
+    def use_decode_executor(self, executor: Union[Executor, None], *,
+                            max_pending: int = D_DECODE_MAX_PENDING) -> 'Sensor':
+        """
+        Decode measurements in an executor instead of the carla callback thread.
+
+        With a ThreadPoolExecutor, the carla measurement itself is handed to a worker thread.
+        With a ProcessPoolExecutor, a picklable MeasurementSnapshot is taken in the callback thread and decoded
+        in a worker process, which only pays off for heavy decoding.
+
+        Results are published in frame order. When more than max_pending measurements are waiting,
+        the oldest one is dropped.
+
+        :param executor: a concurrent.futures.Executor, None to decode in the carla callback thread again.
+        :param max_pending: maximum number of measurements waiting to be decoded.
+        :return: return self for method chaining.
+        """
+        if max_pending <= 0:
+            raise ValueError("max_pending must be greater than 0.")
+        self._decode_executor = executor
+        self._decode_max_pending = max_pending
+        return self
+
+    def add_update_callback(self, callback: Callable[['Sensor'], None]) -> 'Sensor':
+        """
+        Add a callback called with the sensor in the carla callback thread after every measurement.
+
+        Keep callbacks short, they delay the next measurement of every sensor.
+
+        :param callback: a callable taking the sensor as argument
+        :return: return self for method chaining.
+        """
+        self._update_callbacks.append(callback)
+        return self
+
+    def remove_update_callback(self, callback: Callable[['Sensor'], None]) -> 'Sensor':
+        """
+        Remove a callback added by add_update_callback. No effect if it is not added.
+        :param callback: the callable to remove
+        :return: return self for method chaining.
+        """
+        if callback in self._update_callbacks:
+            self._update_callbacks.remove(callback)
+        return self
+
+    def estimate_frame_size(self) -> int:
+        """
+        Estimate the raw data size of one frame in bytes from the blueprint attributes.
+
+        Subclasses with raw data should override this method.
+        :return: size in bytes, 0 for sensors without raw data
+        """
+        return 0
+
     def listener(self, measurement: carla.SensorData):
         """
         The main listener function for the sensor.
@@ -55,11 +266,35 @@ class Sensor(Actor):
         :param measurement: Sensor data, given by the carla.Sensor.listen() function callback.
         :return:
         """
-        # dump sensor data
-        self._data = self._sensor_data_class.from_carla_measurements(measurement)
-        # flash the event
-        self._event_data_update.set()
-        self._event_data_update.clear()
+        executor = self._decode_executor
+        if executor is not None:
+            # published by the future callback
+            self._invoke_submit_decode(executor, measurement)
+            return
+        history = self._history
+        if history is not None:
+            # every frame is converted to be kept, built directly on the next slot of the ring
+            data = self._sensor_data_class.from_carla_measurements(measurement, buffer_pool=history)
+            self._invoke_publish(data, on_history=True)
+        elif self.option_lazy_decode:
+            # keep the measurement only, the previous one is skipped if nobody read it
+            with self._lock_pending:
+                if self._pending_measurement is not None:
+                    self._count_frames_skipped += 1
+                self._pending_measurement = measurement
+            self._invoke_notify()
+        else:
+            # dump sensor data
+            self._invoke_publish(self.decode(measurement))
+
+    def decode(self, measurement: carla.SensorData) -> SensorData:
+        """
+        Convert a measurement to the sensor data class of the sensor.
+
+        :param measurement: Sensor data, given by the carla.Sensor.listen() function callback.
+        :return: SensorData instance
+        """
+        return self._sensor_data_class.from_carla_measurements(measurement, buffer_pool=self.buffer_pool)
 
     def on_actor_bind(self):
         """
@@ -73,3 +308,115 @@ class Sensor(Actor):
         Stop listening to the sensor when the actor is destroyed.
         """
         self.carla_actor.stop()
+
+    def _get_attribute_number(self, key: str, default: float) -> float:
+        """
+        Get a numeric blueprint attribute, default if it is not set.
+        """
+        value = self.blueprint.attributes.get(key)
+        return float(value) if value is not None else default
+
+    def _invoke_publish(self, data: SensorData, *, on_history: bool = False):
+        """
+        Publish decoded data, keep it in the history and notify the listeners.
+
+        :param on_history: whether data is built on a slot taken from the history
+        """
+        history = self._history
+        if history is not None:
+            # data decoded by the executor is copied into the ring
+            history.append(data if on_history else data.copy(buffer_pool=history))
+        with self._lock_pending:
+            self._pending_measurement = None
+            self._data = data
+            self._count_frames_decoded += 1
+        self._invoke_notify()
+
+    def _invoke_notify(self):
+        """
+        Call the update callbacks, increase data_seq and flash event_data_update.
+        """
+        # notify callbacks
+        for callback in tuple(self._update_callbacks):
+            callback(self)
+        # notify waiters
+        with self._condition_data_update:
+            self._data_seq += 1
+            self._condition_data_update.notify_all()
+        # flash the event
+        self._event_data_update.set()
+        self._event_data_update.clear()
+
+    def _invoke_submit_decode(self, executor: Executor, measurement: carla.SensorData):
+        """
+        Submit a measurement to the decode executor, dropping the oldest waiting one if the queue is full.
+        """
+        if isinstance(executor, ProcessPoolExecutor):
+            snapshot = MeasurementSnapshot.from_carla_measurements(
+                measurement, self._sensor_data_class.MEASUREMENT_ATTRIBUTES)
+            future = executor.submit(_decode_snapshot, self._sensor_data_class, snapshot)
+        else:
+            future = executor.submit(self.decode, measurement)
+        futures_dropped = []
+        with self._lock_decode_queue:
+            while len(self._decode_queue) >= self._decode_max_pending:
+                _, future_dropped = self._decode_queue.popleft()
+                futures_dropped.append(future_dropped)
+                self._count_frames_dropped += 1
+            self._decode_queue.append((measurement.frame, future))
+        # cancel outside the lock, callbacks of a cancelled future run immediately in this thread
+        for future_dropped in futures_dropped:
+            future_dropped.cancel()
+        future.add_done_callback(lambda _: self._invoke_publish_decoded())
+
+    def _invoke_publish_decoded(self):
+        """
+        Publish decoded measurements in frame order, from the head of the decode queue.
+
+        Only one thread publishes at a time, to keep the frame order between worker threads. The others leave
+        a flag for it instead of waiting, so the listener is never blocked by update callbacks.
+        """
+        self._flag_decode_publish = True
+        while self._flag_decode_publish:
+            if not self._lock_decode_publish.acquire(blocking=False):
+                # the publishing thread sees the flag once it releases the lock
+                return
+            try:
+                self._flag_decode_publish = False
+                while True:
+                    with self._lock_decode_queue:
+                        if not self._decode_queue or not self._decode_queue[0][1].done():
+                            break
+                        _, future = self._decode_queue.popleft()
+                    try:
+                        data = future.result()
+                    except Exception:
+                        # a failed decoding is counted as dropped, the next frames are still published
+                        with self._lock_decode_queue:
+                            self._count_frames_dropped += 1
+                        continue
+                    self._invoke_publish(data)
+            finally:
+                self._lock_decode_publish.release()
+
+    def _invoke_decode_pending(self):
+        """
+        Decode the pending measurement and publish it as data.
+
+        The decoding runs outside the pending lock, so the listener is never blocked by a reader.
+        """
+        with self._lock_decode:
+            measurement = self._pending_measurement
+            if measurement is None:
+                # decoded by another reader
+                return
+            data = self.decode(measurement)
+            with self._lock_pending:
+                # a newer measurement may have arrived during decoding, keep it pending
+                if self._pending_measurement is measurement:
+                    self._pending_measurement = None
+                else:
+                    # the listener counted this measurement as skipped when replacing it
+                    self._count_frames_skipped -= 1
+                self._data = data
+                self._count_frames_decoded += 1
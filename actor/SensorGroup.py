@@ -0,0 +1,324 @@
+import time
+import weakref
+from collections import deque, OrderedDict
+from functools import partial
+from threading import Condition, Thread, current_thread
+from typing import Dict, List, Optional, Union
+
+from .Sensor import Sensor
+from ..core.data import SensorData
+
+
+class SensorGroup:
+    """
+    A synchronizer that bundles measurements of several sensors by carla frame id.
+
+    Each sensor reports its data through Sensor.add_update_callback(). Once every sensor in the group has delivered
+    the same frame, one complete bundle is emitted. Frames that stay incomplete longer than the timeout, or that are
+    overtaken by a newer complete frame, are handled by the partial policy.
+
+    Sensors in lazy decode mode are decoded in the callback thread, since the group needs the data of every frame.
+
+    Incomplete frames expire in a background thread started by invoke_start(), so a frame is resolved even if a
+    sensor stops delivering. The sensors and the thread only hold weak references to the group, an unreferenced
+    group stops itself, but invoke_stop() should be called to stop collecting at a known point.
+    """
+
+    POLICY_DROP = 'drop'  # discard incomplete bundles
+    POLICY_EMIT = 'emit'  # emit incomplete bundles, missing sensors are left out
+
+    D_TIMEOUT = 1.0  # in seconds
+    D_QUEUE_SIZE = 16  # bundles kept for get()
+
+    class Bundle:
+        """
+        Measurements of the sensors in a group for one frame.
+        """
+
+        def __init__(self, frame: int):
+            self.frame = frame
+            self.data = {}  # type: Dict[str, SensorData]  # sensor id -> data
+            self.arrival = {}  # type: Dict[str, float]  # sensor id -> perf_counter timestamp
+            self.missing = []  # type: List[str]  # sensor ids without data
+            self.time_first_arrival = 0.0
+
+        def __getitem__(self, sensor: Union[Sensor, str]) -> Optional[SensorData]:
+            key = sensor.id if isinstance(sensor, Sensor) else sensor
+            return self.data.get(key)
+
+        @property
+        def complete(self) -> bool:
+            """
+            [Read-Only] Whether every sensor in the group delivered the frame.
+            """
+            return not self.missing
+
+        @property
+        def skew(self) -> Dict[str, float]:
+            """
+            [Read-Only] Arrival delay of each sensor relative to the first arrival of the frame, in seconds.
+            """
+            return {key: t - self.time_first_arrival for key, t in self.arrival.items()}
+
+    def __init__(self,
+                 sensors: List[Sensor],
+                 *,
+                 timeout: float = D_TIMEOUT,
+                 partial_policy: str = POLICY_DROP,
+                 queue_size: int = D_QUEUE_SIZE):
+        """
+        Construct a SensorGroup instance.
+
+        :param sensors: sensors to synchronize
+        :param timeout: seconds to wait for a frame after its first measurement
+        :param partial_policy: POLICY_DROP or POLICY_EMIT
+        :param queue_size: number of bundles kept for get(), the oldest is dropped when full
+        """
+        if partial_policy not in (self.POLICY_DROP, self.POLICY_EMIT):
+            raise ValueError(f'partial_policy must be {self.POLICY_DROP} or {self.POLICY_EMIT}, got {partial_policy}')
+        self._sensors = OrderedDict((s.id, s) for s in sensors)  # type: Dict[str, Sensor]
+        self._timeout = timeout
+        self._partial_policy = partial_policy
+        # bundles
+        self._pending = OrderedDict()  # type: Dict[int, SensorGroup.Bundle]  # frame -> bundle, oldest first
+        self._queue = deque(maxlen=queue_size)
+        self._latest_bundle = None  # type: Optional[SensorGroup.Bundle]
+        self._frame_resolved = -1  # the newest frame emitted or dropped
+        self._condition = Condition()
+        # statistics
+        self._skew_sum = {key: 0.0 for key in self._sensors}
+        self._skew_max = {key: 0.0 for key in self._sensors}
+        self._skew_count = {key: 0 for key in self._sensors}
+        self._missing_count = {key: 0 for key in self._sensors}  # incomplete frames the sensor did not deliver
+        self._count_complete = 0
+        self._count_partial = 0
+        self._count_dropped = 0
+        # sensor callback and expiry thread, both without a strong reference to the group
+        self._update_callback = partial(SensorGroup._sensor_update_func, weakref.ref(self))
+        self._expiry_thread = None  # type: Optional[Thread]
+        # flags
+        self._flag_started = False
+
+    def __del__(self):
+        self.invoke_stop()
+
+    @property
+    def sensors(self) -> List[Sensor]:
+        """
+        [Immutable] Sensors in the group.
+        """
+        return list(self._sensors.values())
+
+    @property
+    def timeout(self) -> float:
+        """
+        [Read-Only] Seconds to wait for a frame after its first measurement.
+        """
+        return self._timeout
+
+    @property
+    def partial_policy(self) -> str:
+        """
+        [Read-Only] What to do with incomplete bundles, POLICY_DROP or POLICY_EMIT.
+        """
+        return self._partial_policy
+
+    @property
+    def latest_bundle(self) -> Optional['SensorGroup.Bundle']:
+        """
+        [Read-Only] The latest emitted bundle.
+        """
+        return self._latest_bundle
+
+    @property
+    def count_complete(self) -> int:
+        """
+        [Read-Only] Number of complete bundles emitted.
+        """
+        return self._count_complete
+
+    @property
+    def count_partial(self) -> int:
+        """
+        [Read-Only] Number of incomplete bundles emitted with POLICY_EMIT.
+        """
+        return self._count_partial
+
+    @property
+    def count_dropped(self) -> int:
+        """
+        [Read-Only] Number of incomplete bundles discarded with POLICY_DROP.
+        """
+        return self._count_dropped
+
+    @property
+    def arrival_skew(self) -> Dict[str, dict]:
+        """
+        [Read-Only] Arrival delay statistics of each sensor relative to the first arrival of a frame.
+
+        missing counts the incomplete frames, emitted or dropped, that the sensor did not deliver.
+
+        :return: sensor id -> {'mean': seconds, 'max': seconds, 'count': frames, 'missing': frames}
+        """
+        with self._condition:
+            return {
+                key: {
+                    'mean': self._skew_sum[key] / self._skew_count[key] if self._skew_count[key] else 0.0,
+                    'max': self._skew_max[key],
+                    'count': self._skew_count[key],
+                    'missing': self._missing_count[key],
+                }
+                for key in self._sensors
+            }
+
+    @property
+    def bottleneck(self) -> Optional[Sensor]:
+        """
+        [Read-Only] The sensor that holds the group back, None if no frame is resolved yet.
+
+        The sensor missing from the most incomplete frames, then the one with the largest mean arrival delay.
+        """
+        with self._condition:
+            measured = [key for key in self._sensors if self._skew_count[key] or self._missing_count[key]]
+            if not measured:
+                return None
+            key = max(measured, key=lambda k: (self._missing_count[k],
+                                               self._skew_sum[k] / self._skew_count[k] if self._skew_count[k] else 0.0))
+            return self._sensors[key]
+
+    def invoke_start(self) -> 'SensorGroup':
+        """
+        Start collecting measurements of the sensors.
+        :return: return self for method chaining.
+        """
+        if not self._flag_started:
+            self._flag_started = True
+            self._expiry_thread = Thread(target=SensorGroup._expiry_thread_func,
+                                         args=(weakref.ref(self), self._condition),
+                                         daemon=True)
+            self._expiry_thread.start()
+            for sensor in self._sensors.values():
+                sensor.add_update_callback(self._update_callback)
+        return self
+
+    def invoke_stop(self) -> 'SensorGroup':
+        """
+        Stop collecting measurements. Pending frames are discarded.
+        :return: return self for method chaining.
+        """
+        if self._flag_started:
+            for sensor in self._sensors.values():
+                sensor.remove_update_callback(self._update_callback)
+        with self._condition:
+            self._flag_started = False
+            self._pending.clear()
+            self._condition.notify_all()
+        thread, self._expiry_thread = self._expiry_thread, None
+        if thread is not None and thread is not current_thread():
+            thread.join()
+        return self
+
+    def get(self, timeout: Optional[float] = None) -> Optional['SensorGroup.Bundle']:
+        """
+        Take the oldest emitted bundle, waiting for one if needed.
+
+        :param timeout: seconds to wait, None to wait forever
+        :return: Bundle instance, None on timeout
+        """
+        time_end = None if timeout is None else time.perf_counter() + timeout
+        with self._condition:
+            while not self._queue:
+                wait_time = None
+                if time_end is not None:
+                    wait_time = time_end - time.perf_counter()
+                    if wait_time <= 0:
+                        return None
+                self._condition.wait(wait_time)
+            return self._queue.popleft()
+
+    @staticmethod
+    def _sensor_update_func(group_ref: 'weakref.ref[SensorGroup]', sensor: Sensor):
+        group = group_ref()
+        if group is not None:
+            group._on_sensor_update(sensor)
+
+    @staticmethod
+    def _expiry_thread_func(group_ref: 'weakref.ref[SensorGroup]', condition: Condition):
+        with condition:
+            while True:
+                group = group_ref()
+                if group is None or not group._flag_started:
+                    return
+                wait_time = group._invoke_expire(time.perf_counter())
+                # do not keep the group alive while waiting, new pending frames notify the condition
+                del group
+                condition.wait(wait_time)
+
+    def _on_sensor_update(self, sensor: Sensor):
+        """
+        Sensor update callback, runs in the carla callback thread.
+        """
+        now = time.perf_counter()
+        with self._condition:
+            data = sensor.data
+            if data is None:
+                return
+            bundle = self._pending.get(data.frame)
+            if bundle is None:
+                if data.frame <= self._frame_resolved:
+                    # late measurement of a frame already emitted or dropped
+                    return
+                bundle = SensorGroup.Bundle(data.frame)
+                bundle.time_first_arrival = now
+                self._pending[data.frame] = bundle
+                # wake up the expiry thread for the new deadline
+                self._condition.notify_all()
+            bundle.data[sensor.id] = data
+            bundle.arrival[sensor.id] = now
+            if len(bundle.data) == len(self._sensors):
+                # older incomplete frames are overtaken by a complete one
+                for frame in [f for f in self._pending if f < bundle.frame]:
+                    self._invoke_resolve_partial(self._pending.pop(frame))
+                del self._pending[bundle.frame]
+                self._count_complete += 1
+                self._invoke_emit(bundle)
+            self._invoke_expire(now)
+
+    def _invoke_expire(self, now: float) -> Optional[float]:
+        """
+        Resolve pending frames older than the timeout. The condition must be held by the caller.
+
+        :return: seconds until the next pending frame expires, None if no frame is pending
+        """
+        for frame in [f for f, b in self._pending.items() if now - b.time_first_arrival >= self.timeout]:
+            self._invoke_resolve_partial(self._pending.pop(frame))
+        if not self._pending:
+            return None
+        return min(b.time_first_arrival for b in self._pending.values()) + self.timeout - now
+
+    def _invoke_resolve_partial(self, bundle: 'SensorGroup.Bundle'):
+        """
+        Apply the partial policy to an incomplete bundle. The condition must be held by the caller.
+        """
+        bundle.missing = [key for key in self._sensors if key not in bundle.data]
+        for key in bundle.missing:
+            self._missing_count[key] += 1
+        self._frame_resolved = max(self._frame_resolved, bundle.frame)
+        if self.partial_policy == self.POLICY_EMIT:
+            self._count_partial += 1
+            self._invoke_emit(bundle)
+        else:
+            self._count_dropped += 1
+
+    def _invoke_emit(self, bundle: 'SensorGroup.Bundle'):
+        """
+        Publish a bundle and update the skew statistics. The condition must be held by the caller.
+        """
+        for key, skew in bundle.skew.items():
+            self._skew_sum[key] += skew
+            self._skew_max[key] = max(self._skew_max[key], skew)
+            self._skew_count[key] += 1
+        self._latest_bundle = bundle
+        self._frame_resolved = max(self._frame_resolved, bundle.frame)
+        self._queue.append(bundle)
+        self._condition.notify_all()
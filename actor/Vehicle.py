@@ -1,7 +1,9 @@
 import carla
+import copy
 from typing import Union
 
 from .Actor import Actor
+from ..core import ControlBatcher
 from ..core.data import VehicleStatusData
 from ..core.setting import VehicleAckermannControlSettings
 from ..core.cmd import VehicleAckermannControlCmd, VehicleDirectControlCmd
@@ -10,10 +12,19 @@ from ..core.cmd import VehicleAckermannControlCmd, VehicleDirectControlCmd
 class Vehicle(Actor):
     """
     Vehicle is a wrapper for carla.Vehicle.
+
+    Vehicle status is memoized per simulation frame of the world snapshot cache.
+    Once bound to a ControlBatcher by the actor manager, use_control_batch() sends controls in one batch per tick.
+    Controls are sent immediately by default.
     """
 
     def __init__(self, blueprint_name: str, **kwargs):
         super().__init__(blueprint_name, **kwargs)
+        self._status = None  # type: Union[VehicleStatusData, None]
+        self._status_frame = 0  # frame id of the memoized status
+        # control batch
+        self._control_batcher = None  # type: Union[ControlBatcher, None]
+        self._option_control_batch = False
 
     @property
     def carla_actor(self) -> carla.Vehicle:
@@ -23,13 +34,83 @@ class Vehicle(Actor):
         """
         return super().carla_actor
 
+    @property
+    def option_control_batch(self) -> bool:
+        """
+        [Read-Write] Whether controls are submitted to the control batcher instead of sent immediately.
+        """
+        return self._option_control_batch
+
+    @property
+    def control_batcher(self) -> Union[ControlBatcher, None]:
+        """
+        [Immutable] The control batcher the vehicle is bound to, None if not bound.
+        """
+        return self._control_batcher
+
     @property
     def status(self) -> VehicleStatusData:
+        """
+        Dump the vehicle status data, including the wheel steer angles.
+        :return: VehicleStatusData instance.
+        """
+        return self.get_status(wheel_steer_angles=True)
+
+    def get_status(self, *, wheel_steer_angles: bool = False) -> VehicleStatusData:
         """
         Dump the vehicle status data.
+
+        The status is read once per simulation frame when the vehicle is bound to a world snapshot cache,
+        velocity and acceleration come from the snapshot. Later calls in the same frame return the same instance,
+        or a new one if they ask for wheel steer angles not read yet. A returned instance is never modified.
+        Snapshot cache disabled by use_snapshot_cache(option=False) reads a fresh status on every call.
+
+        :param wheel_steer_angles: Optional, whether to read the wheel steer angles, four more RPCs.
         :return: VehicleStatusData instance.
         """
-        return VehicleStatusData.from_carla_vehicle(self.carla_actor)
+        actor_snapshot = self._get_actor_snapshot()
+        if actor_snapshot is None:
+            return VehicleStatusData.from_carla_vehicle(self.carla_actor, wheel_steer_angles=wheel_steer_angles)
+        frame = self.snapshot_cache.frame
+        status = self._status
+        if status is None or self._status_frame != frame:
+            status = VehicleStatusData.from_carla_vehicle(self.carla_actor,
+                                                          actor_snapshot=actor_snapshot,
+                                                          wheel_steer_angles=wheel_steer_angles)
+            self._status = status
+            self._status_frame = frame
+        elif wheel_steer_angles and not status.has_wheel_steer_angles:
+            # a new instance, the status returned earlier in this frame is never modified
+            status = copy.copy(status).load_wheel_steer_angles(self.carla_actor)
+            self._status = status
+        return status
+
+    def use_control_batch(self, *, option=True) -> 'Vehicle':
+        """
+        Enable or disable sending controls through the control batcher.
+
+        With the batcher, invoke_direct_control() and invoke_ackermann_control() only submit the control,
+        it reaches the server with the next tick of the running manager.
+
+        :param option: True to send controls in one batch per tick, False to send an RPC on every control.
+        :return: return self for method chaining.
+        """
+        self._option_control_batch = option
+        # controls applied outside the batcher make its last sent control stale
+        self._invoke_forget_batched_control()
+        return self
+
+    def invoke_bind_control_batcher(self, control_batcher: Union[ControlBatcher, None]) -> 'Vehicle':
+        """
+        Bind a ControlBatcher instance to the vehicle.
+
+        This method is used internally by the actor manager.
+
+        :param control_batcher: a ControlBatcher instance, None to unbind
+        :return: return self for method chaining.
+        """
+        self._control_batcher = control_batcher
+        return self
 
     @property
     def ackermann_control_settings(self) -> VehicleAckermannControlSettings:
@@ -58,7 +139,11 @@ class Vehicle(Actor):
         :raises RuntimeError: if the vehicle is not alive.
         """
         self.is_alive(raise_exception=True)
-        self.carla_actor.apply_ackermann_control(cmd.as_carla_vehicle_ackermann_control())
+        if self._is_control_batch_available():
+            self.control_batcher.submit_ackermann_control(self.carla_actor.id, cmd.as_carla_vehicle_ackermann_control())
+        else:
+            self._invoke_forget_batched_control()
+            self.carla_actor.apply_ackermann_control(cmd.as_carla_vehicle_ackermann_control())
         return self
 
     def invoke_direct_control(self, cmd: VehicleDirectControlCmd) -> 'Vehicle':
@@ -69,7 +154,11 @@ class Vehicle(Actor):
         :raises RuntimeError: if the vehicle is not alive.
         """
         self.is_alive(raise_exception=True)
-        self.carla_actor.apply_control(cmd.as_carla_vehicle_control())
+        if self._is_control_batch_available():
+            self.control_batcher.submit_direct_control(self.carla_actor.id, cmd.as_carla_vehicle_control())
+        else:
+            self._invoke_forget_batched_control()
+            self.carla_actor.apply_control(cmd.as_carla_vehicle_control())
         return self
 
     def override_ackermann_control_settings(self, *,
@@ -136,7 +225,7 @@ class Vehicle(Actor):
         """
         self.is_alive(raise_exception=True)
         # get current status
-        status = self.status
+        status = self.get_status()
         # generate new control command
         cmd = VehicleDirectControlCmd()
         cmd.throttle = throttle if throttle is not None else status.throttle
@@ -170,10 +259,11 @@ class Vehicle(Actor):
         """
         self.is_alive(raise_exception=True)
         # get current status
-        target_fl = self.status.wheel_steer_angle_FL
-        target_fr = self.status.wheel_steer_angle_FR
-        target_RL = self.status.wheel_steer_angle_RL
-        target_RR = self.status.wheel_steer_angle_RR
+        status = self.get_status(wheel_steer_angles=True)
+        target_fl = status.wheel_steer_angle_FL
+        target_fr = status.wheel_steer_angle_FR
+        target_RL = status.wheel_steer_angle_RL
+        target_RR = status.wheel_steer_angle_RR
         # override items
         target_fl = steer_fl if steer_fl is not None else target_fl
         target_fr = steer_fr if steer_fr is not None else target_fr
@@ -186,3 +276,28 @@ class Vehicle(Actor):
         self.carla_actor.set_wheel_steer_direction(carla.VehicleWheelLocation.BR_Wheel, target_RR)
         # and return
         return self
+
+    def on_actor_bind(self):
+        """
+        A hook method that will be called after the actor is bound to a carla.Actor instance.
+
+        :return: None
+        """
+        super().on_actor_bind()
+        # a new carla actor has no control applied yet
+        self._invoke_forget_batched_control()
+
+    def _invoke_forget_batched_control(self):
+        """
+        Drop the controls of the vehicle kept by the control batcher, pending or last sent.
+        """
+        if self.control_batcher is not None and self.carla_actor is not None:
+            self.control_batcher.invoke_forget(self.carla_actor.id)
+
+    def _is_control_batch_available(self) -> bool:
+        """
+        Whether controls should be submitted to the control batcher.
+        """
+        return (self.option_control_batch
+                and self.control_batcher is not None
+                and self.control_batcher.carla_client is not None)
@@ -6,6 +6,7 @@ from .Imu import Imu
 from .Gnss import Gnss
 from .Radar import Radar
 from .Lidar import Lidar
+from .SensorGroup import SensorGroup
 
 __all__ = [
     'Actor',
@@ -16,4 +17,5 @@ __all__ = [
     'Gnss',
     'Radar',
     'Lidar',
+    'SensorGroup',
 ]
\ No newline at end of file
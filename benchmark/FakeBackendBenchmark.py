@@ -0,0 +1,122 @@
+import time
+import carla
+from typing import List, Tuple
+
+from ..CarlaContext import CarlaContext
+from ..manager import TickPacer
+
+
+D_FLEET_SIZES = (1, 10, 50)
+D_SENSOR_RIGS = (  # (name, sensors attached to each vehicle with their attributes)
+    ('none', ()),
+    ('imu+gnss', (('sensor.other.imu', {}), ('sensor.other.gnss', {}))),
+    ('lidar', (('sensor.lidar.ray_cast', {'points_per_second': '1200000', 'channels': '64'}),)),
+    ('camera', (('sensor.camera.rgb', {'image_size_x': '1920', 'image_size_y': '1080'}),)),
+)
+D_TICKS = 100
+D_FIXED_DELTA_TIME = 0.05  # in seconds
+D_PORT = 3000  # first port of the fake servers, one per measurement, stopped after it
+
+
+def new_context(port: int, *, rpc_latency: float = 0.0) -> CarlaContext:
+    """
+    Connect a CarlaContext to a new fake server.
+    :param port: port of the fake server, it must not be used by another measurement
+    :param rpc_latency: latency injected in every call, in seconds
+    :return: a connected CarlaContext instance
+    """
+    if not hasattr(carla, 'get_fake_server'):
+        raise RuntimeError('The fake carla module is not imported, put the fake directory on PYTHONPATH.')
+    carla.get_fake_server('127.0.0.1', port).use_latency(rpc=rpc_latency)
+    return CarlaContext('127.0.0.1', port).invoke_connection_start()
+
+
+def measure(port: int, fleet_size: int, sensors: Tuple[Tuple[str, dict], ...], ticks: int, *,
+            rpc_latency: float = 0.0) -> dict:
+    """
+    Measure the spawn, tick and destroy time of a fleet in sync primary mode with the sensor barrier.
+
+    :param port: port of the fake server
+    :param fleet_size: number of vehicles
+    :param sensors: (blueprint name, attributes) of the sensors attached to each vehicle
+    :param ticks: number of ticks
+    :param rpc_latency: latency injected in every call, in seconds
+    :return: a result row
+    """
+    context = new_context(port, rpc_latency=rpc_latency)
+    try:
+        return _measure_context(context, fleet_size, sensors, ticks)
+    finally:
+        context.invoke_connection_stop()
+        # stop the ticker and dispatch threads, so they do not run behind the next measurements
+        carla.get_fake_server('127.0.0.1', port).invoke_stop()
+
+
+def _measure_context(context: CarlaContext, fleet_size: int, sensors: Tuple[Tuple[str, dict], ...],
+                     ticks: int) -> dict:
+    """
+    Measure the spawn, tick and destroy time of a fleet with a connected context, see measure().
+    """
+    actors = []
+    for _ in range(fleet_size):
+        vehicle = context.actors.new_actor('vehicle.tesla.model3')
+        actors.append(vehicle)
+        actors.extend(context.actors.new_actor(name, parent=vehicle, **attributes) for name, attributes in sensors)
+    # spawn
+    time_start = time.perf_counter()
+    context.actors.invoke_actor_spawn_batch(actors)
+    spawn_ms = (time.perf_counter() - time_start) * 1000.0
+    # tick
+    context.running.use_sync_primary_mode(True, fixed_delta_time=D_FIXED_DELTA_TIME) \
+        .use_tick_pacing(TickPacer.PACING_AS_FAST_AS_POSSIBLE) \
+        .use_sensor_barrier(True)
+    context.running.wait_for_ticks(1, timeout=10.0)
+    time_start = time.perf_counter()
+    context.running.wait_for_ticks(ticks, timeout=ticks * 10.0)
+    tick_seconds = time.perf_counter() - time_start
+    context.running.use_sensor_barrier(False).use_sync_primary_mode(False)
+    # destroy
+    time_start = time.perf_counter()
+    context.actors.invoke_actor_destroy_batch(context.actors.registry)
+    destroy_ms = (time.perf_counter() - time_start) * 1000.0
+    return {
+        'vehicles': fleet_size,
+        'actors': len(actors),
+        'spawn_ms': spawn_ms,
+        'ticks_per_second': ticks / tick_seconds,
+        'barrier_timeouts': context.running.count_sensor_barrier_timeouts,
+        'destroy_ms': destroy_ms,
+    }
+
+
+def run(fleet_sizes: List[int] = D_FLEET_SIZES, sensor_rigs=D_SENSOR_RIGS, ticks: int = D_TICKS, *,
+        rpc_latency: float = 0.0) -> List[dict]:
+    """
+    Run the fake backend benchmark.
+    :param fleet_sizes: numbers of vehicles to benchmark
+    :param sensor_rigs: (name, sensors) attached to each vehicle, see D_SENSOR_RIGS
+    :param ticks: ticks per measurement
+    :param rpc_latency: latency injected in every call of the fake server, in seconds
+    :return: a list of result rows
+    """
+    results = []
+    port = D_PORT
+    for rig_name, sensors in sensor_rigs:
+        for fleet_size in fleet_sizes:
+            row = measure(port, fleet_size, sensors, ticks, rpc_latency=rpc_latency)
+            row['rig'] = rig_name
+            results.append(row)
+            port += 1
+    return results
+
+
+def main():
+    print(f'{"rig":>10} {"vehicles":>9} {"actors":>7} {"spawn(ms)":>10} {"ticks/s":>9} {"timeouts":>9} '
+          f'{"destroy(ms)":>12}')
+    for row in run():
+        print(f'{row["rig"]:>10} {row["vehicles"]:>9} {row["actors"]:>7} {row["spawn_ms"]:>10.2f} '
+              f'{row["ticks_per_second"]:>9.1f} {row["barrier_timeouts"]:>9} {row["destroy_ms"]:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+import time
+import numpy
+from types import SimpleNamespace
+from typing import List
+
+from ..core.data import LidarData
+
+
+D_POINT_COUNTS = (1_000, 10_000, 50_000, 130_000, 500_000)
+D_REPEAT = 20
+
+
+def new_fake_lidar_measurement(point_count: int, *, frame: int = 0) -> SimpleNamespace:
+    """
+    Create a fake carla.LidarMeasurement-like object with random points.
+    :param point_count: number of points in the measurement
+    :param frame: frame id
+    :return: an object exposing the attributes used by LidarData.from_carla_measurements
+    """
+    points = numpy.random.uniform(-100.0, 100.0, (point_count, 4)).astype(numpy.float32)
+    location = SimpleNamespace(x=0.0, y=0.0, z=0.0)
+    rotation = SimpleNamespace(pitch=0.0, yaw=0.0, roll=0.0)
+    return SimpleNamespace(
+        frame=frame,
+        timestamp=0.0,
+        transform=SimpleNamespace(location=location, rotation=rotation),
+        raw_data=memoryview(points.tobytes()),
+        channels=64,
+        horizontal_angle=0.0,
+    )
+
+
+def decode_legacy(measurements) -> list:
+    """
+    The per-point decoding used before the structured array, kept as a baseline.
+    :param measurements: fake lidar measurement
+    :return: list of LidarData.Point
+    """
+    points_ndarray = numpy.frombuffer(bytes(measurements.raw_data), dtype=numpy.float32).reshape(-1, 4)
+    points = []
+    for i in range(0, len(points_ndarray)):
+        points.append(LidarData.Point(points_ndarray[i][0],
+                                      points_ndarray[i][1],
+                                      points_ndarray[i][2],
+                                      points_ndarray[i][3]))
+    return points
+
+
+def measure(func, measurements, repeat: int) -> float:
+    """
+    Measure the average time cost of func(measurements).
+    :return: average time cost in milliseconds
+    """
+    time_start = time.perf_counter()
+    for _ in range(repeat):
+        func(measurements)
+    return (time.perf_counter() - time_start) / repeat * 1000.0
+
+
+def run(point_counts: List[int] = D_POINT_COUNTS, repeat: int = D_REPEAT, *, legacy: bool = True) -> List[dict]:
+    """
+    Run the lidar decode benchmark.
+    :param point_counts: point counts per frame to benchmark
+    :param repeat: repeat times per point count
+    :param legacy: also measure the legacy per-point decoding as a baseline
+    :return: a list of result rows
+    """
+    results = []
+    for count in point_counts:
+        measurements = new_fake_lidar_measurement(count)
+        row = {
+            'points': count,
+            'decode_ms': measure(LidarData.from_carla_measurements, measurements, repeat),
+            'legacy_ms': measure(decode_legacy, measurements, max(1, repeat // 10)) if legacy else None,
+        }
+        results.append(row)
+    return results
+
+
+def main():
+    print(f'{"points":>10} {"decode(ms)":>12} {"legacy(ms)":>12} {"speedup":>10}')
+    for row in run():
+        speedup = row['legacy_ms'] / row['decode_ms'] if row['decode_ms'] > 0 else float('inf')
+        print(f'{row["points"]:>10} {row["decode_ms"]:>12.4f} {row["legacy_ms"]:>12.2f} {speedup:>9.0f}x')
+
+
+if __name__ == '__main__':
+    main()
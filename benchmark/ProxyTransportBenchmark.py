@@ -0,0 +1,84 @@
+import time
+import pickle
+import numpy
+from multiprocessing import Pipe, Process
+from typing import List
+
+from ..proxy.SharedMemoryConnection import SharedMemoryConnection
+
+
+D_PAYLOAD_SHAPES = ((600, 800, 4), (1080, 1920, 4))  # BGRA images
+D_FRAMES = 200
+
+
+def _receiver_legacy(pipe, frames: int):
+    for _ in range(frames):
+        pickle.loads(pipe.recv())
+    pipe.send('done')
+
+
+def _receiver(pipe, frames: int):
+    for _ in range(frames):
+        pipe.recv()
+    pipe.send('done')
+
+
+def measure(transport: str, payload: numpy.ndarray, frames: int) -> float:
+    """
+    Measure the time to send frames payloads from this process to a child process.
+
+    :param transport: 'pipe-pickle' (pipe.send(pickle.dumps(obj))), 'pipe' or 'shared-memory'
+    :param payload: numpy array sent every frame
+    :param frames: number of frames
+    :return: frames per second
+    """
+    if transport == 'shared-memory':
+        end_1, end_2 = SharedMemoryConnection.pair(slot_size=payload.nbytes)
+        target = _receiver
+    else:
+        end_1, end_2 = Pipe()
+        target = _receiver_legacy if transport == 'pipe-pickle' else _receiver
+    process = Process(target=target, args=(end_2, frames), daemon=True)
+    process.start()
+    time_start = time.perf_counter()
+    for _ in range(frames):
+        if transport == 'pipe-pickle':
+            end_1.send(pickle.dumps(payload))
+        else:
+            end_1.send(payload)
+    end_1.recv()
+    time_cost = time.perf_counter() - time_start
+    process.join()
+    end_1.close()
+    return frames / time_cost
+
+
+def run(payload_shapes=D_PAYLOAD_SHAPES, frames: int = D_FRAMES) -> List[dict]:
+    """
+    Run the proxy transport benchmark.
+    :param payload_shapes: shapes of uint8 payloads to send
+    :param frames: frames per measurement
+    :return: a list of result rows
+    """
+    results = []
+    for shape in payload_shapes:
+        payload = numpy.random.randint(0, 255, shape, dtype=numpy.uint8)
+        for transport in ('pipe-pickle', 'pipe', 'shared-memory'):
+            fps = measure(transport, payload, frames)
+            results.append({
+                'payload': 'x'.join(str(i) for i in shape),
+                'transport': transport,
+                'fps': fps,
+                'mbps': fps * payload.nbytes / 1024 / 1024,
+            })
+    return results
+
+
+def main():
+    print(f'{"payload":>12} {"transport":>14} {"frames/s":>10} {"MB/s":>10}')
+    for row in run():
+        print(f'{row["payload"]:>12} {row["transport"]:>14} {row["fps"]:>10.1f} {row["mbps"]:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
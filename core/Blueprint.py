@@ -1,6 +1,8 @@
 import carla
 import random
 
+from .BlueprintCache import BlueprintCache
+
 
 class Blueprint:
     """
@@ -8,8 +10,11 @@ class Blueprint:
 
     This class temporary holds the blueprint with attribute needed to spawn the Actor.
     When actor spawn procedure invoked, this class will be converted to carla.Blueprint instance.
+    Blueprints are looked up in the shared BLUEPRINT_CACHE, keyed by world, so the library is fetched once per world.
     """
 
+    BLUEPRINT_CACHE = BlueprintCache()
+
     def __init__(self, blueprint_name: str, **kwargs):
         """
         Construct a Blueprint instance with arguments.
@@ -42,31 +47,32 @@ class Blueprint:
         """
         A method to convert Blueprint to carla.ActorBlueprint instance.
 
-        Use carla.World to find the matched blueprint from the blueprint library.
+        Use carla.World to find the matched blueprint from the cached blueprint library.
+        Attributes are validated locally against the precomputed plan of the blueprint.
         This method should be the last one called before the actor spawn.
 
         :param carla_world: carla.World instance
         :return: carla.ActorBlueprint instance
         :raise IndexError: if the blueprint not found in the world's blueprint library
                            or attribute not found in the blueprint
-
+        :raise RuntimeError: if an attribute is not modifiable
         """
         # type check
         if not isinstance(carla_world, carla.World):
             raise TypeError(f'carla_world must be a instance of carla.World, got {type(carla_world)}')
 
         # find matched blueprint
-        bp_lib = carla_world.get_blueprint_library()  # type: carla.BlueprintLibrary
-        bp = bp_lib.find(self.blueprint_name)  # type: carla.ActorBlueprint
+        bp, plan = self.BLUEPRINT_CACHE.find(carla_world, self.blueprint_name)
+
+        # validate all attributes before setting any
+        for key in self.attributes:
+            plan.validate(key)
 
         # set attributes
         for key, value in self.attributes.items():
-            attr = bp.get_attribute(key)
-            if not attr.is_modifiable:
-                raise RuntimeError(f'Attribute {key} is not modifiable in blueprint {self.blueprint_name}')
             # use default value if value is None
             if value is None:
-                value = random.choice(attr.recommended_values)
+                value = random.choice(plan.recommended_values[key])
             # invoke set
             bp.set_attribute(str(key), str(value))
 
@@ -0,0 +1,113 @@
+import carla
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+
+class BlueprintCache:
+    """
+    A cache of the carla blueprint libraries, one entry per world.
+
+    The library is fetched once per world, and the attribute plan of each blueprint is computed once on first use,
+    so Blueprint kwargs are validated locally instead of one get_attribute() call per attribute.
+
+    Entries are keyed by carla.World.id, so contexts on different worlds share the cache without evicting each
+    other. A world loaded by load_world() or reload_world() has a new id and gets its own entry, the least recently
+    used entries are dropped beyond max_worlds. Call invalidate() to drop an entry explicitly.
+    """
+
+    D_MAX_WORLDS = 8  # worlds kept in the cache
+
+    class Plan:
+        """
+        Precomputed attribute information of a blueprint.
+        """
+        def __init__(self, blueprint_name: str, carla_blueprint: carla.ActorBlueprint):
+            self.blueprint_name = blueprint_name
+            self.attributes = tuple(attr.id for attr in carla_blueprint)  # type: Tuple[str, ...]
+            self.recommended_values = {  # attribute id -> recommended values, modifiable attributes only
+                attr.id: tuple(attr.recommended_values) for attr in carla_blueprint if attr.is_modifiable
+            }  # type: Dict[str, Tuple[str, ...]]
+
+        def validate(self, key: str):
+            """
+            Check that an attribute exists in the blueprint and is modifiable.
+
+            :param key: attribute name
+            :raise IndexError: if the attribute is not found in the blueprint
+            :raise RuntimeError: if the attribute is not modifiable
+            """
+            if key not in self.recommended_values:
+                if key not in self.attributes:
+                    raise IndexError(f'Attribute {key} not found in blueprint {self.blueprint_name}')
+                raise RuntimeError(f'Attribute {key} is not modifiable in blueprint {self.blueprint_name}')
+
+    def __init__(self, max_worlds: int = D_MAX_WORLDS):
+        """
+        Construct an empty BlueprintCache instance.
+        :param max_worlds: number of worlds kept in the cache
+        """
+        if max_worlds <= 0:
+            raise ValueError("max_worlds must be greater than 0.")
+        self._max_worlds = max_worlds
+        # world id -> (library, blueprint name -> plan), least recently used first
+        self._worlds = OrderedDict()  # type: Dict[int, Tuple[carla.BlueprintLibrary, Dict[str, BlueprintCache.Plan]]]
+        self._lock = Lock()
+        # counters
+        self._count_library_fetched = 0
+
+    @property
+    def count_library_fetched(self) -> int:
+        """
+        [Read-Only] Number of times the blueprint library was fetched from the server.
+        """
+        return self._count_library_fetched
+
+    @property
+    def world_ids(self) -> Tuple[int, ...]:
+        """
+        [Read-Only] Ids of the worlds in the cache, the least recently used first.
+        """
+        with self._lock:
+            return tuple(self._worlds)
+
+    def find(self, carla_world: carla.World, blueprint_name: str) -> Tuple[carla.ActorBlueprint, 'BlueprintCache.Plan']:
+        """
+        Find a blueprint in the cached library.
+
+        :param carla_world: carla.World instance
+        :param blueprint_name: blueprint name, defined in the carla blueprint library
+        :return: (a new carla.ActorBlueprint instance to set attributes on, the attribute plan of the blueprint)
+        :raise IndexError: if the blueprint not found in the world's blueprint library
+        """
+        world_id = carla_world.id
+        with self._lock:
+            entry = self._worlds.get(world_id)
+            if entry is None:
+                entry = (carla_world.get_blueprint_library(), {})
+                self._worlds[world_id] = entry
+                self._count_library_fetched += 1
+                while len(self._worlds) > self._max_worlds:
+                    self._worlds.popitem(last=False)
+            else:
+                self._worlds.move_to_end(world_id)
+            library, plans = entry
+            bp = library.find(blueprint_name)  # type: carla.ActorBlueprint
+            plan = plans.get(blueprint_name)
+            if plan is None:
+                plan = BlueprintCache.Plan(blueprint_name, bp)
+                plans[blueprint_name] = plan
+            return bp, plan
+
+    def invalidate(self, world_id: Optional[int] = None) -> 'BlueprintCache':
+        """
+        Drop a cached library and its plans, they are fetched again on next use.
+        :param world_id: id of the world to drop, None to drop every world
+        :return: return self for method chaining.
+        """
+        with self._lock:
+            if world_id is None:
+                self._worlds.clear()
+            else:
+                self._worlds.pop(world_id, None)
+        return self
@@ -0,0 +1,145 @@
+import carla
+from threading import Lock
+from typing import Dict, List, Tuple, Union
+
+
+class ControlBatcher:
+    """
+    A collector of vehicle control commands, sent to the server in one batch per tick.
+
+    Vehicles bound to the batcher submit their controls instead of sending one RPC each. The RunningManager control
+    thread flushes all submitted controls with a single carla.Client.apply_batch() right before the world ticks.
+    Only the latest control of each vehicle in a tick is sent, and a control equal to the one sent last time
+    is not sent again, since carla keeps applying the last control of a vehicle.
+    """
+
+    KIND_DIRECT = 'direct'
+    KIND_ACKERMANN = 'ackermann'
+
+    def __init__(self, client_ref: List[Union[carla.Client, None]]):
+        """
+        Construct a ControlBatcher instance.
+        :param client_ref: A len(1) list that contains the nullable carla.Client instance.
+        """
+        self._carla_client_ref = client_ref
+        self._pending = {}  # type: Dict[int, Tuple[str, object]]  # carla actor id -> (kind, carla control)
+        self._sent = {}  # type: Dict[int, Tuple[str, object]]  # carla actor id -> last (kind, carla control) sent
+        self._lock = Lock()
+        # counters
+        self._count_submitted = 0
+        self._count_sent = 0
+        self._count_coalesced = 0
+
+    @property
+    def carla_client(self) -> carla.Client:
+        """
+        [Immutable] The carla.Client instance the batches are sent with
+        """
+        return self._carla_client_ref[0]
+
+    @property
+    def count_submitted(self) -> int:
+        """
+        [Read-Only] Number of controls submitted.
+        """
+        return self._count_submitted
+
+    @property
+    def count_sent(self) -> int:
+        """
+        [Read-Only] Number of controls sent to the server.
+        """
+        return self._count_sent
+
+    @property
+    def count_coalesced(self) -> int:
+        """
+        [Read-Only] Number of submitted controls not sent, replaced in the same tick or equal to the last one sent.
+        """
+        return self._count_coalesced
+
+    def submit_direct_control(self, actor_id: int, control: carla.VehicleControl) -> 'ControlBatcher':
+        """
+        Submit a direct control for the next flush. It replaces any control submitted for the vehicle in this tick.
+
+        :param actor_id: carla actor id of the vehicle
+        :param control: carla.VehicleControl instance
+        :return: return self for method chaining.
+        """
+        return self._invoke_submit(actor_id, self.KIND_DIRECT, control)
+
+    def submit_ackermann_control(self, actor_id: int, control: carla.VehicleAckermannControl) -> 'ControlBatcher':
+        """
+        Submit an ackermann control for the next flush. It replaces any control submitted for the vehicle in this tick.
+
+        :param actor_id: carla actor id of the vehicle
+        :param control: carla.VehicleAckermannControl instance
+        :return: return self for method chaining.
+        """
+        return self._invoke_submit(actor_id, self.KIND_ACKERMANN, control)
+
+    def invoke_flush(self) -> int:
+        """
+        Send the submitted controls in one batch.
+
+        If the batch fails, the controls are kept for the next flush and the error is raised.
+
+        :return: number of controls sent
+        """
+        if self.carla_client is None:
+            # keep the controls until a client is available
+            return 0
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            commands = []
+            for actor_id, (kind, control) in list(pending.items()):
+                if self._sent.get(actor_id) == (kind, control):
+                    # carla keeps applying the last control
+                    self._count_coalesced += 1
+                    del pending[actor_id]
+                    continue
+                if kind == self.KIND_DIRECT:
+                    commands.append(carla.command.ApplyVehicleControl(actor_id, control))
+                else:
+                    commands.append(carla.command.ApplyVehicleAckermannControl(actor_id, control))
+        if not commands:
+            return 0
+        try:
+            self.carla_client.apply_batch(commands)
+        except Exception:
+            # keep the controls for the next flush, unless a newer one was submitted meanwhile
+            with self._lock:
+                pending.update(self._pending)
+                self._pending = pending
+            raise
+        with self._lock:
+            self._sent.update(pending)
+            self._count_sent += len(commands)
+        return len(commands)
+
+    def invoke_forget(self, actor_id: int) -> 'ControlBatcher':
+        """
+        Forget the controls of a vehicle, so the next one is sent even if unchanged.
+
+        Called when a control reaches the vehicle outside the batcher. The pending control is dropped too,
+        it must not override the newer control at the next flush.
+
+        :param actor_id: carla actor id of the vehicle
+        :return: return self for method chaining.
+        """
+        with self._lock:
+            self._pending.pop(actor_id, None)
+            self._sent.pop(actor_id, None)
+        return self
+
+    def _invoke_submit(self, actor_id: int, kind: str, control) -> 'ControlBatcher':
+        """
+        Keep a control as the pending one of a vehicle.
+        """
+        with self._lock:
+            if actor_id in self._pending:
+                self._count_coalesced += 1
+            self._pending[actor_id] = (kind, control)
+            self._count_submitted += 1
+        return self
@@ -0,0 +1,64 @@
+import carla
+from threading import Lock
+from typing import Dict, Union
+
+
+class WorldSnapshotCache:
+    """
+    A cache of the latest carla.WorldSnapshot, updated once per tick by the RunningManager control thread.
+
+    Actor snapshots are indexed by actor id on first lookup, so reading the kinematics of many actors costs no RPC.
+    Values are the ones of the latest tick, they do not reflect changes applied since then.
+    """
+
+    def __init__(self):
+        """
+        Construct an empty WorldSnapshotCache instance.
+        """
+        self._snapshot = None  # type: Union[carla.WorldSnapshot, None]
+        self._index = {}  # type: Dict[int, carla.ActorSnapshot]  # actor id -> actor snapshot
+        self._lock = Lock()
+
+    @property
+    def snapshot(self) -> Union[carla.WorldSnapshot, None]:
+        """
+        [Read-Only] The latest carla.WorldSnapshot, None if no tick is received yet.
+        """
+        return self._snapshot
+
+    @property
+    def frame(self) -> int:
+        """
+        [Read-Only] The frame id of the latest snapshot, 0 if no tick is received yet.
+        """
+        snapshot = self._snapshot
+        return snapshot.frame if snapshot is not None else 0
+
+    def update(self, snapshot: Union[carla.WorldSnapshot, None]) -> 'WorldSnapshotCache':
+        """
+        Replace the cached snapshot, called once per tick.
+
+        :param snapshot: carla.WorldSnapshot instance, None to clear the cache
+        :return: return self for method chaining.
+        """
+        with self._lock:
+            self._snapshot = snapshot
+            self._index = {}
+        return self
+
+    def find(self, actor_id: int) -> Union[carla.ActorSnapshot, None]:
+        """
+        Find the snapshot of an actor in the latest tick.
+
+        :param actor_id: carla actor id
+        :return: carla.ActorSnapshot instance, None if the actor is not in the snapshot
+        """
+        with self._lock:
+            if self._snapshot is None:
+                return None
+            actor_snapshot = self._index.get(actor_id)
+            if actor_snapshot is None:
+                actor_snapshot = self._snapshot.find(actor_id)
+                if actor_snapshot is not None:
+                    self._index[actor_id] = actor_snapshot
+            return actor_snapshot
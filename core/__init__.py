@@ -2,7 +2,10 @@ from .Vector3 import Vector3
 from .Location import Location
 from .Rotation import Rotation
 from .Transform import Transform
+from .BlueprintCache import BlueprintCache
 from .Blueprint import Blueprint
+from .WorldSnapshotCache import WorldSnapshotCache
+from .ControlBatcher import ControlBatcher
 
 
 __all__ = [
@@ -10,5 +13,8 @@ __all__ = [
     'Location',
     'Rotation',
     'Transform',
+    'BlueprintCache',
     'Blueprint',
+    'WorldSnapshotCache',
+    'ControlBatcher',
 ]
\ No newline at end of file
@@ -0,0 +1,99 @@
+import numpy
+import weakref
+from threading import Lock
+from typing import List
+
+
+class BufferPool:
+    """
+    A reusable pool of raw data buffers, one pool per sensor.
+
+    Sensor data copies the measurement raw data into a buffer acquired from the pool exactly once.
+    The pool hands out each buffer as a uint8 numpy array, the lease. Every view built on a lease (memoryview,
+    image, points) keeps it alive through its base, so the lease is only collected once the owning data object and
+    all of its views are gone. A weakref finalizer on the lease then marks the buffer free again.
+    """
+
+    D_CAPACITY = 4  # buffers tracked by the pool
+
+    def __init__(self, capacity: int = D_CAPACITY):
+        """
+        Construct a BufferPool instance.
+        :param capacity: maximum number of buffers tracked for reuse.
+        """
+        self._capacity = capacity
+        self._entries = []  # type: List[list]  # [bytearray, leased]
+        self._lock = Lock()
+        # counters
+        self._count_allocated = 0
+        self._count_reused = 0
+
+    @property
+    def capacity(self) -> int:
+        """
+        [Read-Only] Maximum number of buffers tracked for reuse.
+        """
+        return self._capacity
+
+    @property
+    def count_allocated(self) -> int:
+        """
+        [Read-Only] Number of buffers newly allocated by the pool.
+        """
+        return self._count_allocated
+
+    @property
+    def count_reused(self) -> int:
+        """
+        [Read-Only] Number of acquisitions served by a recycled buffer.
+        """
+        return self._count_reused
+
+    def acquire(self, size: int) -> numpy.ndarray:
+        """
+        Acquire a buffer with at least size bytes.
+
+        If every tracked buffer is still leased, an untracked buffer is returned and left to the garbage collector.
+
+        :param size: required size in bytes
+        :return: a writable uint8 numpy array owned by the caller, the buffer is free again once it is collected
+        """
+        with self._lock:
+            entry_replaceable = None
+            for entry in self._entries:
+                if entry[1]:
+                    continue
+                if len(entry[0]) >= size:
+                    self._count_reused += 1
+                    return self._invoke_lease(entry)
+                # a free buffer that is too small, replace it if nothing fits
+                entry_replaceable = entry
+            buffer = bytearray(size)
+            self._count_allocated += 1
+            if entry_replaceable is not None:
+                entry_replaceable[0] = buffer
+                return self._invoke_lease(entry_replaceable)
+            if len(self._entries) < self.capacity:
+                entry = [buffer, False]
+                self._entries.append(entry)
+                return self._invoke_lease(entry)
+            return numpy.frombuffer(buffer, dtype=numpy.uint8)
+
+    @staticmethod
+    def _invoke_lease(entry: list) -> numpy.ndarray:
+        """
+        Lease the buffer of an entry. The lock must be held by the caller.
+        """
+        entry[1] = True
+        lease = numpy.frombuffer(entry[0], dtype=numpy.uint8)
+        weakref.finalize(lease, BufferPool._invoke_release, entry)
+        return lease
+
+    @staticmethod
+    def _invoke_release(entry: list):
+        """
+        Mark the buffer of an entry free, called when its lease is collected.
+
+        It may run inside acquire() on garbage collection, so it does not take the lock. Only acquire() sets the flag.
+        """
+        entry[1] = False
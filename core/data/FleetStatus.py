@@ -0,0 +1,44 @@
+import numpy
+from typing import Dict, List
+
+
+class FleetStatus:
+    """
+    A data class representing the status of every vehicle known by an ActorManager, as NumPy arrays.
+
+    Row i of every array belongs to vehicle_ids[i]. Rows are assigned in registration order and never move,
+    so a row index stays valid across ticks. Rows of vehicles that are not alive are filled with NaN.
+    """
+
+    def __init__(self, vehicle_ids: List[str], frame: int = 0):
+        """
+        Construct a FleetStatus instance with arrays for the given vehicles.
+        :param vehicle_ids: actor ids of the vehicles, in row order
+        :param frame: simulation frame id of the status, 0 if unknown
+        """
+        count = len(vehicle_ids)
+        self.frame = frame
+        self.vehicle_ids = vehicle_ids  # type: List[str]
+        self.alive = numpy.zeros(count, dtype=bool)  # type: numpy.ndarray
+        # kinematics
+        self.velocity = numpy.full((count, 3), numpy.nan, dtype=numpy.float32)  # type: numpy.ndarray  # m/s
+        self.acceleration = numpy.full((count, 3), numpy.nan, dtype=numpy.float32)  # type: numpy.ndarray  # m/s^2
+        self.speed = numpy.full(count, numpy.nan, dtype=numpy.float32)  # type: numpy.ndarray  # m/s
+        # control
+        self.throttle = numpy.full(count, numpy.nan, dtype=numpy.float32)  # type: numpy.ndarray
+        self.steer = numpy.full(count, numpy.nan, dtype=numpy.float32)  # type: numpy.ndarray
+        self.brake = numpy.full(count, numpy.nan, dtype=numpy.float32)  # type: numpy.ndarray
+        self._rows = {key: row for row, key in enumerate(vehicle_ids)}  # type: Dict[str, int]
+
+    def __len__(self) -> int:
+        return len(self.vehicle_ids)
+
+    def index(self, vehicle_id: str) -> int:
+        """
+        Get the row of a vehicle.
+
+        :param vehicle_id: actor id of the vehicle, Actor.id
+        :return: row index
+        :raise KeyError: if the vehicle is not in the fleet
+        """
+        return self._rows[vehicle_id]
@@ -0,0 +1,185 @@
+import numpy
+import weakref
+from threading import Lock
+from typing import Dict, List, Optional
+
+from .SensorData import SensorData
+
+
+class FrameHistory:
+    """
+    A fixed-capacity ring of the latest sensor frames with preallocated storage.
+
+    Raw buffers of the frames are stored in capacity preallocated slots, so memory stays flat however long the
+    simulation runs. FrameHistory provides the same acquire() method as BufferPool, sensor data decoded with it as
+    buffer_pool is built directly on a slot of the ring, with no other copy.
+
+    A slot is never overwritten while a frame built on it is still referenced outside the ring. If the oldest
+    frame is still held when its slot comes round again, the slot is detached: the frame keeps its storage and the
+    ring allocates a new one for the slot.
+    """
+
+    D_CAPACITY = 16  # frames
+
+    def __init__(self, capacity: int = D_CAPACITY, slot_size: int = 0):
+        """
+        Construct a FrameHistory instance.
+        :param capacity: number of frames kept in the ring.
+        :param slot_size: raw buffer size of one frame in bytes, slots grow if a larger frame arrives.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0.")
+        self._capacity = capacity
+        self._slot_size = max(0, slot_size)
+        self._slots = [numpy.zeros(self._slot_size, dtype=numpy.uint8) for _ in range(capacity)]
+        self._leases = [None] * capacity  # type: List[Optional[weakref.ref]]  # lease handed out for each slot
+        self._data = [None] * capacity  # type: List[Optional[SensorData]]
+        self._frame_index = {}  # type: Dict[int, int]  # frame id -> slot index
+        self._index_next = 0
+        self._index_acquired = None  # type: Optional[int]  # slot taken by acquire() and not appended yet
+        self._count = 0
+        self._count_detached = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """
+        [Read-Only] Number of frames kept in the ring.
+        """
+        return self._capacity
+
+    @property
+    def slot_size(self) -> int:
+        """
+        [Read-Only] Raw buffer size of one slot in bytes.
+        """
+        return self._slot_size
+
+    @property
+    def nbytes(self) -> int:
+        """
+        [Read-Only] Memory allocated for the slots in bytes.
+        """
+        with self._lock:
+            return sum(slot.nbytes for slot in self._slots)
+
+    @property
+    def count_detached(self) -> int:
+        """
+        [Read-Only] Number of slots given up to a frame still held outside the ring.
+        """
+        return self._count_detached
+
+    @property
+    def frames(self) -> List[int]:
+        """
+        [Read-Only] Frame ids in the history, from the oldest to the newest.
+        """
+        with self._lock:
+            return [data.frame for data in self._iter_oldest_first()]
+
+    def acquire(self, size: int) -> numpy.ndarray:
+        """
+        Take the slot of the next frame to write raw data in. The oldest frame is evicted.
+
+        The next append() stores its frame in this slot.
+
+        :param size: required size in bytes
+        :return: a writable uint8 numpy array on the slot
+        """
+        with self._lock:
+            index = self._invoke_take_slot()
+            self._index_acquired = index
+            if size > self._slot_size:
+                # later slots are grown when they come round
+                self._slot_size = size
+            lease = self._leases[index]
+            if lease is not None and lease() is not None:
+                # a frame built on the slot is still held, leave the storage to it
+                self._slots[index] = numpy.zeros(self._slot_size, dtype=numpy.uint8)
+                self._count_detached += 1
+            elif self._slots[index].nbytes < size:
+                self._slots[index] = numpy.zeros(self._slot_size, dtype=numpy.uint8)
+            buffer = self._slots[index].view()
+            self._leases[index] = weakref.ref(buffer)
+            return buffer
+
+    def append(self, data: SensorData) -> 'FrameHistory':
+        """
+        Append a frame to the history in O(1). The oldest frame is evicted if the history is full.
+
+        :param data: SensorData instance, built with this history as buffer_pool to avoid another copy
+        :return: return self for method chaining.
+        """
+        with self._lock:
+            index = self._index_acquired
+            if index is None:
+                index = self._invoke_take_slot()
+            self._index_acquired = None
+            self._data[index] = data
+            self._frame_index[data.frame] = index
+            self._count += 1
+        return self
+
+    def get(self, frame: int) -> Optional[SensorData]:
+        """
+        Look up a frame by frame id in O(1).
+
+        :param frame: carla frame id
+        :return: SensorData instance, None if the frame is not in the history
+        """
+        with self._lock:
+            index = self._frame_index.get(frame)
+            return self._data[index] if index is not None else None
+
+    def latest(self, count: int = 1) -> List[SensorData]:
+        """
+        Get the latest frames.
+
+        :param count: maximum number of frames
+        :return: a list of SensorData, from the newest to the oldest
+        """
+        with self._lock:
+            frames = list(self._iter_oldest_first())
+        return frames[::-1][:count]
+
+    def clear(self) -> 'FrameHistory':
+        """
+        Remove all frames, the preallocated storage is kept.
+        :return: return self for method chaining.
+        """
+        with self._lock:
+            self._data = [None] * self.capacity
+            self._frame_index.clear()
+            self._index_next = 0
+            self._index_acquired = None
+            self._count = 0
+        return self
+
+    def _iter_oldest_first(self):
+        """
+        Iterate frames from the oldest to the newest. The lock must be held by the caller.
+        """
+        for i in range(self.capacity):
+            data = self._data[(self._index_next + i) % self.capacity]
+            if data is not None:
+                yield data
+
+    def _invoke_take_slot(self) -> int:
+        """
+        Evict the frame in the next slot and advance the ring. The lock must be held by the caller.
+
+        :return: index of the slot
+        """
+        index = self._index_next
+        data = self._data[index]
+        if data is not None:
+            if self._frame_index.get(data.frame) == index:
+                del self._frame_index[data.frame]
+            self._data[index] = None
+            self._count -= 1
+        self._index_next = (index + 1) % self.capacity
+        return index
@@ -1,5 +1,7 @@
 import carla
+from typing import Optional
 
+from .BufferPool import BufferPool
 from .SensorData import SensorData
 
 
@@ -8,6 +10,8 @@ class GnssData(SensorData):
     A class to store GNSS data.
     """
 
+    MEASUREMENT_ATTRIBUTES = ('altitude', 'latitude', 'longitude')
+
     def __init__(self):
         super().__init__()
         self.altitude = 0.0
@@ -15,14 +19,16 @@ class GnssData(SensorData):
         self.longitude = 0.0
 
     @classmethod
-    def from_carla_measurements(cls, measurements: carla.GnssMeasurement) -> 'GnssData':
+    def from_carla_measurements(cls, measurements: carla.GnssMeasurement, *,
+                                buffer_pool: Optional[BufferPool] = None) -> 'GnssData':
         """
         Load data from a carla.SensorData instance.
         :param measurements: cara.SensorData instance
+        :param buffer_pool: Optional, a BufferPool to take the raw buffer from
         :return: SensorData instance
         """
         data = cls()  # type: GnssData
-        data = cls.initialize_sensor_basic_data(data, measurements)
+        data = cls.initialize_sensor_basic_data(data, measurements, buffer_pool=buffer_pool)
 
         # special gnss data
         data.altitude = float(measurements.altitude)
@@ -1,45 +1,60 @@
 import carla
 import time
 import numpy
+from typing import Optional
 
+from .BufferPool import BufferPool
 from .SensorData import SensorData
 from ..Transform import Transform
 
 
 class ImageData(SensorData):
 
+    BUFFER_VIEWS = ('image',)
+    MEASUREMENT_ATTRIBUTES = ('fov', 'height', 'width')
+
     def __init__(self):
         super().__init__()
         self.fov = 0.0
         self.height = 0
         self.width = 0
-        self.image = None
+        self.image = None  # type: Optional[numpy.ndarray]  # BGRA view on the owned buffer
 
     @classmethod
     def from_carla_measurements(cls,
                                 measurements: carla.Image,
-                                convert: carla.ColorConverter = carla.ColorConverter.Raw) -> 'ImageData':
+                                convert: carla.ColorConverter = carla.ColorConverter.Raw, *,
+                                buffer_pool: Optional[BufferPool] = None) -> 'ImageData':
         """
         Load data from a carla.SensorData instance.
         :param convert: carla.ColorConverter, convert a image to a different visualization form
         :param measurements: cara.SensorData instance
+        :param buffer_pool: Optional, a BufferPool to take the raw buffer from
         :return: SensorData instance
         """
         data = cls()
-        # dump data
-        data = cls.initialize_sensor_basic_data(data, measurements)
+        # image size is needed before the buffer views are built
         data.fov = measurements.fov
         data.height = measurements.height
         data.width = measurements.width
-
-        # create image
-        data.image = numpy.ndarray(
-            shape=(data.height, data.width, 4),
-            dtype=numpy.uint8,
-            buffer=data.raw_data)
+        # dump data
+        data = cls.initialize_sensor_basic_data(data, measurements, buffer_pool=buffer_pool)
 
         return data
 
+    def bind_buffer_views(self):
+        """
+        Build the image on the owned buffer.
+        """
+        raw_view = self.raw_view
+        if raw_view is None or raw_view.nbytes != self.height * self.width * 4:
+            self.image = None
+            return
+        self.image = numpy.ndarray(
+            shape=(self.height, self.width, 4),
+            dtype=numpy.uint8,
+            buffer=raw_view)
+
     def as_pygame_surface_data(self) -> numpy.ndarray:
         """
         Convert the image to a pygame surface.
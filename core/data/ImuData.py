@@ -1,6 +1,8 @@
 import carla
 import time
+from typing import Optional
 
+from .BufferPool import BufferPool
 from .SensorData import SensorData
 from ..Transform import Transform
 from ..Vector3 import Vector3
@@ -8,6 +10,8 @@ from ..Vector3 import Vector3
 
 class ImuData(SensorData):
 
+    MEASUREMENT_ATTRIBUTES = ('accelerometer', 'gyroscope', 'compass')
+
     def __init__(self):
         super().__init__()
         self.accelerometer = Vector3()
@@ -15,14 +19,16 @@ class ImuData(SensorData):
         self.compass = 0.0
 
     @classmethod
-    def from_carla_measurements(cls, measurements: carla.IMUMeasurement) -> 'ImuData':
+    def from_carla_measurements(cls, measurements: carla.IMUMeasurement, *,
+                                buffer_pool: Optional[BufferPool] = None) -> 'ImuData':
         """
         Load data from a carla.SensorData instance.
         :param measurements: cara.SensorData instance
+        :param buffer_pool: Optional, a BufferPool to take the raw buffer from
         :return: SensorData instance
         """
         data = cls()
-        data = cls.initialize_sensor_basic_data(data, measurements)
+        data = cls.initialize_sensor_basic_data(data, measurements, buffer_pool=buffer_pool)
 
         # special imu data
         data.accelerometer = Vector3.from_carla_vector3d(measurements.accelerometer)
@@ -1,15 +1,27 @@
 import carla
 import numpy
-from typing import List, Optional
+from typing import Sequence, Union, Optional, overload
 
+from .BufferPool import BufferPool
 from .SensorData import SensorData
 
 
 class LidarData(SensorData):
     """
     A class to store Lidar data.
+
+    Points are kept in a single structured numpy array (x, y, z, intensity) which is a zero-copy view on the raw data.
     """
 
+    BUFFER_VIEWS = ('points_array',)
+    MEASUREMENT_ATTRIBUTES = ('channels', 'horizontal_angle')
+    POINT_DTYPE = numpy.dtype([
+        ('x', numpy.float32),
+        ('y', numpy.float32),
+        ('z', numpy.float32),
+        ('intensity', numpy.float32),
+    ])
+
     class Point:
         """
         A point in the lidar data.
@@ -20,35 +32,106 @@ class LidarData(SensorData):
             self.z = z
             self.intensity = intensity
 
+    class PointsView(Sequence):
+        """
+        A lazy, read-only sequence view of LidarData.Point over the structured point array.
+
+        Point objects are only created when an item is accessed, kept for backward compatibility.
+        """
+        def __init__(self, points_array: numpy.ndarray):
+            self._points_array = points_array
+
+        def __len__(self) -> int:
+            return len(self._points_array)
+
+        @overload
+        def __getitem__(self, index: int) -> 'LidarData.Point': ...
+
+        @overload
+        def __getitem__(self, index: slice) -> 'LidarData.PointsView': ...
+
+        def __getitem__(self, index):
+            if isinstance(index, slice):
+                return LidarData.PointsView(self._points_array[index])
+            p = self._points_array[index]
+            return LidarData.Point(float(p['x']), float(p['y']), float(p['z']), float(p['intensity']))
+
     def __init__(self):
         super().__init__()
-        self.points = []  # type: List[LidarData.Point]
-        self.points_ndarray = None  # Optional[numpy.ndarray]
+        self.points_array = numpy.empty(0, dtype=self.POINT_DTYPE)  # type: numpy.ndarray
         self.channels = 0
         self.horizontal_angle = 0
 
+    @property
+    def points(self) -> 'LidarData.PointsView':
+        """
+        [Read-Only] A lazy sequence of LidarData.Point, prefer points_array for heavy work.
+        """
+        return LidarData.PointsView(self.points_array)
+
+    @property
+    def points_ndarray(self) -> numpy.ndarray:
+        """
+        [Read-Write] A (N, 4) float32 view of the points in x, y, z, intensity order.
+
+        Setting it copies the points into a new owned buffer and rebuilds points_array on it, None clears the points.
+        """
+        return self.points_array.view(numpy.float32).reshape(-1, 4)
+
+    @points_ndarray.setter
+    def points_ndarray(self, value: Optional[numpy.ndarray]):
+        if value is None:
+            self._buffer = None
+            self._buffer_size = 0
+            self.bind_buffer_views()
+            return
+        value = numpy.ascontiguousarray(value, dtype=numpy.float32)
+        if value.ndim != 2 or value.shape[1] != 4:
+            raise ValueError(f'points_ndarray must have the shape (N, 4), got {value.shape}')
+        self.set_raw_data(value)
+
+    @property
+    def points_count(self) -> int:
+        """
+        [Read-Only] Number of points in the frame.
+        """
+        return len(self.points_array)
+
     @classmethod
-    def from_carla_measurements(cls, measurements: carla.LidarMeasurement) -> 'LidarData':
+    def from_carla_measurements(cls, measurements: carla.LidarMeasurement, *,
+                                buffer_pool: Optional[BufferPool] = None) -> 'LidarData':
         """
-        Load data from a carla.RadarMeasurement instance.
-        :param measurements: cara.RadarMeasurement instance
+        Load data from a carla.LidarMeasurement instance.
+        :param measurements: cara.LidarMeasurement instance
+        :param buffer_pool: Optional, a BufferPool to take the raw buffer from
         :return: SensorData instance
         """
         data = cls()  # type: LidarData
-        data = cls.initialize_sensor_basic_data(data, measurements)
+        data = cls.initialize_sensor_basic_data(data, measurements, buffer_pool=buffer_pool)
 
-        # special gnss data
+        # special lidar data
         data.channels = measurements.channels
         data.horizontal_angle = measurements.horizontal_angle
-        data.points_ndarray = numpy.fromstring(data.raw_data, dtype=numpy.float32)
-        data.points_ndarray = numpy.reshape(data.points_ndarray, (int(data.points_ndarray.shape[0] / 4), 4))
-        for i in range(0, len(data.points_ndarray)):
-            data.points.append(LidarData.Point(data.points_ndarray[i][0],
-                                               data.points_ndarray[i][1],
-                                               data.points_ndarray[i][2],
-                                               data.points_ndarray[i][3]))
-
-        # TODO: There is a bug causing the 0 points received from the lidar sensor
-        # print(len(data.points))
 
         return data
+
+    def bind_buffer_views(self):
+        """
+        Build points_array on the owned buffer.
+        """
+        self.points_array = self.decode_points(self.raw_view)
+
+    @classmethod
+    def decode_points(cls, buffer: Union[bytes, bytearray, memoryview, None]) -> numpy.ndarray:
+        """
+        Decode a lidar raw buffer to the structured point array without copying.
+
+        Trailing bytes that do not form a whole point are ignored.
+
+        :param buffer: raw lidar buffer
+        :return: numpy structured array with POINT_DTYPE
+        """
+        if buffer is None:
+            return numpy.empty(0, dtype=cls.POINT_DTYPE)
+        count = memoryview(buffer).nbytes // cls.POINT_DTYPE.itemsize
+        return numpy.frombuffer(buffer, dtype=cls.POINT_DTYPE, count=count)
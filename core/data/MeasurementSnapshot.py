@@ -0,0 +1,42 @@
+import carla
+from typing import Tuple, Union
+
+from ..Transform import Transform
+from ..Vector3 import Vector3
+
+
+class MeasurementSnapshot:
+    """
+    A picklable copy of a carla measurement.
+
+    It exposes the same attributes as the carla measurement it is taken from, with carla types replaced by the
+    data model classes, so it can be given to SensorData.from_carla_measurements in another process.
+    """
+
+    def __init__(self):
+        self.frame = 0
+        self.timestamp = 0.0
+        self.transform = Transform()
+        self.raw_data = None  # type: Union[bytes, None]
+
+    @classmethod
+    def from_carla_measurements(cls, measurements: carla.SensorData,
+                                attributes: Tuple[str, ...] = ()) -> 'MeasurementSnapshot':
+        """
+        Take a snapshot of a carla.SensorData instance.
+        :param measurements: cara.SensorData instance
+        :param attributes: extra measurement attributes to copy, see SensorData.MEASUREMENT_ATTRIBUTES
+        :return: MeasurementSnapshot instance
+        """
+        snapshot = cls()
+        snapshot.frame = measurements.frame
+        snapshot.timestamp = measurements.timestamp
+        snapshot.transform = Transform.from_carla_transform(measurements.transform)
+        if hasattr(measurements, 'raw_data'):
+            snapshot.raw_data = bytes(measurements.raw_data)
+        for key in attributes:
+            value = getattr(measurements, key)
+            if isinstance(value, carla.Vector3D):
+                value = Vector3.from_carla_vector3d(value)
+            setattr(snapshot, key, value)
+        return snapshot
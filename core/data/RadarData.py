@@ -1,14 +1,26 @@
 import carla
-from typing import List
+import numpy
+from typing import Sequence, Optional, overload
 
+from .BufferPool import BufferPool
 from .SensorData import SensorData
 
 
 class RadarData(SensorData):
     """
     A class to store Radar data.
+
+    Detections are decoded from the raw buffer as a whole. Derived arrays are computed on first access and cached.
     """
 
+    BUFFER_VIEWS = ('detections', '_cache')
+    DETECTION_DTYPE = numpy.dtype([  # memory layout of carla.RadarDetection
+        ('velocity', numpy.float32),
+        ('azimuth', numpy.float32),
+        ('altitude', numpy.float32),
+        ('depth', numpy.float32),
+    ])
+
     class Point:
         """
         A point in the radar data.
@@ -19,27 +31,116 @@ class RadarData(SensorData):
             self.depth = depth
             self.velocity = velocity
 
+    class PointsView(Sequence):
+        """
+        A lazy, read-only sequence view of RadarData.Point over the (N, 4) point array.
+
+        Point objects are only created when an item is accessed, kept for backward compatibility.
+        """
+        def __init__(self, points_ndarray: numpy.ndarray):
+            self._points_ndarray = points_ndarray
+
+        def __len__(self) -> int:
+            return len(self._points_ndarray)
+
+        @overload
+        def __getitem__(self, index: int) -> 'RadarData.Point': ...
+
+        @overload
+        def __getitem__(self, index: slice) -> 'RadarData.PointsView': ...
+
+        def __getitem__(self, index):
+            if isinstance(index, slice):
+                return RadarData.PointsView(self._points_ndarray[index])
+            return RadarData.Point(*(float(v) for v in self._points_ndarray[index]))
+
     def __init__(self):
         super().__init__()
-        self.points = []  # type: List[RadarData.Point]
+        self.detections = numpy.empty(0, dtype=self.DETECTION_DTYPE)  # type: numpy.ndarray
+        self._cache = {}
+
+    @property
+    def points(self) -> 'RadarData.PointsView':
+        """
+        [Read-Only] A lazy sequence of RadarData.Point, prefer points_ndarray for heavy work.
+        """
+        return RadarData.PointsView(self.points_ndarray)
+
+    @property
+    def points_count(self) -> int:
+        """
+        [Read-Only] Number of detections in the frame.
+        """
+        return len(self.detections)
+
+    @property
+    def points_ndarray(self) -> numpy.ndarray:
+        """
+        [Read-Only] A (N, 4) float32 array in altitude, azimuth, depth, velocity order.
+        """
+        if 'points_ndarray' not in self._cache:
+            d = self.detections
+            self._cache['points_ndarray'] = numpy.column_stack(
+                (d['altitude'], d['azimuth'], d['depth'], d['velocity'])).astype(numpy.float32, copy=False)
+        return self._cache['points_ndarray']
+
+    @property
+    def directions(self) -> numpy.ndarray:
+        """
+        [Read-Only] A (N, 3) float32 array of unit vectors from the sensor to each detection, in the sensor frame.
+
+        Coordinate system is defined as same as UE4 and CARLA: X-axis forward, Y-axis right, Z-axis up.
+        """
+        if 'directions' not in self._cache:
+            altitude = self.detections['altitude']
+            azimuth = self.detections['azimuth']
+            cos_altitude = numpy.cos(altitude)
+            self._cache['directions'] = numpy.column_stack((
+                cos_altitude * numpy.cos(azimuth),
+                cos_altitude * numpy.sin(azimuth),
+                numpy.sin(altitude),
+            )).astype(numpy.float32, copy=False)
+        return self._cache['directions']
+
+    @property
+    def positions(self) -> numpy.ndarray:
+        """
+        [Read-Only] A (N, 3) float32 array of detection positions in meters, in the sensor frame.
+        """
+        if 'positions' not in self._cache:
+            self._cache['positions'] = self.directions * self.detections['depth'][:, numpy.newaxis]
+        return self._cache['positions']
+
+    @property
+    def radial_velocities(self) -> numpy.ndarray:
+        """
+        [Read-Only] A (N, 3) float32 array of radial velocity components in m/s, in the sensor frame.
+        """
+        if 'radial_velocities' not in self._cache:
+            self._cache['radial_velocities'] = self.directions * self.detections['velocity'][:, numpy.newaxis]
+        return self._cache['radial_velocities']
 
     @classmethod
-    def from_carla_measurements(cls, measurements: carla.RadarMeasurement) -> 'RadarData':
+    def from_carla_measurements(cls, measurements: carla.RadarMeasurement, *,
+                                buffer_pool: Optional[BufferPool] = None) -> 'RadarData':
         """
         Load data from a carla.RadarMeasurement instance.
         :param measurements: cara.RadarMeasurement instance
+        :param buffer_pool: Optional, a BufferPool to take the raw buffer from
         :return: SensorData instance
         """
         data = cls()  # type: RadarData
-        data = cls.initialize_sensor_basic_data(data, measurements)
-
-        # special gnss data
-        for detection in measurements:
-            data.points.append(RadarData.Point(
-                detection.altitude,
-                detection.azimuth,
-                detection.depth,
-                detection.velocity
-            ))
-
+        data = cls.initialize_sensor_basic_data(data, measurements, buffer_pool=buffer_pool)
         return data
+
+    def bind_buffer_views(self):
+        """
+        Build detections on the owned buffer and drop cached arrays.
+        """
+        self._cache = {}
+        raw_view = self.raw_view
+        if raw_view is None:
+            self.detections = numpy.empty(0, dtype=self.DETECTION_DTYPE)
+            return
+        count = raw_view.nbytes // self.DETECTION_DTYPE.itemsize
+        self.detections = numpy.frombuffer(raw_view, dtype=self.DETECTION_DTYPE, count=count)
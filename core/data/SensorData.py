@@ -1,36 +1,145 @@
+import copy
 import time
+import pickle
 import carla
-from typing import Union
+import numpy
+from typing import Union, Optional, Tuple
 
+from .BufferPool import BufferPool
 from ..Transform import Transform
 
 
+def _restore_sensor_data(cls, buffer, state: dict) -> 'SensorData':
+    """
+    Rebuild a SensorData instance from a pickled buffer and state. Used by SensorData.__reduce__.
+    """
+    data = cls.__new__(cls)
+    data.__dict__.update(state)
+    data._buffer = buffer
+    data.bind_buffer_views()
+    return data
+
+
 class SensorData:
+    """
+    A base class to store sensor data.
+
+    Each data instance owns exactly one raw buffer. Derived fields such as ImageData.image or LidarData.points_array
+    are views on that buffer and are listed in BUFFER_VIEWS so that pickling serializes the buffer only once.
+    """
+
+    BUFFER_VIEWS = ()  # type: Tuple[str, ...]  # attribute names built from the owned buffer
+    MEASUREMENT_ATTRIBUTES = ()  # type: Tuple[str, ...]  # carla measurement attributes read besides the basics
 
     def __init__(self):
         self.frame = 0
         self.timestamp_carla = 0.0
         self.timestamp_wall = 0.0
         self.transform = None  # type: Union[None, Transform]
-        self.raw_data = None
+        self._buffer = None  # type: Union[None, bytes, bytearray, memoryview, numpy.ndarray]  # the only owned buffer
+        self._buffer_size = 0
+
+    def __reduce__(self):
+        return _restore_sensor_data, (self.__class__, self.raw_data, self._reduce_state())
+
+    def __reduce_ex__(self, protocol):
+        # protocol 5 allows the buffer to be written without an extra copy, or even out-of-band
+        raw_view = self.raw_view
+        if protocol < 5 or raw_view is None:
+            return self.__reduce__()
+        return _restore_sensor_data, (self.__class__, pickle.PickleBuffer(raw_view), self._reduce_state())
+
+    @property
+    def raw_data(self) -> Optional[bytes]:
+        """
+        [Read-Only] A copy of the raw data as bytes, None if the measurement has no raw data.
+
+        Each access copies the buffer, use raw_view to read it without a copy.
+        """
+        if self._buffer is None:
+            return None
+        return bytes(self.raw_view)
+
+    @property
+    def raw_view(self) -> Optional[memoryview]:
+        """
+        [Read-Only] A read-only view of the owned raw buffer, None if the measurement has no raw data.
+        """
+        if self._buffer is None:
+            return None
+        return memoryview(self._buffer).cast('B')[:self._buffer_size].toreadonly()
 
     @classmethod
-    def from_carla_measurements(cls, measurements: carla.SensorData) -> 'SensorData':
+    def from_carla_measurements(cls, measurements: carla.SensorData, *,
+                                buffer_pool: Optional[BufferPool] = None) -> 'SensorData':
         """
         Load data from a carla.SensorData instance.
         :param measurements: cara.SensorData instance
+        :param buffer_pool: Optional, a BufferPool to take the raw buffer from
         :return: SensorData instance
         """
         data = cls()
-        data = cls.initialize_sensor_basic_data(data, measurements)
+        data = cls.initialize_sensor_basic_data(data, measurements, buffer_pool=buffer_pool)
         return data
 
     @staticmethod
-    def initialize_sensor_basic_data(data, measurements: carla.SensorData):
+    def initialize_sensor_basic_data(data, measurements: carla.SensorData, *,
+                                     buffer_pool: Optional[BufferPool] = None):
         data.frame = measurements.frame
         data.timestamp_carla = measurements.timestamp
         data.timestamp_wall = time.time()
         data.transform = Transform.from_carla_transform(measurements.transform)
         if hasattr(measurements, 'raw_data'):
-            data.raw_data = bytes(measurements.raw_data)  # avoid 'memoryview' object
+            data.set_raw_data(measurements.raw_data, buffer_pool=buffer_pool)
         return data
+
+    def set_raw_data(self, raw_data, *, buffer_pool: Optional[BufferPool] = None) -> 'SensorData':
+        """
+        Copy raw data into the owned buffer. This is the only copy made of the measurement raw data.
+
+        The raw data of a carla measurement is only valid while the measurement is alive, so it must be copied once.
+
+        :param raw_data: a bytes-like object
+        :param buffer_pool: Optional, a BufferPool to take the buffer from
+        :return: return self for method chaining.
+        """
+        raw_data = memoryview(raw_data).cast('B')
+        size = raw_data.nbytes
+        buffer = bytearray(size) if buffer_pool is None else buffer_pool.acquire(size)
+        buffer[:size] = raw_data
+        self._buffer = buffer
+        self._buffer_size = size
+        self.bind_buffer_views()
+        return self
+
+    def copy(self, *, buffer_pool: Optional[BufferPool] = None) -> 'SensorData':
+        """
+        Create a deep copy owning a new buffer.
+        :param buffer_pool: Optional, a BufferPool to take the new buffer from
+        :return: SensorData instance
+        """
+        raw_view = self.raw_view
+        buffer = None
+        if raw_view is not None:
+            buffer = bytearray(raw_view) if buffer_pool is None else buffer_pool.acquire(raw_view.nbytes)
+            buffer[:raw_view.nbytes] = raw_view
+        return _restore_sensor_data(self.__class__, buffer, copy.deepcopy(self._reduce_state()))
+
+    def bind_buffer_views(self):
+        """
+        Build the views listed in BUFFER_VIEWS on the owned buffer.
+
+        Subclasses with derived views should override this method.
+        :return: None
+        """
+        pass
+
+    def _reduce_state(self) -> dict:
+        """
+        Instance state for pickling, without the owned buffer and its views.
+        """
+        state = self.__dict__.copy()
+        state.pop('_buffer', None)
+        for name in self.BUFFER_VIEWS:
+            state.pop(name, None)
+        return state
@@ -32,18 +32,35 @@ class VehicleStatusData:
         self.wheel_steer_angle_RL = None  # type: Union[float, None]
         self.wheel_steer_angle_RR = None  # type: Union[float, None]
 
+    @property
+    def has_wheel_steer_angles(self) -> bool:
+        """
+        [Read-Only] Whether the wheel steer angles are loaded.
+        """
+        return self.wheel_steer_angle_FL is not None
+
     @classmethod
-    def from_carla_vehicle(cls, vehicle: carla.Vehicle) -> 'VehicleStatusData':
+    def from_carla_vehicle(cls,
+                           vehicle: carla.Vehicle,
+                           *,
+                           actor_snapshot: Union[carla.ActorSnapshot, None] = None,
+                           wheel_steer_angles: bool = True) -> 'VehicleStatusData':
         """
         Create a VehicleStatusData instance from a carla.VehicleControl instance.
+
+        :param vehicle: carla.Vehicle instance
+        :param actor_snapshot: Optional, the carla.ActorSnapshot of the vehicle to read velocity and acceleration from
+                               instead of one RPC each
+        :param wheel_steer_angles: Optional, whether to read the four wheel steer angles, one RPC each
         """
-        data = cls.__new__(cls)
+        data = cls()
         # direct return if vehicle is None
         if vehicle is None:
             return data
         # basic info
-        data.velocity = Vector3.from_carla_vector3d(vehicle.get_velocity())
-        data.acceleration = Vector3.from_carla_vector3d(vehicle.get_acceleration())
+        source = actor_snapshot if actor_snapshot is not None else vehicle
+        data.velocity = Vector3.from_carla_vector3d(source.get_velocity())
+        data.acceleration = Vector3.from_carla_vector3d(source.get_acceleration())
         data.speed = data.velocity.magnitude
         # basic control info
         if not isinstance(vehicle, carla.Vehicle):
@@ -57,8 +74,19 @@ class VehicleStatusData:
         data.manual_gear_shift = control.manual_gear_shift
         data.gear = control.gear
         # steer angles
-        data.wheel_steer_angle_FL = vehicle.get_wheel_steer_angle(carla.VehicleWheelLocation.FL_Wheel)
-        data.wheel_steer_angle_FR = vehicle.get_wheel_steer_angle(carla.VehicleWheelLocation.FR_Wheel)
-        data.wheel_steer_angle_RL = vehicle.get_wheel_steer_angle(carla.VehicleWheelLocation.BL_Wheel)
-        data.wheel_steer_angle_RR = vehicle.get_wheel_steer_angle(carla.VehicleWheelLocation.BR_Wheel)
+        if wheel_steer_angles:
+            data.load_wheel_steer_angles(vehicle)
         return data
+
+    def load_wheel_steer_angles(self, vehicle: carla.Vehicle) -> 'VehicleStatusData':
+        """
+        Read the four wheel steer angles of a vehicle.
+
+        :param vehicle: carla.Vehicle instance
+        :return: return self for method chaining.
+        """
+        self.wheel_steer_angle_FL = vehicle.get_wheel_steer_angle(carla.VehicleWheelLocation.FL_Wheel)
+        self.wheel_steer_angle_FR = vehicle.get_wheel_steer_angle(carla.VehicleWheelLocation.FR_Wheel)
+        self.wheel_steer_angle_RL = vehicle.get_wheel_steer_angle(carla.VehicleWheelLocation.BL_Wheel)
+        self.wheel_steer_angle_RR = vehicle.get_wheel_steer_angle(carla.VehicleWheelLocation.BR_Wheel)
+        return self
@@ -1,17 +1,25 @@
+from .BufferPool import BufferPool
 from .SensorData import SensorData
 from .VehicleStatusData import VehicleStatusData
+from .FleetStatus import FleetStatus
 from .ImageData import ImageData
 from .ImuData import ImuData
 from .GnssData import GnssData
 from .RadarData import RadarData
 from .LidarData import LidarData
+from .FrameHistory import FrameHistory
+from .MeasurementSnapshot import MeasurementSnapshot
 
 __all__ = [
+    'BufferPool',
     'SensorData',
     'VehicleStatusData',
+    'FleetStatus',
     'ImageData',
     'ImuData',
     'GnssData',
     'RadarData',
     'LidarData',
+    'FrameHistory',
+    'MeasurementSnapshot',
 ]
\ No newline at end of file
@@ -0,0 +1,1217 @@
+"""
+A pure-Python stand-in for the carla module, for tests and benchmarks on a machine without a carla server.
+
+It implements the subset of the carla PythonAPI used by this package: Client, World, world settings and snapshots,
+blueprints, spawn and destroy, apply_batch() and apply_batch_sync(), vehicle controls and sensors with listen().
+Sensors generate synthetic camera, LiDAR, radar, IMU and GNSS measurements. Their rate and size follow the usual
+blueprint attributes: sensor_tick, image_size_x, image_size_y, channels, points_per_second, rotation_frequency.
+
+Put this directory on the module search path so that it is imported as carla, e.g.
+
+    PYTHONPATH=<repository>/fake python -m <package>.benchmark.FakeBackendBenchmark
+
+Every host:port is served by one in-process FakeServer, returned by get_fake_server(). Use it to inject latency,
+to make the server unavailable or to restart it with a new episode.
+"""
+import os
+import math
+import time
+import heapq
+import fnmatch
+import itertools
+import traceback
+import numpy
+from threading import Thread, RLock, Condition, current_thread
+from typing import Callable, Dict, List, Tuple, Union
+
+from . import command
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# geometry
+# ---------------------------------------------------------------------------------------------------------------------
+
+class Vector3D:
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Vector3D) and (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __add__(self, other: 'Vector3D') -> 'Vector3D':
+        return type(self)(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: 'Vector3D') -> 'Vector3D':
+        return type(self)(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, scale: float) -> 'Vector3D':
+        return type(self)(self.x * scale, self.y * scale, self.z * scale)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(x={self.x:.6f}, y={self.y:.6f}, z={self.z:.6f})'
+
+    def length(self) -> float:
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+
+class Location(Vector3D):
+    def distance(self, other: 'Location') -> float:
+        return (self - other).length()
+
+
+class Rotation:
+    def __init__(self, pitch: float = 0.0, yaw: float = 0.0, roll: float = 0.0):
+        self.pitch = float(pitch)
+        self.yaw = float(yaw)
+        self.roll = float(roll)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Rotation) and \
+            (self.pitch, self.yaw, self.roll) == (other.pitch, other.yaw, other.roll)
+
+    def __repr__(self) -> str:
+        return f'Rotation(pitch={self.pitch:.6f}, yaw={self.yaw:.6f}, roll={self.roll:.6f})'
+
+    def get_forward_vector(self) -> Vector3D:
+        pitch, yaw = math.radians(self.pitch), math.radians(self.yaw)
+        return Vector3D(math.cos(pitch) * math.cos(yaw), math.cos(pitch) * math.sin(yaw), math.sin(pitch))
+
+
+class Transform:
+    def __init__(self, location: Location = None, rotation: Rotation = None):
+        self.location = location if location is not None else Location()
+        self.rotation = rotation if rotation is not None else Rotation()
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Transform) and self.location == other.location and self.rotation == other.rotation
+
+    def __repr__(self) -> str:
+        return f'Transform({self.location}, {self.rotation})'
+
+    def get_forward_vector(self) -> Vector3D:
+        return self.rotation.get_forward_vector()
+
+    def transform(self, location: Location) -> Location:
+        """
+        Convert a location relative to this transform into world space. Only the yaw is applied.
+        """
+        yaw = math.radians(self.rotation.yaw)
+        cos_yaw, sin_yaw = math.cos(yaw), math.sin(yaw)
+        return Location(self.location.x + location.x * cos_yaw - location.y * sin_yaw,
+                        self.location.y + location.x * sin_yaw + location.y * cos_yaw,
+                        self.location.z + location.z)
+
+
+def _copy_transform(transform: Transform) -> Transform:
+    location, rotation = transform.location, transform.rotation
+    return Transform(Location(location.x, location.y, location.z),
+                     Rotation(rotation.pitch, rotation.yaw, rotation.roll))
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# settings and controls
+# ---------------------------------------------------------------------------------------------------------------------
+
+class _Record:
+    """
+    A plain record compared by value, like the carla control structures.
+    """
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({", ".join(f"{k}={v}" for k, v in vars(self).items())})'
+
+
+class WorldSettings(_Record):
+    def __init__(self, synchronous_mode: bool = False, no_rendering_mode: bool = False,
+                 fixed_delta_seconds: Union[float, None] = None):
+        self.synchronous_mode = synchronous_mode
+        self.no_rendering_mode = no_rendering_mode
+        self.fixed_delta_seconds = fixed_delta_seconds
+
+
+class Timestamp(_Record):
+    def __init__(self, frame: int = 0, elapsed_seconds: float = 0.0, delta_seconds: float = 0.0,
+                 platform_timestamp: float = 0.0):
+        self.frame = frame
+        self.elapsed_seconds = elapsed_seconds
+        self.delta_seconds = delta_seconds
+        self.platform_timestamp = platform_timestamp
+
+
+class VehicleControl(_Record):
+    def __init__(self, throttle: float = 0.0, steer: float = 0.0, brake: float = 0.0, hand_brake: bool = False,
+                 reverse: bool = False, manual_gear_shift: bool = False, gear: int = 0):
+        self.throttle = throttle
+        self.steer = steer
+        self.brake = brake
+        self.hand_brake = hand_brake
+        self.reverse = reverse
+        self.manual_gear_shift = manual_gear_shift
+        self.gear = gear
+
+
+class VehicleAckermannControl(_Record):
+    def __init__(self, steer: float = 0.0, steer_speed: float = 0.0, speed: float = 0.0, acceleration: float = 0.0,
+                 jerk: float = 0.0):
+        self.steer = steer
+        self.steer_speed = steer_speed
+        self.speed = speed
+        self.acceleration = acceleration
+        self.jerk = jerk
+
+
+class AckermannControllerSettings(_Record):
+    def __init__(self, speed_kp: float = 0.15, speed_ki: float = 0.0, speed_kd: float = 0.25,
+                 accel_kp: float = 0.01, accel_ki: float = 0.0, accel_kd: float = 0.01):
+        self.speed_kp = speed_kp
+        self.speed_ki = speed_ki
+        self.speed_kd = speed_kd
+        self.accel_kp = accel_kp
+        self.accel_ki = accel_ki
+        self.accel_kd = accel_kd
+
+
+class VehicleWheelLocation:
+    FL_Wheel = 0
+    FR_Wheel = 1
+    BL_Wheel = 2
+    BR_Wheel = 3
+    Front_Wheel = 0
+    Back_Wheel = 2
+
+
+class ColorConverter:
+    Raw = 0
+    Depth = 1
+    LogarithmicDepth = 2
+    CityScapesPalette = 3
+
+
+class AttachmentType:
+    Rigid = 0
+    SpringArm = 1
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# blueprints
+# ---------------------------------------------------------------------------------------------------------------------
+
+class ActorAttribute:
+    def __init__(self, attribute_id: str, value: str, *, is_modifiable: bool = True, recommended_values=()):
+        self.id = attribute_id
+        self.type = 'str'
+        self.is_modifiable = is_modifiable
+        self.recommended_values = list(recommended_values) if recommended_values else [value]
+        self._value = value
+
+    def __str__(self) -> str:
+        return self._value
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ActorAttribute):
+            return self._value == other._value
+        return self._value == str(other)
+
+    def as_str(self) -> str:
+        return self._value
+
+    def as_int(self) -> int:
+        return int(float(self._value))
+
+    def as_float(self) -> float:
+        return float(self._value)
+
+    def as_bool(self) -> bool:
+        return self._value.lower() in ('true', '1')
+
+
+class ActorBlueprint:
+    def __init__(self, blueprint_id: str, attributes: Dict[str, ActorAttribute], tags: Tuple[str, ...] = ()):
+        self.id = blueprint_id
+        self.tags = list(tags)
+        self._attributes = attributes
+
+    def __iter__(self):
+        return iter(list(self._attributes.values()))
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def has_tag(self, tag: str) -> bool:
+        return tag in self.tags
+
+    def has_attribute(self, attribute_id: str) -> bool:
+        return attribute_id in self._attributes
+
+    def get_attribute(self, attribute_id: str) -> ActorAttribute:
+        if attribute_id not in self._attributes:
+            raise IndexError(f'no such attribute {attribute_id}')
+        return self._attributes[attribute_id]
+
+    def set_attribute(self, attribute_id: str, value: str):
+        attribute = self.get_attribute(attribute_id)
+        if not attribute.is_modifiable:
+            raise RuntimeError(f'attribute {attribute_id} is not modifiable')
+        self._attributes[attribute_id] = ActorAttribute(attribute_id, str(value),
+                                                        recommended_values=attribute.recommended_values)
+
+    def _copy(self) -> 'ActorBlueprint':
+        return ActorBlueprint(self.id, dict(self._attributes), tuple(self.tags))
+
+    def _as_dict(self) -> Dict[str, str]:
+        return {key: attribute.as_str() for key, attribute in self._attributes.items()}
+
+
+class BlueprintLibrary:
+    def __init__(self, blueprints: List[ActorBlueprint]):
+        self._blueprints = blueprints
+
+    def __iter__(self):
+        return iter(self._blueprints)
+
+    def __len__(self) -> int:
+        return len(self._blueprints)
+
+    def __getitem__(self, index: int) -> ActorBlueprint:
+        return self._blueprints[index]
+
+    def find(self, blueprint_id: str) -> ActorBlueprint:
+        for blueprint in self._blueprints:
+            if blueprint.id == blueprint_id:
+                return blueprint._copy()
+        raise IndexError(f'blueprint {blueprint_id} not found')
+
+    def filter(self, wildcard_pattern: str) -> 'BlueprintLibrary':
+        return BlueprintLibrary([b._copy() for b in self._blueprints if fnmatch.fnmatch(b.id, wildcard_pattern)])
+
+
+D_VEHICLE_BLUEPRINTS = (
+    'vehicle.tesla.model3',
+    'vehicle.lincoln.mkz_2020',
+    'vehicle.audi.tt',
+    'vehicle.mercedes.coupe_2020',
+    'vehicle.nissan.patrol',
+    'vehicle.carlamotors.carlacola',
+)
+D_SENSOR_BLUEPRINTS = {  # blueprint id -> attributes besides role_name and sensor_tick, carla defaults
+    'sensor.camera.rgb': {'image_size_x': '800', 'image_size_y': '600', 'fov': '90.0'},
+    'sensor.camera.depth': {'image_size_x': '800', 'image_size_y': '600', 'fov': '90.0'},
+    'sensor.camera.semantic_segmentation': {'image_size_x': '800', 'image_size_y': '600', 'fov': '90.0'},
+    'sensor.lidar.ray_cast': {'channels': '32', 'range': '10.0', 'points_per_second': '56000',
+                              'rotation_frequency': '10.0', 'upper_fov': '10.0', 'lower_fov': '-30.0'},
+    'sensor.other.radar': {'horizontal_fov': '30.0', 'vertical_fov': '30.0', 'range': '100.0',
+                           'points_per_second': '1500'},
+    'sensor.other.imu': {'noise_accel_stddev_x': '0.0', 'noise_gyro_stddev_z': '0.0'},
+    'sensor.other.gnss': {'noise_alt_bias': '0.0', 'noise_lat_bias': '0.0', 'noise_lon_bias': '0.0'},
+}
+
+
+def _new_blueprint_library() -> BlueprintLibrary:
+    blueprints = []
+    for blueprint_id in D_VEHICLE_BLUEPRINTS:
+        attributes = {
+            'role_name': ActorAttribute('role_name', 'autopilot', recommended_values=('autopilot', 'hero')),
+            'color': ActorAttribute('color', '255,0,0', recommended_values=('255,0,0', '0,0,255', '255,255,255')),
+            'number_of_wheels': ActorAttribute('number_of_wheels', '4', is_modifiable=False),
+        }
+        blueprints.append(ActorBlueprint(blueprint_id, attributes, ('vehicle',)))
+    for blueprint_id, defaults in D_SENSOR_BLUEPRINTS.items():
+        attributes = {
+            'role_name': ActorAttribute('role_name', 'front'),
+            'sensor_tick': ActorAttribute('sensor_tick', '0.0'),
+        }
+        attributes.update({key: ActorAttribute(key, value) for key, value in defaults.items()})
+        blueprints.append(ActorBlueprint(blueprint_id, attributes, ('sensor',)))
+    return BlueprintLibrary(blueprints)
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# measurements
+# ---------------------------------------------------------------------------------------------------------------------
+
+class SensorData:
+    def __init__(self, frame: int, timestamp: float, transform: Transform):
+        self.frame = frame
+        self.timestamp = timestamp
+        self.transform = transform
+
+
+class Image(SensorData):
+    def __init__(self, frame: int, timestamp: float, transform: Transform, *,
+                 width: int, height: int, fov: float, raw_data: memoryview):
+        super().__init__(frame, timestamp, transform)
+        self.width = width
+        self.height = height
+        self.fov = fov
+        self.raw_data = raw_data
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def convert(self, color_converter: int):
+        pass
+
+
+class LidarMeasurement(SensorData):
+    def __init__(self, frame: int, timestamp: float, transform: Transform, *,
+                 channels: int, horizontal_angle: float, raw_data: memoryview):
+        super().__init__(frame, timestamp, transform)
+        self.channels = channels
+        self.horizontal_angle = horizontal_angle
+        self.raw_data = raw_data
+
+    def __len__(self) -> int:
+        return self.raw_data.nbytes // 16
+
+    def get_point_count(self, channel: int) -> int:
+        count, rest = divmod(len(self), self.channels)
+        return count + (1 if channel < rest else 0)
+
+
+class RadarDetection:
+    def __init__(self, velocity: float = 0.0, azimuth: float = 0.0, altitude: float = 0.0, depth: float = 0.0):
+        self.velocity = velocity
+        self.azimuth = azimuth
+        self.altitude = altitude
+        self.depth = depth
+
+
+class RadarMeasurement(SensorData):
+    def __init__(self, frame: int, timestamp: float, transform: Transform, *, raw_data: memoryview):
+        super().__init__(frame, timestamp, transform)
+        self.raw_data = raw_data
+
+    def __len__(self) -> int:
+        return self.raw_data.nbytes // 16
+
+    def get_detection_count(self) -> int:
+        return len(self)
+
+
+class IMUMeasurement(SensorData):
+    def __init__(self, frame: int, timestamp: float, transform: Transform, *,
+                 accelerometer: Vector3D, gyroscope: Vector3D, compass: float):
+        super().__init__(frame, timestamp, transform)
+        self.accelerometer = accelerometer
+        self.gyroscope = gyroscope
+        self.compass = compass
+
+
+class GnssMeasurement(SensorData):
+    def __init__(self, frame: int, timestamp: float, transform: Transform, *,
+                 latitude: float, longitude: float, altitude: float):
+        super().__init__(frame, timestamp, transform)
+        self.latitude = latitude
+        self.longitude = longitude
+        self.altitude = altitude
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# actors
+# ---------------------------------------------------------------------------------------------------------------------
+
+class Actor:
+    def __init__(self, server: 'FakeServer', actor_id: int, blueprint: ActorBlueprint, transform: Transform,
+                 parent: Union['Actor', None]):
+        self._server = server
+        self._episode_id = server.episode_id
+        self.id = actor_id
+        self.type_id = blueprint.id
+        self.attributes = blueprint._as_dict()
+        self.parent = parent
+        self.semantic_tags = []
+        # state, guarded by the server lock
+        self._transform = _copy_transform(transform)  # relative to the parent if attached
+        self._velocity = Vector3D()
+        self._angular_velocity = Vector3D()  # deg/s
+        self._acceleration = Vector3D()
+        self._simulate_physics = True
+        self._destroyed = False
+
+    def __repr__(self) -> str:
+        return f'Actor(id={self.id}, type={self.type_id})'
+
+    @property
+    def is_alive(self) -> bool:
+        return not self._destroyed and self._server.episode_id == self._episode_id
+
+    def get_world(self) -> 'World':
+        self._server._invoke_rpc()
+        return World(self._server, self._episode_id)
+
+    def get_transform(self) -> Transform:
+        self._server._invoke_rpc()
+        with self._server._lock:
+            return self._get_world_transform()
+
+    def get_location(self) -> Location:
+        return self.get_transform().location
+
+    def get_velocity(self) -> Vector3D:
+        self._server._invoke_rpc()
+        with self._server._lock:
+            return self._get_root()._velocity * 1.0
+
+    def get_angular_velocity(self) -> Vector3D:
+        self._server._invoke_rpc()
+        with self._server._lock:
+            return self._get_root()._angular_velocity * 1.0
+
+    def get_acceleration(self) -> Vector3D:
+        self._server._invoke_rpc()
+        with self._server._lock:
+            return self._get_root()._acceleration * 1.0
+
+    def set_transform(self, transform: Transform):
+        self._server._invoke_rpc()
+        with self._server._lock:
+            self._transform = _copy_transform(transform)
+
+    def set_location(self, location: Location):
+        self._server._invoke_rpc()
+        with self._server._lock:
+            self._transform.location = Location(location.x, location.y, location.z)
+
+    def set_simulate_physics(self, enabled: bool = True):
+        self._server._invoke_rpc()
+        self._simulate_physics = enabled
+
+    def destroy(self) -> bool:
+        self._server._invoke_rpc()
+        return self._server._invoke_destroy(self.id)
+
+    def _get_root(self) -> 'Actor':
+        actor = self
+        while actor.parent is not None:
+            actor = actor.parent
+        return actor
+
+    def _get_world_transform(self) -> Transform:
+        if self.parent is None:
+            return _copy_transform(self._transform)
+        parent_transform = self.parent._get_world_transform()
+        rotation = self._transform.rotation
+        return Transform(parent_transform.transform(self._transform.location),
+                         Rotation(parent_transform.rotation.pitch + rotation.pitch,
+                                  parent_transform.rotation.yaw + rotation.yaw,
+                                  parent_transform.rotation.roll + rotation.roll))
+
+    def _invoke_step(self, delta_seconds: float):
+        """
+        Advance the physics by one tick, called with the server lock held.
+        """
+        pass
+
+
+class Vehicle(Actor):
+    D_MAX_ACCELERATION = 4.0  # m/s^2 at full throttle
+    D_MAX_DECELERATION = 8.0  # m/s^2 at full brake
+    D_DRAG = 0.05  # 1/s
+    D_MAX_STEER_ANGLE = 70.0  # degrees at full steer
+    D_WHEELBASE = 2.9  # meters
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._control = VehicleControl()
+        self._ackermann_control = None  # type: Union[VehicleAckermannControl, None]  # the latest control kind wins
+        self._ackermann_settings = AckermannControllerSettings()
+        self._speed = 0.0  # m/s along the heading, negative in reverse
+        self._steer_angle = 0.0  # degrees of the front wheels
+        self._wheel_steer_directions = {}  # type: Dict[int, float]
+
+    def apply_control(self, control: VehicleControl):
+        self._server._invoke_rpc()
+        self._invoke_apply_control(control)
+
+    def apply_ackermann_control(self, control: VehicleAckermannControl):
+        self._server._invoke_rpc()
+        self._invoke_apply_ackermann_control(control)
+
+    def get_control(self) -> VehicleControl:
+        self._server._invoke_rpc()
+        with self._server._lock:
+            return VehicleControl(**vars(self._control))
+
+    def get_ackermann_controller_settings(self) -> AckermannControllerSettings:
+        self._server._invoke_rpc()
+        return AckermannControllerSettings(**vars(self._ackermann_settings))
+
+    def apply_ackermann_controller_settings(self, settings: AckermannControllerSettings):
+        self._server._invoke_rpc()
+        self._ackermann_settings = AckermannControllerSettings(**vars(settings))
+
+    def get_wheel_steer_angle(self, wheel_location: int) -> float:
+        self._server._invoke_rpc()
+        with self._server._lock:
+            if wheel_location in self._wheel_steer_directions:
+                return self._wheel_steer_directions[wheel_location]
+            if wheel_location in (VehicleWheelLocation.FL_Wheel, VehicleWheelLocation.FR_Wheel):
+                return self._steer_angle
+            return 0.0
+
+    def set_wheel_steer_direction(self, wheel_location: int, angle_in_deg: float):
+        self._server._invoke_rpc()
+        with self._server._lock:
+            self._wheel_steer_directions[wheel_location] = float(angle_in_deg)
+
+    def _invoke_apply_control(self, control: VehicleControl):
+        with self._server._lock:
+            self._control = VehicleControl(**vars(control))
+            self._ackermann_control = None
+
+    def _invoke_apply_ackermann_control(self, control: VehicleAckermannControl):
+        with self._server._lock:
+            self._ackermann_control = VehicleAckermannControl(**vars(control))
+
+    def _invoke_step(self, delta_seconds: float):
+        if not self._simulate_physics or delta_seconds <= 0.0:
+            return
+        speed = self._speed
+        if self._ackermann_control is not None:
+            control = self._ackermann_control
+            acceleration = abs(control.acceleration) or self.D_MAX_ACCELERATION
+            step = acceleration * delta_seconds
+            speed = min(control.speed, speed + step) if control.speed > speed else max(control.speed, speed - step)
+            self._steer_angle = math.degrees(control.steer)
+        else:
+            control = self._control
+            direction = -1.0 if control.reverse else 1.0
+            speed += direction * control.throttle * self.D_MAX_ACCELERATION * delta_seconds
+            braking = 1.0 if control.hand_brake else control.brake
+            if braking > 0.0:
+                step = braking * self.D_MAX_DECELERATION * delta_seconds
+                speed = max(0.0, speed - step) if speed > 0.0 else min(0.0, speed + step)
+            speed -= speed * self.D_DRAG * delta_seconds
+            self._steer_angle = control.steer * self.D_MAX_STEER_ANGLE
+        # kinematic bicycle model
+        yaw_rate = speed * math.tan(math.radians(self._steer_angle)) / self.D_WHEELBASE  # rad/s
+        rotation = self._transform.rotation
+        rotation.yaw = (rotation.yaw + math.degrees(yaw_rate * delta_seconds) + 180.0) % 360.0 - 180.0
+        velocity = rotation.get_forward_vector() * speed
+        self._transform.location = self._transform.location + Location(velocity.x, velocity.y, velocity.z) * \
+            delta_seconds
+        self._acceleration = (velocity - self._velocity) * (1.0 / delta_seconds)
+        self._velocity = velocity
+        self._angular_velocity = Vector3D(0.0, 0.0, math.degrees(yaw_rate))
+        self._speed = speed
+
+
+class Sensor(Actor):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._callback = None  # type: Union[Callable[[SensorData], None], None]
+        self._time_next = 0.0  # simulation seconds of the next measurement
+        self._payloads = {}  # type: Dict[int, memoryview]  # payload size -> synthetic raw data
+
+    def listen(self, callback: Callable[[SensorData], None]):
+        self._server._invoke_rpc()
+        with self._server._lock:
+            self._callback = callback
+            self._time_next = 0.0
+
+    def stop(self):
+        self._server._invoke_rpc()
+        with self._server._lock:
+            self._callback = None
+
+    def is_listening(self) -> bool:
+        return self._callback is not None
+
+    def _get_attribute(self, key: str, default: float = 0.0) -> float:
+        value = self.attributes.get(key)
+        return float(value) if value is not None else default
+
+    def _get_payload(self, size: int, factory: Callable[[int], numpy.ndarray]) -> memoryview:
+        """
+        Get the synthetic raw data of a size, generated once per sensor and size.
+        """
+        payload = self._payloads.get(size)
+        if payload is None:
+            payload = memoryview(factory(size).tobytes()).toreadonly()
+            self._payloads[size] = payload
+        return payload
+
+    def _invoke_measure(self, frame: int, elapsed_seconds: float, delta_seconds: float) -> Union[SensorData, None]:
+        """
+        Create the measurement of this tick if it is due, called with the server lock held.
+        """
+        if self._callback is None or elapsed_seconds + 1e-9 < self._time_next:
+            return None
+        self._time_next = elapsed_seconds + self._get_attribute('sensor_tick')
+        transform = self._get_world_transform()
+        root = self._get_root()
+        rng = self._server._random
+        if self.type_id.startswith('sensor.camera.'):
+            width, height = int(self._get_attribute('image_size_x', 800)), int(self._get_attribute('image_size_y', 600))
+            raw_data = self._get_payload(width * height * 4,
+                                         lambda size: rng.integers(0, 256, size, dtype=numpy.uint8))
+            return Image(frame, elapsed_seconds, transform, width=width, height=height,
+                         fov=self._get_attribute('fov', 90.0), raw_data=raw_data)
+        if self.type_id.startswith('sensor.lidar.'):
+            count = int(self._get_attribute('points_per_second', 56000) * delta_seconds)
+            lidar_range = self._get_attribute('range', 10.0)
+            raw_data = self._get_payload(count, lambda size: numpy.concatenate([
+                rng.uniform(-lidar_range, lidar_range, (size, 3)),
+                rng.uniform(0.0, 1.0, (size, 1))], axis=1).astype(numpy.float32))
+            angle = 2.0 * math.pi * self._get_attribute('rotation_frequency', 10.0) * elapsed_seconds
+            return LidarMeasurement(frame, elapsed_seconds, transform, channels=int(self._get_attribute('channels', 32)),
+                                    horizontal_angle=angle % (2.0 * math.pi), raw_data=raw_data)
+        if self.type_id == 'sensor.other.radar':
+            count = int(self._get_attribute('points_per_second', 1500) * delta_seconds)
+            radar_range = self._get_attribute('range', 100.0)
+            horizontal_fov = math.radians(self._get_attribute('horizontal_fov', 30.0))
+            vertical_fov = math.radians(self._get_attribute('vertical_fov', 30.0))
+            raw_data = self._get_payload(count, lambda size: numpy.stack([  # carla.RadarDetection memory layout
+                rng.uniform(-10.0, 10.0, size),
+                rng.uniform(-horizontal_fov / 2.0, horizontal_fov / 2.0, size),
+                rng.uniform(-vertical_fov / 2.0, vertical_fov / 2.0, size),
+                rng.uniform(0.0, radar_range, size)], axis=1).astype(numpy.float32))
+            return RadarMeasurement(frame, elapsed_seconds, transform, raw_data=raw_data)
+        if self.type_id == 'sensor.other.imu':
+            acceleration = root._acceleration
+            angular_velocity = root._angular_velocity
+            return IMUMeasurement(frame, elapsed_seconds, transform,
+                                  accelerometer=Vector3D(acceleration.x, acceleration.y, acceleration.z + 9.81),
+                                  gyroscope=Vector3D(*(math.radians(v) for v in (angular_velocity.x,
+                                                                                 angular_velocity.y,
+                                                                                 angular_velocity.z))),
+                                  compass=math.radians(transform.rotation.yaw + 90.0) % (2.0 * math.pi))
+        if self.type_id == 'sensor.other.gnss':
+            location = transform.location
+            return GnssMeasurement(frame, elapsed_seconds, transform,
+                                   latitude=-location.y / FakeServer.D_METERS_PER_DEGREE,
+                                   longitude=location.x / FakeServer.D_METERS_PER_DEGREE,
+                                   altitude=location.z)
+        return None
+
+
+class ActorList(list):
+    def find(self, actor_id: int) -> Union[Actor, None]:
+        for actor in self:
+            if actor.id == actor_id:
+                return actor
+        return None
+
+    def filter(self, wildcard_pattern: str) -> 'ActorList':
+        return ActorList(a for a in self if fnmatch.fnmatch(a.type_id, wildcard_pattern))
+
+
+class ActorSnapshot:
+    def __init__(self, actor: Actor):
+        root = actor._get_root()
+        self.id = actor.id
+        self._transform = actor._get_world_transform()
+        self._velocity = root._velocity * 1.0
+        self._angular_velocity = root._angular_velocity * 1.0
+        self._acceleration = root._acceleration * 1.0
+
+    def get_transform(self) -> Transform:
+        return _copy_transform(self._transform)
+
+    def get_velocity(self) -> Vector3D:
+        return self._velocity * 1.0
+
+    def get_angular_velocity(self) -> Vector3D:
+        return self._angular_velocity * 1.0
+
+    def get_acceleration(self) -> Vector3D:
+        return self._acceleration * 1.0
+
+
+class WorldSnapshot:
+    def __init__(self, episode_id: int, timestamp: Timestamp, actor_snapshots: Dict[int, ActorSnapshot]):
+        self.id = episode_id
+        self.frame = timestamp.frame
+        self.timestamp = timestamp
+        self._actor_snapshots = actor_snapshots
+
+    def __iter__(self):
+        return iter(self._actor_snapshots.values())
+
+    def __len__(self) -> int:
+        return len(self._actor_snapshots)
+
+    def has_actor(self, actor_id: int) -> bool:
+        return actor_id in self._actor_snapshots
+
+    def find(self, actor_id: int) -> Union[ActorSnapshot, None]:
+        return self._actor_snapshots.get(actor_id)
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# world and client
+# ---------------------------------------------------------------------------------------------------------------------
+
+class World:
+    def __init__(self, server: 'FakeServer', episode_id: int):
+        self._server = server
+        self._episode_id = episode_id
+
+    @property
+    def id(self) -> int:
+        return self._episode_id
+
+    def get_settings(self) -> WorldSettings:
+        self._invoke_rpc()
+        with self._server._lock:
+            return WorldSettings(**vars(self._server._settings))
+
+    def apply_settings(self, settings: WorldSettings) -> int:
+        self._invoke_rpc()
+        with self._server._lock:
+            self._server._settings = WorldSettings(**vars(settings))
+            return self._server._frame
+
+    def tick(self, seconds: float = 10.0) -> int:
+        self._invoke_rpc()
+        return self._server.invoke_tick()
+
+    def wait_for_tick(self, seconds: float = 10.0) -> WorldSnapshot:
+        self._invoke_rpc()
+        return self._server._invoke_wait_for_tick(seconds)
+
+    def get_snapshot(self) -> WorldSnapshot:
+        self._invoke_rpc()
+        with self._server._lock:
+            return self._server._snapshot
+
+    def get_blueprint_library(self) -> BlueprintLibrary:
+        self._invoke_rpc()
+        return self._server._blueprint_library.filter('*')
+
+    def get_actors(self, actor_ids: List[int] = None) -> ActorList:
+        self._invoke_rpc()
+        with self._server._lock:
+            actors = self._server._actors
+            if actor_ids is None:
+                return ActorList(actors.values())
+            return ActorList(actors[i] for i in actor_ids if i in actors)
+
+    def get_actor(self, actor_id: int) -> Union[Actor, None]:
+        self._invoke_rpc()
+        with self._server._lock:
+            return self._server._actors.get(actor_id)
+
+    def spawn_actor(self, blueprint: ActorBlueprint, transform: Transform, attach_to: Actor = None,
+                    attachment_type: int = AttachmentType.Rigid) -> Actor:
+        self._invoke_rpc()
+        return self._server._invoke_spawn(blueprint, transform, attach_to.id if attach_to is not None else None)
+
+    def try_spawn_actor(self, blueprint: ActorBlueprint, transform: Transform, attach_to: Actor = None,
+                        attachment_type: int = AttachmentType.Rigid) -> Union[Actor, None]:
+        try:
+            return self.spawn_actor(blueprint, transform, attach_to, attachment_type)
+        except RuntimeError:
+            return None
+
+    def _invoke_rpc(self):
+        self._server._invoke_rpc()
+        if self._episode_id != self._server.episode_id:
+            raise RuntimeError('trying to operate on a destroyed episode')
+
+
+class Client:
+    def __init__(self, host: str = '127.0.0.1', port: int = 2000, worker_threads: int = 0):
+        self._server = get_fake_server(host, port)
+        self._timeout = 5.0
+
+    def set_timeout(self, seconds: float):
+        self._timeout = seconds
+
+    def get_client_version(self) -> str:
+        return FakeServer.D_VERSION
+
+    def get_server_version(self) -> str:
+        self._server._invoke_rpc()
+        return FakeServer.D_VERSION
+
+    def get_available_maps(self) -> List[str]:
+        self._server._invoke_rpc()
+        return list(FakeServer.D_MAPS)
+
+    def get_world(self) -> World:
+        self._server._invoke_rpc()
+        return World(self._server, self._server.episode_id)
+
+    def load_world(self, map_name: str, reset_settings: bool = True) -> World:
+        self._server._invoke_rpc()
+        matches = [m for m in FakeServer.D_MAPS if m == map_name or m.rsplit('/', 1)[-1] == map_name]
+        if not matches:
+            raise RuntimeError(f'map not found: {map_name}')
+        self._server.invoke_restart(matches[0], reset_settings=reset_settings)
+        return World(self._server, self._server.episode_id)
+
+    def reload_world(self, reset_settings: bool = True) -> World:
+        self._server._invoke_rpc()
+        self._server.invoke_restart(reset_settings=reset_settings)
+        return World(self._server, self._server.episode_id)
+
+    def apply_batch(self, commands: list):
+        self._server._invoke_rpc()
+        for cmd in commands:
+            self._server._invoke_command(cmd)
+
+    def apply_batch_sync(self, commands: list, do_tick: bool = False) -> List[command.Response]:
+        self._server._invoke_rpc()
+        responses = [self._server._invoke_command(cmd) for cmd in commands]
+        if do_tick:
+            self._server.invoke_tick()
+        return responses
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# server
+# ---------------------------------------------------------------------------------------------------------------------
+
+class FakeServer:
+    """
+    The simulation state behind one host:port, shared by every Client connected to it.
+
+    In asynchronous mode the server ticks by itself every async_delta seconds. In synchronous mode it only ticks
+    on World.tick(). Sensor measurements are delivered to the listen() callbacks from a dispatch thread, after
+    the injected sensor latency.
+    """
+
+    D_VERSION = '0.9.15-fake'
+    D_MAPS = tuple(f'/Game/Carla/Maps/{name}' for name in (
+        'Town01', 'Town02', 'Town03', 'Town04', 'Town05', 'Town10HD_Opt'))
+    D_ASYNC_DELTA = 0.05  # in seconds
+    D_METERS_PER_DEGREE = 111319.49  # GNSS reference at latitude 0, longitude 0
+
+    _episode_ids = itertools.count(1)
+
+    def __init__(self, host: str, port: int, *, seed: int = 0):
+        """
+        Construct a FakeServer instance, use get_fake_server() to share it with clients.
+        :param host: host name the server is registered under
+        :param port: port the server is registered under
+        :param seed: seed of the synthetic measurements
+        """
+        self._host = host
+        self._port = port
+        self._random = numpy.random.default_rng(seed)
+        self._lock = RLock()
+        self._condition_tick = Condition(self._lock)
+        self._blueprint_library = _new_blueprint_library()
+        # options
+        self._available = True
+        self._rpc_latency = 0.0
+        self._tick_latency = 0.0
+        self._sensor_latency = 0.0
+        self._async_delta = self.D_ASYNC_DELTA
+        # episode
+        self._episode_id = 0
+        self._map_name = self.D_MAPS[-1]
+        self._settings = WorldSettings()
+        self._frame = 0
+        self._elapsed_seconds = 0.0
+        self._actors = {}  # type: Dict[int, Actor]
+        self._actor_ids = itertools.count(1)
+        self._snapshot = None  # type: Union[WorldSnapshot, None]
+        # counters
+        self._count_rpc = 0
+        self._count_measurements = 0
+        # sensor dispatch
+        self._dispatch_queue = []  # type: List[Tuple[float, int, Sensor, Callable, SensorData]]  # a heap
+        self._dispatch_seq = itertools.count()
+        self._condition_dispatch = Condition()
+        # threads
+        self._pid = None  # type: Union[int, None]  # process the threads run in, they do not survive a fork
+        self._threads = []  # type: List[Thread]
+        self._flag_stopped = False
+        self.invoke_restart()
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def available(self) -> bool:
+        """
+        [Read-Only] Whether the server answers, every call raises RuntimeError otherwise.
+        """
+        return self._available
+
+    @property
+    def episode_id(self) -> int:
+        """
+        [Read-Only] Id of the current episode, it is also the id of the carla.World.
+        """
+        return self._episode_id
+
+    @property
+    def map_name(self) -> str:
+        return self._map_name
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+    @property
+    def count_rpc(self) -> int:
+        """
+        [Read-Only] Number of calls answered by the server.
+        """
+        return self._count_rpc
+
+    @property
+    def count_measurements(self) -> int:
+        """
+        [Read-Only] Number of sensor measurements generated.
+        """
+        return self._count_measurements
+
+    @property
+    def count_actors(self) -> int:
+        with self._lock:
+            return len(self._actors)
+
+    def use_available(self, option: bool = True) -> 'FakeServer':
+        """
+        Make the server answer or not, to emulate a lost connection.
+        :param option: False to raise RuntimeError on every call
+        :return: return self for method chaining.
+        """
+        self._available = option
+        return self
+
+    def use_latency(self, *, rpc: float = 0.0, tick: float = 0.0, sensor: float = 0.0) -> 'FakeServer':
+        """
+        Inject latency, in seconds.
+        :param rpc: added to every call
+        :param tick: added to every tick, as the simulation and rendering time
+        :param sensor: from the tick to the delivery of a measurement
+        :return: return self for method chaining.
+        """
+        self._rpc_latency = rpc
+        self._tick_latency = tick
+        self._sensor_latency = sensor
+        return self
+
+    def use_async_delta(self, seconds: float) -> 'FakeServer':
+        """
+        Set the tick interval of the asynchronous mode.
+        :param seconds: wall and simulation seconds per tick
+        :return: return self for method chaining.
+        """
+        if seconds <= 0.0:
+            raise ValueError("seconds must be greater than 0.")
+        self._async_delta = seconds
+        return self
+
+    def invoke_restart(self, map_name: str = None, *, reset_settings: bool = True) -> 'FakeServer':
+        """
+        Start a new episode. Every actor is destroyed and the world gets a new id.
+        :param map_name: Optional, the map of the new episode, the current one by default
+        :param reset_settings: reset the world settings to asynchronous mode
+        :return: return self for method chaining.
+        """
+        with self._lock:
+            for actor in self._actors.values():
+                actor._destroyed = True
+            self._actors = {}
+            self._episode_id = next(FakeServer._episode_ids)
+            if map_name is not None:
+                self._map_name = map_name
+            if reset_settings:
+                self._settings = WorldSettings()
+            self._snapshot = WorldSnapshot(self._episode_id,
+                                           Timestamp(self._frame, self._elapsed_seconds, 0.0, time.time()), {})
+            self._condition_tick.notify_all()
+        return self
+
+    def invoke_stop(self) -> 'FakeServer':
+        """
+        Shut the server down: stop its ticker and dispatch threads and unregister it from get_fake_server().
+
+        Every later call raises RuntimeError, like an unavailable server. A stopped server is not started again,
+        get_fake_server() creates a new one on the same host:port.
+        :return: return self for method chaining.
+        """
+        with self._lock:
+            self._flag_stopped = True
+            self._available = False
+            self._pid = None  # the threads exit on their next iteration
+            threads = self._threads
+            self._threads = []
+            self._condition_tick.notify_all()
+        with self._condition_dispatch:
+            self._dispatch_queue.clear()
+            self._condition_dispatch.notify_all()
+        if _servers.get((self._host, self._port)) is self:
+            del _servers[(self._host, self._port)]
+        for thread in threads:
+            if thread is not current_thread():
+                thread.join()
+        return self
+
+    def invoke_tick(self) -> int:
+        """
+        Advance the simulation by one tick and generate the sensor measurements due.
+        :return: the new frame id
+        """
+        if self._tick_latency > 0.0:
+            time.sleep(self._tick_latency)
+        with self._lock:
+            settings = self._settings
+            delta_seconds = settings.fixed_delta_seconds or self._async_delta
+            self._frame += 1
+            self._elapsed_seconds += delta_seconds
+            frame, elapsed_seconds = self._frame, self._elapsed_seconds
+            for actor in self._actors.values():
+                actor._invoke_step(delta_seconds)
+            self._snapshot = WorldSnapshot(self._episode_id,
+                                           Timestamp(frame, elapsed_seconds, delta_seconds, time.time()),
+                                           {i: ActorSnapshot(a) for i, a in self._actors.items()})
+            measurements = []
+            for actor in self._actors.values():
+                if isinstance(actor, Sensor):
+                    measurement = actor._invoke_measure(frame, elapsed_seconds, delta_seconds)
+                    if measurement is not None:
+                        measurements.append((actor, actor._callback, measurement))
+            self._count_measurements += len(measurements)
+            self._condition_tick.notify_all()
+        if measurements:
+            deliver_time = time.perf_counter() + self._sensor_latency
+            with self._condition_dispatch:
+                for sensor, callback, measurement in measurements:
+                    heapq.heappush(self._dispatch_queue,
+                                   (deliver_time, next(self._dispatch_seq), sensor, callback, measurement))
+                self._condition_dispatch.notify()
+        return frame
+
+    def _invoke_rpc(self):
+        """
+        Answer one call: check the availability and apply the latency.
+        """
+        if self._pid != os.getpid() and not self._flag_stopped:
+            self._invoke_start_threads()
+        if not self._available:
+            raise RuntimeError(f'time-out while waiting for the simulator, make sure the simulator is ready and '
+                               f'connected to {self._host}:{self._port}')
+        self._count_rpc += 1
+        if self._rpc_latency > 0.0:
+            time.sleep(self._rpc_latency)
+
+    def _invoke_wait_for_tick(self, seconds: float) -> WorldSnapshot:
+        with self._lock:
+            frame, episode_id = self._frame, self._episode_id
+            if not self._condition_tick.wait_for(
+                    lambda: self._frame != frame or self._episode_id != episode_id, seconds):
+                raise RuntimeError(f'time-out of {int(seconds * 1000)}ms while waiting for the simulator')
+            return self._snapshot
+
+    def _invoke_spawn(self, blueprint: ActorBlueprint, transform: Transform, parent_id: Union[int, None]) -> Actor:
+        with self._lock:
+            parent = None
+            if parent_id is not None:
+                parent = self._actors.get(parent_id)
+                if parent is None:
+                    raise RuntimeError(f'Spawn failed because parent actor {parent_id} was not found')
+            if blueprint.id.startswith('vehicle.'):
+                actor_class = Vehicle
+            elif blueprint.id.startswith('sensor.'):
+                actor_class = Sensor
+            else:
+                actor_class = Actor
+            actor = actor_class(self, next(self._actor_ids), blueprint, transform, parent)
+            self._actors[actor.id] = actor
+            return actor
+
+    def _invoke_destroy(self, actor_id: int) -> bool:
+        with self._lock:
+            actor = self._actors.pop(actor_id, None)
+            if actor is None:
+                return False
+            actor._destroyed = True
+            if isinstance(actor, Sensor):
+                actor._callback = None
+            return True
+
+    def _invoke_command(self, cmd) -> command.Response:
+        """
+        Apply one batch command.
+        """
+        try:
+            if isinstance(cmd, command.SpawnActor):
+                return command.Response(self._invoke_spawn(cmd.blueprint, cmd.transform, cmd.parent_id).id)
+            with self._lock:
+                actor = self._actors.get(cmd.actor_id)
+            if actor is None:
+                return command.Response(cmd.actor_id, f'actor {cmd.actor_id} not found')
+            if isinstance(cmd, command.DestroyActor):
+                self._invoke_destroy(cmd.actor_id)
+            elif isinstance(cmd, command.ApplyVehicleControl) and isinstance(actor, Vehicle):
+                actor._invoke_apply_control(cmd.control)
+            elif isinstance(cmd, command.ApplyVehicleAckermannControl) and isinstance(actor, Vehicle):
+                actor._invoke_apply_ackermann_control(cmd.control)
+            elif isinstance(cmd, command.ApplyTransform):
+                with self._lock:
+                    actor._transform = _copy_transform(cmd.transform)
+            else:
+                return command.Response(cmd.actor_id, f'{type(cmd).__name__} is not applicable to {actor.type_id}')
+            return command.Response(cmd.actor_id)
+        except RuntimeError as e:
+            return command.Response(0, str(e))
+
+    def _invoke_start_threads(self):
+        self._pid = os.getpid()
+        self._threads = [Thread(target=self._ticker_thread_func, daemon=True),
+                         Thread(target=self._dispatch_thread_func, daemon=True)]
+        for thread in self._threads:
+            thread.start()
+
+    def _ticker_thread_func(self):
+        pid = self._pid
+        deadline = time.perf_counter()
+        while self._pid == pid:
+            deadline = max(deadline + self._async_delta, time.perf_counter())
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+            if self._available and not self._settings.synchronous_mode:
+                self.invoke_tick()
+
+    def _dispatch_thread_func(self):
+        pid = self._pid
+        while self._pid == pid:
+            with self._condition_dispatch:
+                if not self._dispatch_queue:
+                    self._condition_dispatch.wait(0.1)
+                    continue
+                wait = self._dispatch_queue[0][0] - time.perf_counter()
+                if wait > 0.0:
+                    self._condition_dispatch.wait(wait)
+                    continue
+                _, _, sensor, callback, measurement = heapq.heappop(self._dispatch_queue)
+            if sensor._callback is not callback:
+                # stopped or listening again since the measurement
+                continue
+            try:
+                callback(measurement)
+            except Exception:
+                traceback.print_exc()
+
+
+_servers = {}  # type: Dict[Tuple[str, int], FakeServer]
+
+
+def get_fake_server(host: str = '127.0.0.1', port: int = 2000) -> FakeServer:
+    """
+    Get the FakeServer serving a host:port, created on first use.
+    :param host: host name, 'localhost' and '127.0.0.1' are different servers
+    :param port: port number
+    :return: FakeServer instance
+    """
+    key = (host, int(port))
+    server = _servers.get(key)
+    if server is None:
+        server = FakeServer(host, int(port))
+        _servers[key] = server
+    return server
@@ -0,0 +1,45 @@
+"""
+Batch commands of the stand-in carla module, interpreted by carla.Client.apply_batch() and apply_batch_sync().
+"""
+
+
+class Response:
+    """
+    The result of one command in carla.Client.apply_batch_sync().
+    """
+    def __init__(self, actor_id: int = 0, error: str = ''):
+        self.actor_id = actor_id
+        self.error = error
+
+    def has_error(self) -> bool:
+        return bool(self.error)
+
+
+class SpawnActor:
+    def __init__(self, blueprint, transform, parent_id: int = None):
+        self.blueprint = blueprint
+        self.transform = transform
+        self.parent_id = parent_id
+
+
+class DestroyActor:
+    def __init__(self, actor_id: int):
+        self.actor_id = actor_id
+
+
+class ApplyVehicleControl:
+    def __init__(self, actor_id: int, control):
+        self.actor_id = actor_id
+        self.control = control
+
+
+class ApplyVehicleAckermannControl:
+    def __init__(self, actor_id: int, control):
+        self.actor_id = actor_id
+        self.control = control
+
+
+class ApplyTransform:
+    def __init__(self, actor_id: int, transform):
+        self.actor_id = actor_id
+        self.transform = transform
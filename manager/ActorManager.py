@@ -1,8 +1,12 @@
 import carla
+import numpy
 import re
-from typing import List, Union, Set
+import time
+from typing import List, Union, Set, Dict, Tuple
 
 from ..actor import Actor, Vehicle, Sensor, Camera, Imu, Gnss, Radar, Lidar
+from ..core import WorldSnapshotCache, ControlBatcher
+from ..core.data import FleetStatus
 
 
 class ActorManager:
@@ -20,16 +24,31 @@ class ActorManager:
         'sensor.lidar.*': Lidar,
     }
 
-    def __init__(self, world_ref: List[carla.World]):
+    def __init__(self,
+                 world_ref: List[carla.World],
+                 client_ref: Union[None, List[carla.Client]] = None,
+                 snapshot_cache: Union[None, WorldSnapshotCache] = None,
+                 control_batcher: Union[None, ControlBatcher] = None):
         """
         Construct a new ActorManager instance
 
         This instance should create after CarlaContext created a connection.
 
         :param world_ref: A len(1) list that contains the nullable carla.World instance.
+        :param client_ref: Optional, a len(1) list that contains the nullable carla.Client instance,
+                           required by batch operations.
+        :param snapshot_cache: Optional, a WorldSnapshotCache bound to every new actor.
+        :param control_batcher: Optional, a ControlBatcher bound to every new vehicle.
         """
         self._carla_world_ref = world_ref
+        self._carla_client_ref = client_ref if client_ref is not None else [None]
+        self._snapshot_cache = snapshot_cache
+        self._control_batcher = control_batcher
         self._registry = set()  # type: Set[Actor]
+        self._timing_actor_destroy = {}  # type: Dict[str, float]
+        # fleet status
+        self._fleet_vehicles = []  # type: List[Vehicle]  # in row order
+        self._fleet_status = None  # type: Union[FleetStatus, None]  # memoized for the current frame
 
     def __del__(self):
         # destroy all actors in registry when ActorManager exit.
@@ -42,6 +61,27 @@ class ActorManager:
         """
         return self._carla_world_ref[0]
 
+    @property
+    def carla_client(self) -> carla.Client:
+        """
+        [Immutable] The carla.Client instance that ActorManager sends batch commands with
+        """
+        return self._carla_client_ref[0]
+
+    @property
+    def snapshot_cache(self) -> Union[WorldSnapshotCache, None]:
+        """
+        [Immutable] The WorldSnapshotCache bound to every new actor, None if not set.
+        """
+        return self._snapshot_cache
+
+    @property
+    def control_batcher(self) -> Union[ControlBatcher, None]:
+        """
+        [Immutable] The ControlBatcher bound to every new vehicle, None if not set.
+        """
+        return self._control_batcher
+
     @property
     def registry(self) -> Set[Actor]:
         """
@@ -51,6 +91,66 @@ class ActorManager:
         """
         return self._registry
 
+    @property
+    def timing_actor_destroy(self) -> Dict[str, float]:
+        """
+        [Read-Only] Seconds spent in each phase of the last invoke_actor_destroy_batch() call.
+
+        Phases are 'stop' for the destroy hooks (sensors stop listening), 'destroy' for sending the batch
+        and 'total'.
+        """
+        return self._timing_actor_destroy
+
+    def get_fleet_status(self) -> FleetStatus:
+        """
+        Dump the status of every registered Vehicle as NumPy arrays.
+
+        Velocity and acceleration are read from the world snapshot cache, the control state with one local query
+        per vehicle. The result is memoized for the current frame of the snapshot cache.
+        Rows keep their vehicle across calls, vehicles registered later get new rows at the end.
+
+        :return: FleetStatus instance.
+        """
+        # assign rows to new vehicles
+        known = set(self._fleet_vehicles)
+        new_vehicles = [a for a in self.registry if isinstance(a, Vehicle) and a not in known]
+        self._fleet_vehicles.extend(sorted(new_vehicles, key=lambda v: v.id))
+
+        # reuse the status of the current frame
+        frame = self.snapshot_cache.frame if self.snapshot_cache is not None else 0
+        status = self._fleet_status
+        if frame and status is not None and status.frame == frame and len(status) == len(self._fleet_vehicles):
+            return status
+
+        # fill rows
+        status = FleetStatus([v.id for v in self._fleet_vehicles], frame)
+        velocity = status.velocity
+        acceleration = status.acceleration
+        for row, v in enumerate(self._fleet_vehicles):
+            carla_actor = v.carla_actor
+            if carla_actor is None:
+                continue
+            source = None
+            if self.snapshot_cache is not None and v.option_snapshot_cache:
+                source = self.snapshot_cache.find(carla_actor.id)
+            if source is None:
+                if not carla_actor.is_alive:
+                    continue
+                source = carla_actor
+            vel = source.get_velocity()
+            acc = source.get_acceleration()
+            control = carla_actor.get_control()
+            velocity[row] = (vel.x, vel.y, vel.z)
+            acceleration[row] = (acc.x, acc.y, acc.z)
+            status.throttle[row] = control.throttle
+            status.steer[row] = control.steer
+            status.brake[row] = control.brake
+            status.alive[row] = True
+        status.speed[:] = numpy.linalg.norm(velocity, axis=1)
+
+        self._fleet_status = status
+        return status
+
     def new_actor(self,
                   blueprint_name: str,
                   *,
@@ -70,6 +170,9 @@ class ActorManager:
 
         # spawn and register actor
         actor = actor_type(blueprint_name, **kwargs)
+        actor.invoke_bind_snapshot_cache(self.snapshot_cache)
+        if isinstance(actor, Vehicle):
+            actor.invoke_bind_control_batcher(self.control_batcher)
         self._registry.add(actor)
         if parent:
             actor.set_parent(parent)
@@ -103,6 +206,10 @@ class ActorManager:
                                                            attach_to=attach_target)
                 self.carla_world.wait_for_tick() # wait for the actor to be spawned
                 a.invoke_bind_carla_actor(carla_actor)
+                if a.snapshot_cache is None:
+                    a.invoke_bind_snapshot_cache(self.snapshot_cache)
+                if isinstance(a, Vehicle) and a.control_batcher is None:
+                    a.invoke_bind_control_batcher(self.control_batcher)
                 self.registry.add(a)  # idempotent operation, duplicate additions will be ignored
             except RuntimeError as e:
                 spawn_exceptions.append(e)
@@ -115,6 +222,97 @@ class ActorManager:
         # and return
         return self
 
+    def invoke_actor_spawn_batch(self, actor: Union[Actor, List[Actor], Set[Actor]]) -> 'ActorManager':
+        """
+        Spawn actor(s) in the simulator with batch commands and a single tick.
+
+        Actors are spawned in topological order of the actor tree, one carla.Client.apply_batch_sync() call per tree
+        level, children are attached by the carla actor id of their parent. All spawned actors are bound after
+        one tick, instead of one round trip and one tick per actor in invoke_actor_spawn().
+
+        An actor whose parent is neither alive nor in the batch, or whose parent failed to spawn, is not spawned.
+
+        :param actor: a single, list or set of Actor instances to spawn
+        :return: return self for method chaining.
+        :raises RuntimeError: if any actor fails to spawn, other actors are still spawned and bound
+        """
+        # input clean
+        if isinstance(actor, Actor):
+            actors = [actor]
+        elif isinstance(actor, list):
+            actors = actor.copy()
+        elif isinstance(actor, set):
+            actors = list(actor)
+        else:
+            raise TypeError(f'A list of Actor or Actor instance is expected, but got {type(actor)}')
+        if self.carla_client is None:
+            raise RuntimeError('A carla.Client is required to spawn actors in batch.')
+
+        # spawn level by level, parents before children
+        spawn_failures = []  # type: List[Tuple[Actor, str]]
+        spawned = {}  # type: Dict[Actor, int]  # actor -> carla actor id
+        levels, orphans = self._sort_actor_tree(actors)
+        spawn_failures.extend((a, 'parent actor is not spawned') for a in orphans)
+        for level in levels:
+            commands = []
+            level_actors = []
+            for a in level:
+                if a.parent is None:
+                    parent_id = None
+                elif a.parent in spawned:
+                    parent_id = spawned[a.parent]
+                elif a.parent.is_alive():
+                    parent_id = a.parent.carla_actor.id
+                else:
+                    spawn_failures.append((a, 'parent actor failed to spawn'))
+                    continue
+                try:
+                    blueprint = a.blueprint.as_carla_blueprint(self.carla_world)
+                except (IndexError, RuntimeError) as e:
+                    spawn_failures.append((a, str(e)))
+                    continue
+                transform = a.transform.as_carla_transform()
+                if parent_id is None:
+                    commands.append(carla.command.SpawnActor(blueprint, transform))
+                else:
+                    commands.append(carla.command.SpawnActor(blueprint, transform, parent_id))
+                level_actors.append(a)
+            if not commands:
+                continue
+            for a, response in zip(level_actors, self.carla_client.apply_batch_sync(commands, False)):
+                if response.error:
+                    spawn_failures.append((a, response.error))
+                else:
+                    spawned[a] = response.actor_id
+
+        # bind all spawned actors after one tick
+        if spawned:
+            self.carla_world.wait_for_tick()  # wait for the actors to be spawned
+            carla_actors = {ca.id: ca for ca in self.carla_world.get_actors(list(spawned.values()))}
+            for a, actor_id in spawned.items():
+                carla_actor = carla_actors.get(actor_id)
+                if carla_actor is None:
+                    spawn_failures.append((a, f'carla actor {actor_id} is not found after spawn'))
+                    continue
+                try:
+                    a.invoke_bind_carla_actor(carla_actor)
+                except RuntimeError as e:
+                    spawn_failures.append((a, str(e)))
+                    continue
+                if a.snapshot_cache is None:
+                    a.invoke_bind_snapshot_cache(self.snapshot_cache)
+                if isinstance(a, Vehicle) and a.control_batcher is None:
+                    a.invoke_bind_control_batcher(self.control_batcher)
+                self.registry.add(a)  # idempotent operation, duplicate additions will be ignored
+
+        if spawn_failures:
+            error_msg = f'Failed to spawn {len(spawn_failures)} actor(s):\n'
+            for a, e in spawn_failures:
+                error_msg += f'\t{a.name or a.id} ({a.blueprint.blueprint_name}): {e}\n'
+            raise RuntimeError(error_msg)
+        # and return
+        return self
+
     def invoke_actor_destroy(self, actor: Union[Actor, List[Actor], Set[Actor]]) -> 'ActorManager':
         """
         Destroy actor(s) in the simulator
@@ -138,6 +336,96 @@ class ActorManager:
 
         return self
 
+    def invoke_actor_destroy_batch(self, actor: Union[Actor, List[Actor], Set[Actor]]) -> 'ActorManager':
+        """
+        Destroy actor(s) in the simulator with a single batch command.
+
+        All sensors are stopped first, then the destroy hooks of the other actors are called, and every actor is
+        destroyed by one carla.Client.apply_batch() call, children before parents. No liveness check is sent per
+        actor, actors already destroyed on the server are ignored by the batch.
+        Time spent in each phase is kept in timing_actor_destroy.
+
+        Falls back to invoke_actor_destroy() if no carla.Client is available.
+
+        :param actor: a single, list or set of Actor instances to destroy
+        :return: return self for method chaining.
+        """
+        # input clean
+        actors = []
+        if isinstance(actor, Actor):
+            actors = [actor]
+        elif isinstance(actor, set):
+            actors = list(actor)
+        elif isinstance(actor, list):
+            actors = actor.copy()
+        if self.carla_client is None:
+            return self.invoke_actor_destroy(actors)
+
+        time_begin = time.perf_counter()
+        # bound actors only, children before parents
+        actors = [a for a in actors if a.carla_actor is not None]
+        actors.sort(key=self._get_actor_depth, reverse=True)
+
+        # stop sensors first, so no callback runs on a destroyed actor
+        actors_ordered = [a for a in actors if isinstance(a, Sensor)] + [a for a in actors if not isinstance(a, Sensor)]
+        for a in actors_ordered:
+            try:
+                a.on_actor_destroy()
+            except RuntimeError:
+                # the carla actor may be gone already, it is still destroyed below
+                pass
+        time_stopped = time.perf_counter()
+
+        # destroy all in one batch
+        commands = [carla.command.DestroyActor(a.carla_actor.id) for a in actors]
+        if commands:
+            self.carla_client.apply_batch(commands)
+        for a in actors:
+            a.invoke_unbind_carla_actor()
+            # actor will not be removed from registry until ActorManger is destroyed
+        time_end = time.perf_counter()
+
+        self._timing_actor_destroy = {
+            'stop': time_stopped - time_begin,
+            'destroy': time_end - time_stopped,
+            'total': time_end - time_begin,
+        }
+        return self
+
+    @staticmethod
+    def _get_actor_depth(actor: Actor) -> int:
+        """
+        Get the depth of an actor in the actor tree, 0 for a root actor.
+        """
+        depth = 0
+        while actor.parent is not None:
+            actor = actor.parent
+            depth += 1
+        return depth
+
+    @staticmethod
+    def _sort_actor_tree(actors: List[Actor]) -> Tuple[List[List[Actor]], List[Actor]]:
+        """
+        Sort actors by level in the actor tree.
+
+        Actors without parent, or with a parent outside the list that is alive, are on the first level.
+
+        :param actors: a list of Actor instances
+        :return: (levels from the root, actors whose parent is neither in the list nor alive)
+        """
+        pending = list(dict.fromkeys(actors))  # unique, keep order
+        members = set(pending)
+        placed = set()  # type: Set[Actor]
+        levels = []  # type: List[List[Actor]]
+        # roots
+        level = [a for a in pending if a.parent is None or (a.parent not in members and a.parent.is_alive())]
+        while level:
+            levels.append(level)
+            placed.update(level)
+            pending = [a for a in pending if a not in placed]
+            level = [a for a in pending if a.parent in placed]
+        return levels, pending
+
     def _find_actor_type_by_blueprint(self, blueprint_name: str) -> type:
         """
         Find the actor type by blueprint name
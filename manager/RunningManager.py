@@ -1,7 +1,14 @@
+import asyncio
 import carla
 import time
-from threading import Thread, Event
-from typing import Union, List
+import warnings
+from threading import Thread, Event, Condition, Lock
+from typing import Union, List, Tuple, Callable, Set
+
+from .TickPacer import TickPacer
+from .TickScheduler import TickScheduler
+from ..actor import Actor, Sensor
+from ..core import WorldSnapshotCache, ControlBatcher
 
 
 class RunningManager:
@@ -9,18 +16,46 @@ class RunningManager:
     A class that manages the running of the CARLA simulation.
 
     Mainly for simulation sync, async control.
+
+    The control thread keeps the world settings in one of the MODE_* states and only talks to the server
+    when the requested mode differs from the applied one, or when the world changes.
+
+    Every tick received increases tick_count and updates frame under a Condition, so wait_for_ticks() and
+    wait_for_frame() never miss a tick, unlike the flashed event_carla_tick.
+    Callbacks added by add_tick_callback() run in the control thread right after each tick, before waiters wake up.
+
+    With the sensor barrier in sync primary mode, the next tick is only sent once every sensor has delivered the
+    frame of the last tick, or the barrier timeout expired. Combined with TickPacer.PACING_AS_FAST_AS_POSSIBLE,
+    the simulation runs at the speed of the server without losing sensor frames.
     """
 
-    def __init__(self, world_ref: List[carla.World]):
+    MODE_UNKNOWN = 'unknown'  # world settings not checked yet
+    MODE_ASYNC = 'async'
+    MODE_SYNC_PRIMARY = 'sync_primary'
+
+    D_SENSOR_BARRIER_TIMEOUT = 1.0  # in seconds
+
+    def __init__(self, world_ref: List[carla.World], client_ref: Union[None, List[carla.Client]] = None):
         """
         Construct a RunningManager instance.
 
         This instance should create after CarlaContext created a connection.
 
         :param world_ref: A len(1) list that contains the nullable carla.World instance.
+        :param client_ref: Optional, a len(1) list that contains the nullable carla.Client instance,
+                           required to send batched controls.
         """
         self._carla_world_ref = world_ref
         self._event_carla_tick = Event()
+        self._condition_tick = Condition()
+        self._tick_count = 0  # ticks received since construction
+        self._frame = 0  # carla frame id of the latest tick
+        self._async_waiters = []  # type: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future, str, int]]
+        self._lock_async_waiters = Lock()
+        self._snapshot_cache = WorldSnapshotCache()
+        self._control_batcher = ControlBatcher(client_ref if client_ref is not None else [None])
+        self._tick_pacer = TickPacer()
+        self._tick_scheduler = TickScheduler()
         # time
         self._time_simulation_begin = 0.0
         self._time_realworld_begin = 0.0
@@ -28,6 +63,18 @@ class RunningManager:
         self._option_sync_primary_mode = False
         self._option_strict_time_mode = False
         self._sync_fixed_delta_time = 0.0  # in seconds
+        # sensor barrier
+        self._option_sensor_barrier = False
+        self._sensor_barrier_sensors = None  # type: Union[List[Sensor], None]  # None for all registered sensors
+        self._sensor_barrier_timeout = self.D_SENSOR_BARRIER_TIMEOUT
+        self._actor_registry = set()  # type: Set[Actor]
+        self._count_sensor_barrier_timeouts = 0
+        self._sensor_barrier_missing = []  # type: List[Sensor]
+        # mode state machine
+        self._mode = self.MODE_UNKNOWN
+        self._mode_fixed_delta_time = 0.0  # fixed delta time applied in MODE_SYNC_PRIMARY
+        self._mode_world_id = None  # type: Union[int, None]  # id of the world the mode is applied to
+        self._count_settings_rpc = 0
         # flags
         self._flag_internal_exit = False
         # running control
@@ -54,6 +101,48 @@ class RunningManager:
         """
         return self._event_carla_tick
 
+    @property
+    def tick_count(self) -> int:
+        """
+        [Read-Only] Number of ticks received since the RunningManager was constructed, never decreases.
+        """
+        return self._tick_count
+
+    @property
+    def frame(self) -> int:
+        """
+        [Read-Only] The carla frame id of the latest tick, 0 if no tick is received yet.
+        """
+        return self._frame
+
+    @property
+    def snapshot_cache(self) -> WorldSnapshotCache:
+        """
+        [Immutable] The world snapshot cache, updated once per tick by the control thread.
+        """
+        return self._snapshot_cache
+
+    @property
+    def control_batcher(self) -> ControlBatcher:
+        """
+        [Immutable] The vehicle control batcher, flushed by the control thread once per tick.
+        """
+        return self._control_batcher
+
+    @property
+    def tick_pacer(self) -> TickPacer:
+        """
+        [Immutable] The tick pacer of sync primary mode, holding the jitter and overrun statistics.
+        """
+        return self._tick_pacer
+
+    @property
+    def tick_scheduler(self) -> TickScheduler:
+        """
+        [Immutable] The scheduler of tick callbacks, holding their execution statistics.
+        """
+        return self._tick_scheduler
+
     @property
     def time_simulation_begin(self) -> float:
         """
@@ -73,7 +162,9 @@ class RunningManager:
         """
         [Read-Only] Then time span since the RunningManager control thread started.
         """
-        snap = self.carla_world.get_snapshot()
+        snap = self.snapshot_cache.snapshot
+        if snap is None:
+            snap = self.carla_world.get_snapshot()
         return snap.timestamp.elapsed_seconds - self.time_simulation_begin
 
     @property
@@ -90,6 +181,41 @@ class RunningManager:
         """
         return self.timespan_realworld - self.timespan_simulation
 
+    @property
+    def mode(self) -> str:
+        """
+        [Read-Only] The mode applied to the world settings, one of MODE_UNKNOWN, MODE_ASYNC and MODE_SYNC_PRIMARY.
+        """
+        return self._mode
+
+    @property
+    def count_settings_rpc(self) -> int:
+        """
+        [Read-Only] Number of get_settings() and apply_settings() calls sent by the RunningManager.
+        """
+        return self._count_settings_rpc
+
+    @property
+    def option_sensor_barrier(self) -> bool:
+        """
+        [Read-Write] Whether ticks wait for the sensors to deliver the previous frame in sync primary mode.
+        """
+        return self._option_sensor_barrier
+
+    @property
+    def count_sensor_barrier_timeouts(self) -> int:
+        """
+        [Read-Only] Number of ticks sent after the sensor barrier timed out.
+        """
+        return self._count_sensor_barrier_timeouts
+
+    @property
+    def sensor_barrier_missing(self) -> List[Sensor]:
+        """
+        [Read-Only] Sensors that had not delivered their frame when the sensor barrier last timed out.
+        """
+        return self._sensor_barrier_missing
+
     @property
     def option_sync_primary_mode(self) -> bool:
         """
@@ -101,6 +227,9 @@ class RunningManager:
     def option_strict_time_mode(self) -> bool:
         """
         [Read-Write] Whether the RunningManager is in strict time mode.
+
+        In strict time mode, the time lost by late ticks is made up by the next ticks,
+        otherwise the tick schedule restarts from a late tick.
         """
         return self._option_strict_time_mode
 
@@ -135,8 +264,214 @@ class RunningManager:
         # reset timer
         self._time_realworld_begin = 0.0
         self._time_simulation_begin = 0.0
+        self.tick_pacer.invoke_reset()
+        return self
+
+    def use_sensor_barrier(self, option: bool = True, *,
+                           sensors: Union[List[Sensor], None] = None,
+                           timeout: float = D_SENSOR_BARRIER_TIMEOUT) -> 'RunningManager':
+        """
+        Enable or disable the sensor barrier in sync primary mode.
+
+        :param option: True to send the next tick only once the sensors delivered the frame of the last tick.
+        :param sensors: Optional, sensors to wait for, all alive sensors of the bound actor registry by default.
+        :param timeout: seconds to wait for the sensors before ticking anyway.
+        :return: return self for method chaining.
+        """
+        if timeout <= 0.0:
+            raise ValueError("timeout must be greater than 0.")
+        self._option_sensor_barrier = option
+        self._sensor_barrier_sensors = list(sensors) if sensors is not None else None
+        self._sensor_barrier_timeout = timeout
+        return self
+
+    def invoke_bind_actor_registry(self, registry: Set[Actor]) -> 'RunningManager':
+        """
+        Bind the actor registry the sensor barrier takes its default sensors from.
+
+        This method is used internally by CarlaContext.
+
+        :param registry: the registry of an ActorManager
+        :return: return self for method chaining.
+        """
+        self._actor_registry = registry
         return self
 
+    def use_tick_pacing(self, pacing: str, *, speed: float = 1.0) -> 'RunningManager':
+        """
+        Set how fast ticks are sent in sync primary mode.
+
+        :param pacing: TickPacer.PACING_REALTIME, TickPacer.PACING_SCALED or TickPacer.PACING_AS_FAST_AS_POSSIBLE
+        :param speed: simulation seconds per real second, only used by TickPacer.PACING_SCALED
+        :return: return self for method chaining.
+        """
+        self.tick_pacer.use_pacing(pacing, speed=speed)
+        return self
+
+    def add_tick_callback(self,
+                          callback: Callable[[int], None],
+                          *,
+                          priority: int = 0,
+                          period: int = 1,
+                          budget: Union[float, None] = None,
+                          name: Union[str, None] = None) -> 'RunningManager':
+        """
+        Add a callback run in the control thread right after ticks, see TickScheduler.
+
+        :param callback: a callable taking the carla frame id as argument
+        :param priority: lower values run first, callbacks of the same priority run in registration order
+        :param period: run on every period-th tick
+        :param budget: Optional, CPU seconds allowed per run, overruns are counted and warned
+        :param name: Optional, a unique name in tick_scheduler.statistics,
+                     the callback qualified name followed by its registration order by default
+        :return: return self for method chaining.
+        """
+        self.tick_scheduler.add_callback(callback, priority=priority, period=period, budget=budget, name=name)
+        return self
+
+    def remove_tick_callback(self, callback: Callable[[int], None]) -> 'RunningManager':
+        """
+        Remove a callback added by add_tick_callback. No effect if it is not added.
+        :param callback: the callable to remove
+        :return: return self for method chaining.
+        """
+        self.tick_scheduler.remove_callback(callback)
+        return self
+
+    def wait_for_ticks(self, count: int = 1, timeout: Union[float, None] = None) -> int:
+        """
+        Wait until count more ticks are received.
+
+        :param count: number of ticks to wait for
+        :param timeout: seconds to wait, None to wait forever
+        :return: tick_count after waiting
+        :raise TimeoutError: if the ticks are not received in time
+        """
+        with self._condition_tick:
+            target = self._tick_count + count
+            if not self._condition_tick.wait_for(lambda: self._tick_count >= target, timeout=timeout):
+                raise TimeoutError(f'Timeout waiting for {count} ticks.')
+            return self._tick_count
+
+    def wait_for_frame(self, frame: int, timeout: Union[float, None] = None) -> int:
+        """
+        Wait until a tick with a frame id greater than or equal to frame is received.
+
+        :param frame: carla frame id to wait for
+        :param timeout: seconds to wait, None to wait forever
+        :return: frame of the latest tick
+        :raise TimeoutError: if the frame is not received in time
+        """
+        with self._condition_tick:
+            if not self._condition_tick.wait_for(lambda: self._frame >= frame, timeout=timeout):
+                raise TimeoutError(f'Timeout waiting for frame {frame}.')
+            return self._frame
+
+    async def wait_for_ticks_async(self, count: int = 1, timeout: Union[float, None] = None) -> int:
+        """
+        Awaitable version of wait_for_ticks(), the event loop is not blocked.
+
+        :param count: number of ticks to wait for
+        :param timeout: seconds to wait, None to wait forever
+        :return: tick_count after waiting
+        :raise TimeoutError: if the ticks are not received in time
+        """
+        with self._condition_tick:
+            target = self._tick_count + count
+        await self._invoke_wait_async('tick_count', target, timeout)
+        return self._tick_count
+
+    async def wait_for_frame_async(self, frame: int, timeout: Union[float, None] = None) -> int:
+        """
+        Awaitable version of wait_for_frame(), the event loop is not blocked.
+
+        :param frame: carla frame id to wait for
+        :param timeout: seconds to wait, None to wait forever
+        :return: frame of the latest tick
+        :raise TimeoutError: if the frame is not received in time
+        """
+        await self._invoke_wait_async('frame', frame, timeout)
+        return self._frame
+
+    async def _invoke_wait_async(self, kind: str, target: int, timeout: Union[float, None]):
+        """
+        Wait until the counter of kind reaches target, resolved by the control thread on tick.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._condition_tick:
+            # registered under the tick condition, so no tick is missed between the check and the registration
+            if self._get_tick_counter(kind) >= target:
+                return
+            with self._lock_async_waiters:
+                self._async_waiters.append((loop, future, kind, target))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f'Timeout waiting for {kind} {target}.')
+        finally:
+            with self._lock_async_waiters:
+                self._async_waiters = [w for w in self._async_waiters if w[1] is not future]
+
+    def _get_tick_counter(self, kind: str) -> int:
+        """
+        Get tick_count or frame by name.
+        """
+        return self._tick_count if kind == 'tick_count' else self._frame
+
+    def _invoke_notify_tick(self, frame: int):
+        """
+        Count a received tick and wake up all waiters.
+        :param frame: carla frame id of the tick
+        :return: None
+        """
+        with self._condition_tick:
+            self._tick_count += 1
+            self._frame = max(self._frame, frame)
+            self._condition_tick.notify_all()
+            # wake up async waiters reached by this tick
+            with self._lock_async_waiters:
+                reached = [w for w in self._async_waiters if self._get_tick_counter(w[2]) >= w[3]]
+                self._async_waiters = [w for w in self._async_waiters if w not in reached]
+        for loop, future, _, _ in reached:
+            loop.call_soon_threadsafe(self._invoke_resolve_future, future)
+        # flash the event for backward compatibility
+        self.event_carla_tick.set()
+        self.event_carla_tick.clear()
+
+    @staticmethod
+    def _invoke_resolve_future(future: asyncio.Future):
+        """
+        Resolve a waiter future in its event loop, cancelled futures are ignored.
+        """
+        if not future.done():
+            future.set_result(None)
+
+    def _invoke_wait_sensor_barrier(self, frame: int):
+        """
+        Wait until every barrier sensor delivered frame, or the barrier timeout expired.
+        :param frame: carla frame id of the last tick
+        :return: None
+        """
+        sensors = self._sensor_barrier_sensors
+        if sensors is None:
+            sensors = [a for a in list(self._actor_registry) if isinstance(a, Sensor)]
+        time_end = time.perf_counter() + self._sensor_barrier_timeout
+        for sensor in sensors:
+            while sensor.carla_actor is not None and sensor.data_frame < frame:
+                seq = sensor.data_seq
+                # checked again after reading seq, the frame may have arrived in between
+                if sensor.data_frame >= frame:
+                    break
+                time_left = time_end - time.perf_counter()
+                if time_left <= 0.0:
+                    break
+                sensor.wait_for_data_update(seq, timeout=time_left)
+        missing = [s for s in sensors if s.carla_actor is not None and s.data_frame < frame]
+        if missing:
+            self._count_sensor_barrier_timeouts += 1
+            self._sensor_barrier_missing = missing
+
     def _invoke_enter_sync_primary_mode(self, fixed_delta_time: float):
         """
         Enter the sync primary mode.
@@ -144,6 +479,7 @@ class RunningManager:
         :return: None
         """
         settings = self.carla_world.get_settings()   # type: carla.WorldSettings
+        self._count_settings_rpc += 1
         # skip setting if already set
         if settings.synchronous_mode and settings.fixed_delta_seconds == fixed_delta_time:
             return
@@ -151,6 +487,7 @@ class RunningManager:
         settings.fixed_delta_seconds = fixed_delta_time
         settings.synchronous_mode = True
         self.carla_world.apply_settings(settings)
+        self._count_settings_rpc += 1
 
     def _invoke_exit_sync_primary_mode(self):
         """
@@ -158,9 +495,36 @@ class RunningManager:
         :return: None
         """
         settings = self.carla_world.get_settings()   # type: carla.WorldSettings
+        self._count_settings_rpc += 1
+        # skip setting if already set
+        if not settings.synchronous_mode and not settings.fixed_delta_seconds:
+            return
+        # update settings
         settings.synchronous_mode = False
         settings.fixed_delta_seconds = 0.0
         self.carla_world.apply_settings(settings)
+        self._count_settings_rpc += 1
+
+    def _invoke_update_mode(self):
+        """
+        Apply the requested mode to the world settings if it is not applied yet.
+
+        The settings are only read and written on a transition, a new world is always checked once.
+        :return: None
+        """
+        world_id = self.carla_world.id
+        if world_id != self._mode_world_id:
+            # a new world, its settings are unknown
+            self._mode = self.MODE_UNKNOWN
+            self._mode_world_id = world_id
+        if self.option_sync_primary_mode:
+            if self._mode != self.MODE_SYNC_PRIMARY or self._mode_fixed_delta_time != self.sync_fixed_delta_time:
+                self._invoke_enter_sync_primary_mode(self.sync_fixed_delta_time)
+                self._mode = self.MODE_SYNC_PRIMARY
+                self._mode_fixed_delta_time = self.sync_fixed_delta_time
+        elif self._mode != self.MODE_ASYNC:
+            self._invoke_exit_sync_primary_mode()
+            self._mode = self.MODE_ASYNC
 
     def _control_thread_func(self):
         while self._flag_internal_exit is False:
@@ -170,40 +534,56 @@ class RunningManager:
                 if self.time_realworld_begin != 0.0 or self.time_simulation_begin != 0.0:
                     self._time_realworld_begin = 0.0
                     self._time_simulation_begin = 0.0
+                    self.snapshot_cache.update(None)
+                self._mode = self.MODE_UNKNOWN
+                self._mode_world_id = None
                 # wait for 0.1 seconds to reduce CPU usage
                 time.sleep(0.1)
                 continue
-            elif self.time_realworld_begin == 0.0 and self.time_simulation_begin == 0.0:
-                # set time if world created
-                self._time_realworld_begin = time.time()
-                self._time_simulation_begin = self.carla_world.get_snapshot().timestamp.elapsed_seconds
 
-            # handle sync model change
-            if self.option_sync_primary_mode:
-                self._invoke_enter_sync_primary_mode(self.sync_fixed_delta_time)
-            else:
-                self._invoke_exit_sync_primary_mode()
+            try:
+                if self.time_realworld_begin == 0.0 and self.time_simulation_begin == 0.0:
+                    # set time if world created
+                    self._time_realworld_begin = time.time()
+                    self._time_simulation_begin = self.carla_world.get_snapshot().timestamp.elapsed_seconds
 
-            # calculate client wait time for sync primary mode
-            client_wait_time = self.sync_fixed_delta_time
-            if self.option_strict_time_mode:
-                client_wait_time = self.sync_fixed_delta_time - self.timespan_realworld_simulation_diff
-                client_wait_time = max(self.sync_fixed_delta_time * 0.5, client_wait_time)
-                client_wait_time = min(self.sync_fixed_delta_time * 2.0, client_wait_time)
+                # handle sync model change
+                self._invoke_update_mode()
 
-            # control
-            try:
+                # control
                 if self.option_sync_primary_mode:
-                    # print(client_wait_time)
+                    # wait for the deadline of this tick
+                    self.tick_pacer.invoke_wait(self.sync_fixed_delta_time, catch_up=self.option_strict_time_mode)
+                    # send controls submitted since the last tick
+                    self.control_batcher.invoke_flush()
+                    time_tick = time.perf_counter()
                     self.carla_world.tick()
-                    time.sleep(client_wait_time)
+                    self.tick_pacer.invoke_record_latency(time.perf_counter() - time_tick)
+                    self.snapshot_cache.update(self.carla_world.get_snapshot())
+                    if self.option_sensor_barrier:
+                        self._invoke_wait_sensor_barrier(self.snapshot_cache.frame)
                 else:
-                    self.carla_world.wait_for_tick()
+                    # send controls submitted since the last tick
+                    self.control_batcher.invoke_flush()
+                    self.snapshot_cache.update(self.carla_world.wait_for_tick())
+                # run tick callbacks, then notify waiters
+                self.tick_scheduler.invoke_run(self.snapshot_cache.frame)
+                self._invoke_notify_tick(self.snapshot_cache.frame)
             except AttributeError:
                 # occurred AttributeError means the world is destroyed during process
                 # it will be handled safely in the next loop
                 pass
+            except RuntimeError:
+                # the server did not answer, the heartbeat of the context decides whether the world is lost
+                # settings are checked again once the server answers
+                self._mode_world_id = None
+                time.sleep(0.1)
+            except Exception as e:
+                # the control thread must keep running, the loop is tried again
+                warnings.warn(f'Control thread raised {type(e).__name__}: {e}', RuntimeWarning)
+                time.sleep(0.1)
 
-            # flash event
-            self.event_carla_tick.set()
-            self.event_carla_tick.clear()
+        # release sync primary mode on exit, the loop may have stopped before the transition
+        if self._mode == self.MODE_SYNC_PRIMARY and self.carla_world is not None:
+            self._invoke_exit_sync_primary_mode()
+            self._mode = self.MODE_ASYNC
@@ -0,0 +1,155 @@
+import time
+from typing import Union
+
+
+class TickPacer:
+    """
+    A scheduler of world ticks against absolute monotonic deadlines, used by RunningManager in sync primary mode.
+
+    Deadlines are spaced by fixed_delta_time / speed from the first tick. The time spent in tick() is absorbed
+    by waiting for the next deadline instead of sleeping a fixed interval after it, so the tick period does not
+    drift with the tick latency.
+
+    When a tick starts after its deadline, it is counted as an overrun. With catch-up, the lost time is made up
+    by the next ticks, up to D_CATCH_UP_LIMIT periods. Without catch-up, the schedule restarts from the late tick.
+    """
+
+    PACING_REALTIME = 'realtime'  # one simulation second per real second
+    PACING_SCALED = 'scaled'  # speed simulation seconds per real second
+    PACING_AS_FAST_AS_POSSIBLE = 'as_fast_as_possible'  # no waiting between ticks
+
+    D_CATCH_UP_LIMIT = 10  # periods, the schedule restarts beyond that
+
+    def __init__(self):
+        """
+        Construct a TickPacer instance in real time pacing.
+        """
+        self._pacing = self.PACING_REALTIME
+        self._speed = 1.0
+        self._deadline = None  # type: Union[float, None]  # perf_counter of the next tick
+        # statistics
+        self._count_ticks = 0
+        self._count_overruns = 0
+        self._jitter_sum = 0.0
+        self._jitter_max = 0.0
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+
+    @property
+    def pacing(self) -> str:
+        """
+        [Read-Only] One of PACING_REALTIME, PACING_SCALED and PACING_AS_FAST_AS_POSSIBLE.
+        """
+        return self._pacing
+
+    @property
+    def speed(self) -> float:
+        """
+        [Read-Only] Simulation seconds per real second, 1.0 in real time pacing.
+        """
+        return self._speed
+
+    @property
+    def count_ticks(self) -> int:
+        """
+        [Read-Only] Number of ticks paced since the last statistics reset.
+        """
+        return self._count_ticks
+
+    @property
+    def count_overruns(self) -> int:
+        """
+        [Read-Only] Number of ticks started after their deadline.
+        """
+        return self._count_overruns
+
+    @property
+    def statistics(self) -> dict:
+        """
+        [Read-Only] Pacing statistics since the last reset.
+
+        :return: {'ticks': count, 'overruns': count,
+                  'jitter_mean': seconds, 'jitter_max': seconds,  # tick start delay after the deadline
+                  'latency_mean': seconds, 'latency_max': seconds}  # time spent in tick()
+        """
+        count = self._count_ticks
+        return {
+            'ticks': count,
+            'overruns': self._count_overruns,
+            'jitter_mean': self._jitter_sum / count if count else 0.0,
+            'jitter_max': self._jitter_max,
+            'latency_mean': self._latency_sum / count if count else 0.0,
+            'latency_max': self._latency_max,
+        }
+
+    def use_pacing(self, pacing: str, *, speed: float = 1.0) -> 'TickPacer':
+        """
+        Set the pacing mode. The schedule restarts from the next tick.
+
+        :param pacing: PACING_REALTIME, PACING_SCALED or PACING_AS_FAST_AS_POSSIBLE
+        :param speed: simulation seconds per real second, only used by PACING_SCALED
+        :return: return self for method chaining.
+        """
+        if pacing not in (self.PACING_REALTIME, self.PACING_SCALED, self.PACING_AS_FAST_AS_POSSIBLE):
+            raise ValueError(f'Unknown pacing {pacing}')
+        if pacing == self.PACING_SCALED and speed <= 0.0:
+            raise ValueError("speed must be greater than 0.")
+        self._pacing = pacing
+        self._speed = speed if pacing == self.PACING_SCALED else 1.0
+        self._deadline = None
+        return self
+
+    def invoke_reset(self) -> 'TickPacer':
+        """
+        Restart the schedule from the next tick and reset the statistics.
+        :return: return self for method chaining.
+        """
+        self._deadline = None
+        self._count_ticks = 0
+        self._count_overruns = 0
+        self._jitter_sum = 0.0
+        self._jitter_max = 0.0
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+        return self
+
+    def invoke_wait(self, fixed_delta_time: float, *, catch_up: bool = False):
+        """
+        Wait for the deadline of the next tick.
+
+        :param fixed_delta_time: simulated seconds per tick
+        :param catch_up: make up the time lost by overruns with the next ticks
+        :return: None
+        """
+        now = time.perf_counter()
+        if self.pacing == self.PACING_AS_FAST_AS_POSSIBLE or fixed_delta_time <= 0.0:
+            self._deadline = now
+            return
+        interval = fixed_delta_time / self.speed
+        if self._deadline is None:
+            self._deadline = now
+        else:
+            self._deadline += interval
+        deadline = self._deadline
+        lateness = now - deadline
+        if lateness > 0.0:
+            self._count_overruns += 1
+            if not catch_up or lateness > interval * self.D_CATCH_UP_LIMIT:
+                # restart the schedule from this tick
+                self._deadline = now
+        else:
+            time.sleep(-lateness)
+        jitter = max(0.0, time.perf_counter() - deadline)
+        self._jitter_sum += jitter
+        self._jitter_max = max(self._jitter_max, jitter)
+
+    def invoke_record_latency(self, latency: float):
+        """
+        Record the time spent in one tick() call.
+
+        :param latency: in seconds
+        :return: None
+        """
+        self._count_ticks += 1
+        self._latency_sum += latency
+        self._latency_max = max(self._latency_max, latency)
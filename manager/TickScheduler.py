@@ -0,0 +1,162 @@
+import bisect
+import time
+import warnings
+from threading import Lock
+from typing import Callable, Dict, List, Union
+
+
+class TickScheduler:
+    """
+    A scheduler of per-tick callbacks, run by the RunningManager control thread right after each tick.
+
+    Callbacks run one after another in a deterministic order: by priority, lower values first, then by
+    registration order. A callback with period k runs on every k-th tick. Callbacks are called with the carla
+    frame id of the tick.
+
+    The wall time of every run is recorded in a histogram. A callback whose CPU time exceeds its budget is counted
+    as an overrun and a RuntimeWarning is issued. Exceptions raised by a callback are counted and turned into
+    a RuntimeWarning, so one failing hook does not stop the simulation.
+    """
+
+    D_HISTOGRAM_EDGES = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)  # in seconds
+
+    class Entry:
+        """
+        A registered callback with its schedule and statistics.
+        """
+        def __init__(self, callback: Callable[[int], None], priority: int, period: int,
+                     budget: Union[float, None], name: str, order: int):
+            self.callback = callback
+            self.priority = priority
+            self.period = period
+            self.budget = budget  # CPU seconds, None for no budget
+            self.name = name
+            self.order = order  # registration order, breaks priority ties
+            # statistics
+            self.histogram = [0] * (len(TickScheduler.D_HISTOGRAM_EDGES) + 1)
+            self.count_runs = 0
+            self.count_overruns = 0
+            self.count_errors = 0
+            self.time_sum = 0.0
+            self.time_max = 0.0
+            self.cpu_time_sum = 0.0
+
+    def __init__(self):
+        """
+        Construct an empty TickScheduler instance.
+        """
+        self._entries = []  # type: List[TickScheduler.Entry]  # in run order
+        self._lock = Lock()
+        self._count_registered = 0
+        self._tick_count = 0
+
+    @property
+    def callbacks(self) -> List[Callable[[int], None]]:
+        """
+        [Read-Only] Registered callbacks in run order.
+        """
+        with self._lock:
+            return [entry.callback for entry in self._entries]
+
+    @property
+    def statistics(self) -> Dict[str, dict]:
+        """
+        [Read-Only] Execution statistics of each callback.
+
+        :return: callback name -> {'runs': count, 'overruns': count, 'errors': count,
+                                   'mean': seconds, 'max': seconds, 'cpu_mean': seconds,
+                                   'histogram': counts of runs per D_HISTOGRAM_EDGES bucket, the last one is open}
+        """
+        with self._lock:
+            entries = list(self._entries)
+        return {
+            entry.name: {
+                'runs': entry.count_runs,
+                'overruns': entry.count_overruns,
+                'errors': entry.count_errors,
+                'mean': entry.time_sum / entry.count_runs if entry.count_runs else 0.0,
+                'max': entry.time_max,
+                'cpu_mean': entry.cpu_time_sum / entry.count_runs if entry.count_runs else 0.0,
+                'histogram': list(entry.histogram),
+            }
+            for entry in entries
+        }
+
+    def add_callback(self,
+                     callback: Callable[[int], None],
+                     *,
+                     priority: int = 0,
+                     period: int = 1,
+                     budget: Union[float, None] = None,
+                     name: Union[str, None] = None) -> 'TickScheduler':
+        """
+        Register a callback to run after ticks.
+
+        :param callback: a callable taking the carla frame id as argument
+        :param priority: lower values run first, callbacks of the same priority run in registration order
+        :param period: run on every period-th tick
+        :param budget: Optional, CPU seconds allowed per run
+        :param name: Optional, a unique name in statistics,
+                     the callback qualified name followed by its registration order by default
+        :return: return self for method chaining.
+        :raises ValueError: if another callback is registered with the same name
+        """
+        if period <= 0:
+            raise ValueError("period must be greater than 0.")
+        with self._lock:
+            if name is None:
+                # lambdas and methods of different instances share a qualified name
+                name = f"{getattr(callback, '__qualname__', repr(callback))}#{self._count_registered}"
+            elif any(entry.name == name for entry in self._entries):
+                raise ValueError(f'A tick callback named {name} is already registered.')
+            entry = TickScheduler.Entry(callback, priority, period, budget, name, self._count_registered)
+            self._count_registered += 1
+            self._entries.append(entry)
+            self._entries.sort(key=lambda e: (e.priority, e.order))
+        return self
+
+    def remove_callback(self, callback: Callable[[int], None]) -> 'TickScheduler':
+        """
+        Remove a callback added by add_callback. No effect if it is not added.
+        :param callback: the callable to remove
+        :return: return self for method chaining.
+        """
+        with self._lock:
+            self._entries = [entry for entry in self._entries if entry.callback is not callback]
+        return self
+
+    def invoke_run(self, frame: int):
+        """
+        Run the callbacks due on this tick, called once per tick by the control thread.
+
+        :param frame: carla frame id of the tick
+        :return: None
+        """
+        self._tick_count += 1
+        with self._lock:
+            entries = [entry for entry in self._entries if self._tick_count % entry.period == 0]
+        for entry in entries:
+            self._invoke_run_entry(entry, frame)
+
+    def _invoke_run_entry(self, entry: 'TickScheduler.Entry', frame: int):
+        """
+        Run one callback and record its statistics.
+        """
+        time_begin = time.perf_counter()
+        cpu_time_begin = time.thread_time()
+        try:
+            entry.callback(frame)
+        except Exception as e:
+            entry.count_errors += 1
+            warnings.warn(f'Tick callback {entry.name} raised {type(e).__name__}: {e}', RuntimeWarning)
+        cpu_time = time.thread_time() - cpu_time_begin
+        elapsed = time.perf_counter() - time_begin
+        # statistics
+        entry.count_runs += 1
+        entry.time_sum += elapsed
+        entry.time_max = max(entry.time_max, elapsed)
+        entry.cpu_time_sum += cpu_time
+        entry.histogram[bisect.bisect_right(self.D_HISTOGRAM_EDGES, elapsed)] += 1
+        if entry.budget is not None and cpu_time > entry.budget:
+            entry.count_overruns += 1
+            warnings.warn(f'Tick callback {entry.name} exceeded its CPU budget of {entry.budget} s', RuntimeWarning)
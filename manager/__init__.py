@@ -1,8 +1,12 @@
 from .ActorManager import ActorManager
 from .RunningManager import RunningManager
+from .TickPacer import TickPacer
+from .TickScheduler import TickScheduler
 
 
 __all__ = [
     'ActorManager',
     'RunningManager',
+    'TickPacer',
+    'TickScheduler',
 ]
\ No newline at end of file
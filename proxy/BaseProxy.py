@@ -3,6 +3,10 @@ from threading import Thread
 from multiprocessing import Process, Pipe
 from multiprocessing.connection import Connection
 from abc import ABC, abstractmethod
+from typing import Union
+
+from .SharedMemoryConnection import SharedMemoryConnection
+from ..actor import Sensor
 
 
 class BaseProxy(ABC):
@@ -20,6 +24,13 @@ class BaseProxy(ABC):
       IO and data post-processing should be implemented in the Process.
 
     Thread and Process communicate with each other through a PIPE.
+    Objects are sent as they are, pipe.send() and pipe.recv() handle the pickling.
+
+    With use_shared_memory(), the PIPE is replaced by a SharedMemoryConnection with the same interface. Large buffers
+    such as images or point clouds then cross the process boundary through shared memory without being serialized.
+
+    Proxies forwarding sensor data to the process can use invoke_sensor_forwarding() as their thread function,
+    it sends every frame exactly once.
 
     Process can be disabled by setting USE_PROCESS to False for using a lighter weight proxy.
 
@@ -52,6 +63,15 @@ class BaseProxy(ABC):
         # handler
         self._handler_thread = None  # Union[Thread, Process]
         self._handler_process = None  # Union[Thread, Process]
+        # transport
+        self._option_shared_memory = False
+        self._shared_memory_slot_count = SharedMemoryConnection.D_SLOT_COUNT
+        self._shared_memory_slot_size = SharedMemoryConnection.D_SLOT_SIZE
+        self._pipe_ends = ()
+        # counters
+        self._count_frames_forwarded = 0
+        self._count_frames_duplicated = 0
+        self._count_frames_dropped = 0
         # flags
         self._flag_internal_exit = False
 
@@ -115,6 +135,52 @@ class BaseProxy(ABC):
         """
         return self._thread_running_interval
 
+    @property
+    def option_shared_memory(self) -> bool:
+        """
+        [Read-Only] Whether thread and process communicate through shared memory.
+        """
+        return self._option_shared_memory
+
+    @property
+    def count_frames_forwarded(self) -> int:
+        """
+        [Read-Only] Number of sensor frames sent to the process by invoke_sensor_forwarding().
+        """
+        return self._count_frames_forwarded
+
+    @property
+    def count_frames_duplicated(self) -> int:
+        """
+        [Read-Only] Number of sensor updates not sent because their frame was already sent.
+        """
+        return self._count_frames_duplicated
+
+    @property
+    def count_frames_dropped(self) -> int:
+        """
+        [Read-Only] Number of sensor updates replaced by a newer one before they could be sent.
+        """
+        return self._count_frames_dropped
+
+    def use_shared_memory(self, option: bool = True, *,
+                          slot_count: int = SharedMemoryConnection.D_SLOT_COUNT,
+                          slot_size: int = SharedMemoryConnection.D_SLOT_SIZE) -> 'BaseProxy':
+        """
+        Use a SharedMemoryConnection instead of a Pipe between thread and process.
+
+        It takes effect on the next invoke_start().
+
+        :param option: True to use shared memory, False to use a Pipe.
+        :param slot_count: number of shared memory slots in each direction.
+        :param slot_size: size of a slot in bytes, larger objects fall back to the pipe.
+        :return: return self for method chaining.
+        """
+        self._option_shared_memory = option
+        self._shared_memory_slot_count = slot_count
+        self._shared_memory_slot_size = slot_size
+        return self
+
     def is_continue(self) -> bool:
         """
         Should while loop in the handler_thread_func or handler_process_func continue?
@@ -127,7 +193,12 @@ class BaseProxy(ABC):
         Start the proxy.
         """
         if self.USE_PROCESS:
-            pipe_end_1, pipe_end_2 = Pipe()
+            if self.option_shared_memory:
+                pipe_end_1, pipe_end_2 = SharedMemoryConnection.pair(slot_count=self._shared_memory_slot_count,
+                                                                     slot_size=self._shared_memory_slot_size)
+            else:
+                pipe_end_1, pipe_end_2 = Pipe()
+            self._pipe_ends = (pipe_end_1, pipe_end_2)
             self._handler_thread = Thread(target=self.handler_thread_func,
                                           name=self.name + '-T',
                                           args=(pipe_end_1,),
@@ -157,12 +228,54 @@ class BaseProxy(ABC):
         if self.handler_thread and self.handler_thread.is_alive():
             self.handler_thread.join(timeout=self.THREAD_JOIN_TIMEOUT)
 
+        # release the pipe, shared memory is unlinked here
+        for pipe_end in self._pipe_ends:
+            pipe_end.close()
+        self._pipe_ends = ()
+
         self._handler_process = None
         self._handler_process = None
         return self
 
+    def invoke_sensor_forwarding(self, sensor: Sensor, pipe: Union[Connection, SharedMemoryConnection]):
+        """
+        A shared handler_thread_func body, sending every frame of a sensor to the process exactly once.
+
+        It waits on Sensor.data_seq instead of the flashed event_data_update, so no update is missed,
+        and skips updates whose frame was already sent.
+
+        :param sensor: the sensor to forward
+        :param pipe: the pipe-end given to handler_thread_func
+        :return: None
+        """
+        seq = sensor.data_seq
+        frame_sent = None
+        while self.is_continue():
+            # exit if pipe is closed
+            if pipe.closed:
+                break
+            seq_new = sensor.wait_for_data_update(seq, timeout=self.THREAD_RUNNING_INTERVAL)
+            if seq_new == seq:
+                continue
+            self._count_frames_dropped += seq_new - seq - 1
+            seq = seq_new
+            data = sensor.data
+            if data is None:
+                continue
+            if data.frame == frame_sent:
+                self._count_frames_duplicated += 1
+                continue
+            try:
+                pipe.send(data)
+            except (BrokenPipeError, ConnectionResetError):
+                # if the pipe is broken, break the loop without any error
+                self._flag_internal_exit = True
+                break
+            frame_sent = data.frame
+            self._count_frames_forwarded += 1
+
     @abstractmethod
-    def handler_process_func(self, pipe: Connection):
+    def handler_process_func(self, pipe: Union[Connection, SharedMemoryConnection]):
         """
         A handler function running in a separate process.
         It is used to handle the communication with the external source in a separate process.
@@ -174,7 +287,7 @@ class BaseProxy(ABC):
         pass
 
     @abstractmethod
-    def handler_thread_func(self, pipe: Connection):
+    def handler_thread_func(self, pipe: Union[Connection, SharedMemoryConnection]):
         """
         A handler function running in a thread.
         It is used to handle the communication with the CarlaContext source in a single GIL.
@@ -1,4 +1,3 @@
-import pickle
 import pygame
 import numpy
 from multiprocessing.connection import Connection
@@ -125,7 +124,7 @@ class ProxyCameraDisplayPygame(BaseProxy):
             # show image
             try:
                 if pipe.poll(timeout=self.D_PROCESS_RUNNING_INTERVAL):
-                    in_image_data = pickle.loads(pipe.recv())
+                    in_image_data = pipe.recv()
                     if isinstance(in_image_data, ImageData):
                         surface = pygame.surfarray.make_surface(in_image_data.as_pygame_surface_data())
             except KeyboardInterrupt:
@@ -138,20 +137,7 @@ class ProxyCameraDisplayPygame(BaseProxy):
             pygame.display.flip()
 
     def handler_thread_func(self, pipe: Connection):
-        while self.is_continue():
-            # exit if pipe is closed
-            if pipe.closed:
-                break
-
-            # get image from camera
-            self.camera.event_data_update.wait(timeout=self.THREAD_RUNNING_INTERVAL)
-            send_data = pickle.dumps(self.camera.data)
-            try:
-                pipe.send(send_data)
-            except BrokenPipeError:
-                # if process is closed, BrokenPipeError will be raised
-                # so break the loop
-                break
+        self.invoke_sensor_forwarding(self.camera, pipe)
 
     @staticmethod
     def _new_debug_texture(width, height) -> numpy.ndarray:
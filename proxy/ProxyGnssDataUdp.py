@@ -1,4 +1,3 @@
-import pickle
 import numpy
 import sys
 import socket
@@ -51,14 +50,7 @@ class ProxyGnssDataUdp(BaseProxy):
         return self._target_ip, self._target_port
 
     def handler_thread_func(self, pipe: Connection):
-        while self.is_continue():
-            try:
-                self.gnss.event_data_update.wait(timeout=self.THREAD_RUNNING_INTERVAL)
-                pipe.send(pickle.dumps(self.gnss.data))
-            except BrokenPipeError:
-                # if the pipe is broken, break the loop without any error
-                self._flag_internal_exit = True
-                break
+        self.invoke_sensor_forwarding(self.gnss, pipe)
 
     def handler_process_func(self, pipe: Connection):
         in_gnss_data = None  # type: Optional[GnssData]
@@ -68,7 +60,7 @@ class ProxyGnssDataUdp(BaseProxy):
         while self.is_continue():
             try:
                 if pipe.poll(timeout=self.PROCESS_RUNNING_INTERVAL):
-                    in_gnss_data = pickle.loads(pipe.recv())
+                    in_gnss_data = pipe.recv()
             except KeyboardInterrupt:
                 # if press Ctrl+C, KeyboardInterrupt will be raised
                 # so break the loop without any error
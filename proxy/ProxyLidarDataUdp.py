@@ -1,4 +1,3 @@
-import pickle
 import socket
 from multiprocessing.connection import Connection
 from typing import Optional
@@ -49,14 +48,7 @@ class ProxyLidarDataUdp(BaseProxy):
         return self._target_ip, self._target_port
 
     def handler_thread_func(self, pipe: Connection):
-        while self.is_continue():
-            try:
-                self.lidar.event_data_update.wait(timeout=self.THREAD_RUNNING_INTERVAL)
-                pipe.send(pickle.dumps(self.lidar.data))
-            except BrokenPipeError:
-                # if the pipe is broken, break the loop without any error
-                self._flag_internal_exit = True
-                break
+        self.invoke_sensor_forwarding(self.lidar, pipe)
 
     def handler_process_func(self, pipe: Connection):
         in_lidar_data = None  # type: Optional[LidarData]
@@ -66,7 +58,7 @@ class ProxyLidarDataUdp(BaseProxy):
         while self.is_continue():
             try:
                 if pipe.poll(timeout=self.PROCESS_RUNNING_INTERVAL):
-                    in_lidar_data = pickle.loads(pipe.recv())
+                    in_lidar_data = pipe.recv()
             except KeyboardInterrupt:
                 # if press Ctrl+C, KeyboardInterrupt will be raised
                 # so break the loop without any error
@@ -1,6 +1,4 @@
-import pickle
 import numpy
-import sys
 import socket
 from multiprocessing.connection import Connection
 from typing import Optional
@@ -15,6 +13,8 @@ class ProxyRadarDataUdp(BaseProxy):
     A proxy class for the GNSS data UDP server.
     """
 
+    MSG_POINT_DTYPE = numpy.dtype([('id', '>i4'), ('x', '>f4'), ('y', '>f4'), ('vx', '>f4'), ('vy', '>f4')])
+
     def __init__(self,
                  radar: Radar,
                  *,
@@ -51,14 +51,7 @@ class ProxyRadarDataUdp(BaseProxy):
         return self._target_ip, self._target_port
 
     def handler_thread_func(self, pipe: Connection):
-        while self.is_continue():
-            try:
-                self.radar.event_data_update.wait(timeout=self.THREAD_RUNNING_INTERVAL)
-                pipe.send(pickle.dumps(self.radar.data))
-            except BrokenPipeError:
-                # if the pipe is broken, break the loop without any error
-                self._flag_internal_exit = True
-                break
+        self.invoke_sensor_forwarding(self.radar, pipe)
 
     def handler_process_func(self, pipe: Connection):
         in_radar_data = None  # type: Optional[RadarData]
@@ -68,7 +61,7 @@ class ProxyRadarDataUdp(BaseProxy):
         while self.is_continue():
             try:
                 if pipe.poll(timeout=self.PROCESS_RUNNING_INTERVAL):
-                    in_radar_data = pickle.loads(pipe.recv())
+                    in_radar_data = pipe.recv()
             except KeyboardInterrupt:
                 # if press Ctrl+C, KeyboardInterrupt will be raised
                 # so break the loop without any error
@@ -80,29 +73,17 @@ class ProxyRadarDataUdp(BaseProxy):
             # create udp data msg
             msg_type = bytes([0x01])
             msg_reserved = bytes([0x00, 0x00, 0x00])
-            msg_count = len(in_radar_data.points).to_bytes(4, byteorder='big', signed=True)
-
-            msg = msg_type + msg_reserved + msg_count
-
-            d = []
-            for p in in_radar_data.points:
-                d.append([p.altitude, p.azimuth, p.depth, p.velocity])
-            d = numpy.array(d).reshape(-1, 4)
-
-            x = d[:, 2] * numpy.cos(d[:, 1]) * numpy.cos(-d[:, 0])
-            y = d[:, 2] * numpy.sin(-d[:, 1]) * numpy.cos(d[:, 0])
-            vx = d[:, 3] * numpy.cos(d[:, 1]) * numpy.cos(-d[:, 0])
-            vy = d[:, 3] * numpy.sin(-d[:, 1]) * numpy.cos(d[:, 0])
-
-            pts = numpy.column_stack((x, y, vx, vy))
-
-            data = pts.astype(numpy.float32)
-            if sys.byteorder == 'little':
-                data = data.byteswap()
-
-            for i, p in enumerate(data):
-                msg_id = i.to_bytes(4, byteorder='big', signed=True)
-                msg_points = p.tobytes()
-                msg = msg + msg_id + msg_points
-
+            msg_count = in_radar_data.points_count.to_bytes(4, byteorder='big', signed=True)
+
+            # points in big-endian (id, x, y, vx, vy), y-axis points to the left
+            positions = in_radar_data.positions
+            radial_velocities = in_radar_data.radial_velocities
+            msg_points = numpy.empty(in_radar_data.points_count, dtype=self.MSG_POINT_DTYPE)
+            msg_points['id'] = numpy.arange(in_radar_data.points_count)
+            msg_points['x'] = positions[:, 0]
+            msg_points['y'] = -positions[:, 1]
+            msg_points['vx'] = radial_velocities[:, 0]
+            msg_points['vy'] = -radial_velocities[:, 1]
+
+            msg = msg_type + msg_reserved + msg_count + msg_points.tobytes()
             udp_socket.sendto(msg, self.udp_target)
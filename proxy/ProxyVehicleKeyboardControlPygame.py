@@ -1,5 +1,4 @@
 import time
-import pickle
 import pygame
 
 from .BaseProxy import BaseProxy
@@ -76,8 +75,8 @@ class ProxyVehicleKeyboardControlPygame(BaseProxy):
             # recv and send data
             try:
                 if pipe.poll(self.THREAD_RUNNING_INTERVAL):
-                    in_vdcc = pickle.loads(pipe.recv())
-                pipe.send(pickle.dumps(out_vsd))  # send interval is basically equal to self.THREAD_RUNNING_INTERVAL
+                    in_vdcc = pipe.recv()
+                pipe.send(out_vsd)  # send interval is basically equal to self.THREAD_RUNNING_INTERVAL
             except ConnectionResetError:
                 # if the pipe is closed, break the loop
                 self._flag_internal_exit = True
@@ -152,9 +151,9 @@ class ProxyVehicleKeyboardControlPygame(BaseProxy):
                         out_vdcc.reverse = not out_vdcc.reverse
 
             # send & recv data
-            pipe.send(pickle.dumps(out_vdcc))
+            pipe.send(out_vdcc)
             while pipe.poll():
-                in_vsd = pickle.loads(pipe.recv())
+                in_vsd = pipe.recv()
                 if not isinstance(in_vsd, VehicleStatusData):
                     raise TypeError(f'Received data is not VehicleStatusData, got {type(in_vsd)} instead.')
 
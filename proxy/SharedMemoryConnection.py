@@ -0,0 +1,175 @@
+import pickle
+import struct
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Tuple
+
+
+class SharedMemoryConnection:
+    """
+    A connection end with the same send/recv/poll interface as multiprocessing.connection.Connection.
+
+    Objects are pickled with protocol 5. Their out-of-band buffers (SensorData raw buffers, numpy arrays) are copied
+    into a ring of shared memory slots without being serialized, only a small header with the slot index and the
+    sequence number goes through the control pipe.
+
+    Each direction has its own ring. The ring header holds the sequence number last consumed by the reader, a slot is
+    only reused once the reader is done with it. When the ring is full or the buffers do not fit in a slot,
+    the object is sent in-band through the control pipe instead.
+    """
+
+    D_SLOT_COUNT = 4
+    D_SLOT_SIZE = 16 * 1024 * 1024  # in bytes, fits a 1920x1080 BGRA image
+
+    _RING_HEADER = struct.Struct('q')  # sequence number last consumed by the reader
+
+    def __init__(self, pipe: Connection, ring_send: SharedMemory, ring_recv: SharedMemory,
+                 slot_count: int, slot_size: int, *, owner: bool):
+        """
+        Construct a SharedMemoryConnection instance. Use SharedMemoryConnection.pair() instead.
+        """
+        self._pipe = pipe
+        self._ring_send = ring_send
+        self._ring_recv = ring_recv
+        self._slot_count = slot_count
+        self._slot_size = slot_size
+        self._owner = owner
+        self._seq_send = 0
+        # counters
+        self._count_shared = 0
+        self._count_inline = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # only the end created by pair() unlinks the shared memory
+        state['_owner'] = False
+        return state
+
+    @classmethod
+    def pair(cls, *,
+             slot_count: int = D_SLOT_COUNT,
+             slot_size: int = D_SLOT_SIZE) -> Tuple['SharedMemoryConnection', 'SharedMemoryConnection']:
+        """
+        Create a pair of connected ends, like multiprocessing.Pipe().
+
+        :param slot_count: number of slots in each ring
+        :param slot_size: size of a slot in bytes
+        :return: (end_1, end_2)
+        """
+        ring_size = cls._RING_HEADER.size + slot_count * slot_size
+        ring_1 = SharedMemory(create=True, size=ring_size)
+        ring_2 = SharedMemory(create=True, size=ring_size)
+        for ring in (ring_1, ring_2):
+            cls._RING_HEADER.pack_into(ring.buf, 0, -1)
+        pipe_1, pipe_2 = Pipe()
+        return (cls(pipe_1, ring_1, ring_2, slot_count, slot_size, owner=True),
+                cls(pipe_2, ring_2, ring_1, slot_count, slot_size, owner=False))
+
+    @property
+    def closed(self) -> bool:
+        """
+        [Read-Only] Whether the control pipe is closed.
+        """
+        return self._pipe.closed
+
+    @property
+    def count_shared(self) -> int:
+        """
+        [Read-Only] Number of objects sent with their buffers in shared memory.
+        """
+        return self._count_shared
+
+    @property
+    def count_inline(self) -> int:
+        """
+        [Read-Only] Number of objects sent in-band through the control pipe.
+        """
+        return self._count_inline
+
+    def send(self, obj):
+        """
+        Send an object to the other end.
+        :param obj: a picklable object
+        :return: None
+        """
+        buffers = []  # type: List[pickle.PickleBuffer]
+        header = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        if not buffers:
+            self._count_inline += 1
+            self._pipe.send(('i', header))
+            return
+        raws = [buffer.raw() for buffer in buffers]
+        sizes = [raw.nbytes for raw in raws]
+        consumed = self._RING_HEADER.unpack_from(self._ring_send.buf, 0)[0]
+        if sum(sizes) > self._slot_size or self._seq_send - consumed > self._slot_count:
+            # buffers do not fit or the reader is a whole ring behind
+            self._count_inline += 1
+            self._pipe.send(('i', pickle.dumps(obj, protocol=5)))
+            return
+        slot = self._seq_send % self._slot_count
+        offset = self._slot_offset(slot)
+        for raw, size in zip(raws, sizes):
+            self._ring_send.buf[offset:offset + size] = raw
+            offset += size
+        self._count_shared += 1
+        self._pipe.send(('s', slot, self._seq_send, header, sizes))
+        self._seq_send += 1
+
+    def recv(self, *, copy: bool = True):
+        """
+        Receive an object from the other end.
+
+        :param copy: copy the buffers out of shared memory. If False, the buffers of the object are views on the ring
+                     and stay valid until the next recv() call only.
+        :return: the object
+        """
+        msg = self._pipe.recv()
+        if msg[0] == 'i':
+            return pickle.loads(msg[1])
+        _, slot, seq, header, sizes = msg
+        offset = self._slot_offset(slot)
+        buffers = []
+        for size in sizes:
+            view = self._ring_recv.buf[offset:offset + size]
+            buffers.append(bytearray(view) if copy else view)
+            offset += size
+        obj = pickle.loads(header, buffers=buffers)
+        if copy:
+            self._RING_HEADER.pack_into(self._ring_recv.buf, 0, seq)
+        else:
+            # the slot of this message is still in use, release the previous one
+            self._RING_HEADER.pack_into(self._ring_recv.buf, 0, seq - 1)
+        return obj
+
+    def poll(self, timeout: float = 0.0) -> bool:
+        """
+        Whether there is any object available to be read.
+        :param timeout: seconds to wait, None to wait forever
+        :return: bool
+        """
+        return self._pipe.poll(timeout)
+
+    def close(self):
+        """
+        Close the connection. The shared memory is unlinked by the end created as owner.
+        :return: None
+        """
+        self._pipe.close()
+        for ring in (self._ring_send, self._ring_recv):
+            try:
+                ring.close()
+            except BufferError:
+                # views given by recv(copy=False) are still alive, the mapping is released with them
+                pass
+            if self._owner:
+                try:
+                    ring.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def _slot_offset(self, slot: int) -> int:
+        """
+        Byte offset of a slot in a ring.
+        """
+        return self._RING_HEADER.size + slot * self._slot_size
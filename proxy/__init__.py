@@ -1,4 +1,5 @@
 from .BaseProxy import BaseProxy
+from .SharedMemoryConnection import SharedMemoryConnection
 from .ProxyVehicleKeyboardControlPygame import ProxyVehicleKeyboardControlPygame
 from .ProxyCameraDisplayPygame import ProxyCameraDisplayPygame
 from .ProxyImuDataUdp import ProxyImuDataUdp
@@ -8,6 +9,7 @@ from .ProxyLidarDataUdp import ProxyLidarDataUdp
 
 __all__ = [
     'BaseProxy',
+    'SharedMemoryConnection',
     'ProxyVehicleKeyboardControlPygame',
     'ProxyCameraDisplayPygame',
     'ProxyImuDataUdp',
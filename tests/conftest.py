@@ -0,0 +1,43 @@
+import os
+import sys
+import importlib.util
+
+import pytest
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = 'carla_utils'
+
+# the fake backend stands in for the carla module
+sys.path.insert(0, os.path.join(REPOSITORY, 'fake'))
+
+# the repository root is the package, load it under a fixed name whatever the checkout directory is called
+if PACKAGE_NAME not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(PACKAGE_NAME, os.path.join(REPOSITORY, '__init__.py'),
+                                                   submodule_search_locations=[REPOSITORY])
+    _package = importlib.util.module_from_spec(_spec)
+    sys.modules[PACKAGE_NAME] = _package
+    _spec.loader.exec_module(_package)
+
+_ports = iter(range(4000, 5000))
+
+
+@pytest.fixture
+def fake_server():
+    """
+    A fake carla server on a new port, stopped after the test.
+    """
+    import carla
+    server = carla.get_fake_server('127.0.0.1', next(_ports))
+    yield server
+    server.invoke_stop()
+
+
+@pytest.fixture
+def context(fake_server):
+    """
+    A CarlaContext connected to the fake server.
+    """
+    from carla_utils import CarlaContext
+    context = CarlaContext(fake_server.host, fake_server.port).invoke_connection_start()
+    yield context
+    context.invoke_connection_stop()
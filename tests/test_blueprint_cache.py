@@ -0,0 +1,44 @@
+import carla
+
+from carla_utils import CarlaContext
+from carla_utils.core import BlueprintCache
+
+
+def test_blueprint_cache_keeps_one_entry_per_world(fake_server):
+    server_other = carla.get_fake_server('127.0.0.1', fake_server.port + 1000)
+    context = CarlaContext(fake_server.host, fake_server.port).invoke_connection_start()
+    context_other = CarlaContext(server_other.host, server_other.port).invoke_connection_start()
+    try:
+        cache = BlueprintCache()
+        world, world_other = context.carla_world, context_other.carla_world
+        assert world.id != world_other.id
+        for _ in range(2):
+            cache.find(world, 'vehicle.tesla.model3')
+            cache.find(world_other, 'vehicle.tesla.model3')
+        # the two worlds do not evict each other
+        assert cache.count_library_fetched == 2
+        assert cache.world_ids == (world.id, world_other.id)
+
+        cache.invalidate(world.id)
+        assert cache.world_ids == (world_other.id,)
+        cache.find(world, 'vehicle.tesla.model3')
+        assert cache.count_library_fetched == 3
+    finally:
+        context_other.invoke_connection_stop()
+        context.invoke_connection_stop()
+        server_other.invoke_stop()
+
+
+def test_blueprint_cache_drops_least_recently_used_world(fake_server):
+    context = CarlaContext(fake_server.host, fake_server.port).invoke_connection_start()
+    try:
+        cache = BlueprintCache(max_worlds=1)
+        world = context.carla_world
+        cache.find(world, 'vehicle.tesla.model3')
+        context.reload_world()
+        world_new = context.carla_world
+        cache.find(world_new, 'vehicle.tesla.model3')
+        assert cache.world_ids == (world_new.id,)
+        assert cache.count_library_fetched == 2
+    finally:
+        context.invoke_connection_stop()
@@ -0,0 +1,53 @@
+import time
+from threading import Thread
+
+D_TIMEOUT = 10.0  # in seconds
+
+
+def test_short_restart_restored_once(context, fake_server):
+    context.use_auto_reconnect(True, backoff_initial=0.05)
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    lidar = context.actors.new_actor('sensor.lidar.ray_cast', parent=vehicle, channels='16')
+    context.actors.invoke_actor_spawn_batch([vehicle, lidar])
+    count_heartbeats = context.count_heartbeats
+    assert context.count_reconnects == 0
+
+    # a restart shorter than the heartbeat interval, seen by fresh checks of several threads and the heartbeat
+    fake_server.invoke_restart(reset_settings=False).use_latency(rpc=0.02)
+    threads = [Thread(target=context.is_alive, kwargs={'fresh': True}) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    time_end = time.perf_counter() + D_TIMEOUT
+    while context.count_heartbeats < count_heartbeats + len(threads) + 2:
+        assert time.perf_counter() < time_end
+        time.sleep(0.01)
+
+    fake_server.use_latency(rpc=0.0)
+    assert context.count_reconnects == 1
+    assert fake_server.count_actors == 2
+    assert context.carla_world.id == fake_server.episode_id
+    assert vehicle.is_alive() and lidar.is_alive()
+
+
+def test_heartbeat_failure_reconnects(context, fake_server):
+    failures = []
+    context.add_heartbeat_failure_callback(lambda _, error: failures.append(error))
+    context.use_auto_reconnect(True, backoff_initial=0.05)
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    context.actors.invoke_actor_spawn_batch([vehicle])
+
+    fake_server.use_available(False)
+    assert not context.is_alive(fresh=True)
+    assert isinstance(failures[-1], RuntimeError)
+    fake_server.invoke_restart(reset_settings=False).use_available(True)
+    time_end = time.perf_counter() + D_TIMEOUT
+    while context.count_reconnects < 1:
+        assert time.perf_counter() < time_end
+        time.sleep(0.01)
+
+    assert context.is_alive(fresh=True)
+    assert context.count_reconnects == 1
+    assert fake_server.count_actors == 1
+    assert vehicle.is_alive()
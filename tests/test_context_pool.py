@@ -0,0 +1,83 @@
+import os
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from carla_utils import ContextPool
+
+D_TIMEOUT = 30.0  # in seconds
+
+
+def _job_spawn_vehicle(context, value):
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    context.actors.invoke_actor_spawn_batch([vehicle])
+    return value * 2, len(context.actors.registry)
+
+
+def _job_exit_once(context, marker):
+    if not os.path.exists(marker):
+        open(marker, 'w').close()
+        os._exit(3)
+    return 'retried'
+
+
+def _job_fail(context):
+    raise ValueError('job failed')
+
+
+def _job_sleep(context, seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+@pytest.fixture
+def endpoint(fake_server):
+    return f'{fake_server.host}:{fake_server.port}'
+
+
+def test_context_pool_returns_results(endpoint):
+    with ContextPool([endpoint] * 2) as pool:
+        futures = pool.map(_job_spawn_vehicle, range(6))
+        # every job starts on a reset context
+        assert [future.result(timeout=D_TIMEOUT) for future in futures] == [(i * 2, 1) for i in range(6)]
+        statistics = pool.statistics
+    assert sum(s['done'] for s in statistics.values()) == 6
+    assert set(statistics) == {f'{endpoint}#0', f'{endpoint}#1'}
+
+
+def test_context_pool_restarts_killed_worker(endpoint, tmp_path):
+    with ContextPool([endpoint], max_retries=1) as pool:
+        future = pool.submit(_job_exit_once, str(tmp_path / 'marker'))
+        assert future.result(timeout=D_TIMEOUT) == 'retried'
+        assert pool.count_retries == 1
+        statistics = pool.statistics[f'{endpoint}#0']
+    assert (statistics['restarts'], statistics['failed'], statistics['done']) == (1, 1, 1)
+
+
+def test_context_pool_fails_after_max_retries(endpoint):
+    with ContextPool([endpoint], max_retries=2) as pool:
+        future = pool.submit(_job_fail)
+        with pytest.raises(ValueError):
+            future.result(timeout=D_TIMEOUT)
+        assert pool.count_retries == 2
+        assert pool.count_pending == 0
+
+
+def test_context_pool_shutdown(endpoint):
+    pool = ContextPool([endpoint])
+    futures = [pool.submit(_job_sleep, 0.5) for _ in range(3)]
+    time_end = time.perf_counter() + D_TIMEOUT
+    while not futures[0].running():
+        assert time.perf_counter() < time_end
+        time.sleep(0.01)
+    pool.invoke_shutdown(wait=True)
+
+    # the running job finishes, the queued ones are cancelled
+    assert futures[0].result(timeout=0.0) == 0.5
+    for future in futures[1:]:
+        with pytest.raises(CancelledError):
+            future.result(timeout=0.0)
+    assert not any(s['alive'] for s in pool.statistics.values())
+    with pytest.raises(RuntimeError):
+        pool.submit(_job_sleep, 0.0)
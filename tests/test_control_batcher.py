@@ -0,0 +1,75 @@
+import carla
+import pytest
+
+from carla_utils.core import ControlBatcher
+from carla_utils.core.cmd import VehicleDirectControlCmd
+
+D_TIMEOUT = 10.0  # in seconds
+
+
+def _spawn_vehicle(context):
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    context.actors.invoke_actor_spawn_batch([vehicle])
+    return vehicle
+
+
+def test_control_batcher_coalesces_controls(context):
+    vehicle = _spawn_vehicle(context)
+    batcher = ControlBatcher([context.carla_client])
+    actor_id = vehicle.carla_actor.id
+
+    # only the latest control of a tick is sent
+    batcher.submit_direct_control(actor_id, carla.VehicleControl(throttle=0.2))
+    batcher.submit_direct_control(actor_id, carla.VehicleControl(throttle=0.5))
+    assert batcher.invoke_flush() == 1
+    assert vehicle.carla_actor.get_control() == carla.VehicleControl(throttle=0.5)
+
+    # a control equal to the last one sent is not sent again
+    batcher.submit_direct_control(actor_id, carla.VehicleControl(throttle=0.5))
+    assert batcher.invoke_flush() == 0
+    assert (batcher.count_submitted, batcher.count_sent, batcher.count_coalesced) == (3, 1, 2)
+
+    # unless the vehicle is forgotten
+    batcher.invoke_forget(actor_id)
+    batcher.submit_direct_control(actor_id, carla.VehicleControl(throttle=0.5))
+    assert batcher.invoke_flush() == 1
+
+
+def test_control_batcher_keeps_controls_on_failure(context, fake_server):
+    vehicle = _spawn_vehicle(context)
+    batcher = ControlBatcher([context.carla_client])
+    actor_id = vehicle.carla_actor.id
+
+    batcher.submit_direct_control(actor_id, carla.VehicleControl(throttle=0.3))
+    fake_server.use_available(False)
+    try:
+        with pytest.raises(RuntimeError):
+            batcher.invoke_flush()
+        # a newer control submitted before the retry wins
+        batcher.submit_direct_control(actor_id, carla.VehicleControl(throttle=0.4))
+    finally:
+        fake_server.use_available(True)
+    assert batcher.invoke_flush() == 1
+    assert vehicle.carla_actor.get_control() == carla.VehicleControl(throttle=0.4)
+    assert batcher.count_sent == 1
+
+
+def test_vehicle_direct_control_forgets_batched_control(context):
+    vehicle = _spawn_vehicle(context)
+    control_batched = VehicleDirectControlCmd(throttle=0.6)
+    control_direct = VehicleDirectControlCmd(throttle=0.1)
+
+    vehicle.use_control_batch()
+    vehicle.invoke_direct_control(control_batched)
+    context.running.wait_for_ticks(2, timeout=D_TIMEOUT)
+    assert vehicle.carla_actor.get_control() == control_batched.as_carla_vehicle_control()
+
+    vehicle.use_control_batch(option=False)
+    vehicle.invoke_direct_control(control_direct)
+    assert vehicle.carla_actor.get_control() == control_direct.as_carla_vehicle_control()
+
+    # the batched control is sent again, the direct one replaced it on the server
+    vehicle.use_control_batch()
+    vehicle.invoke_direct_control(control_batched)
+    context.running.wait_for_ticks(2, timeout=D_TIMEOUT)
+    assert vehicle.carla_actor.get_control() == control_batched.as_carla_vehicle_control()
@@ -0,0 +1,51 @@
+import numpy
+
+from carla_utils.actor import Vehicle, Lidar, Camera
+from carla_utils.core.data import LidarData, ImageData
+from carla_utils.manager import TickPacer
+
+D_TIMEOUT = 10.0  # in seconds
+
+
+def test_spawn_tick_destroy(context, fake_server):
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    lidar = context.actors.new_actor('sensor.lidar.ray_cast', parent=vehicle, channels='16')
+    context.actors.invoke_actor_spawn_batch([vehicle, lidar])
+    assert isinstance(vehicle, Vehicle) and isinstance(lidar, Lidar)
+    assert vehicle.is_alive() and lidar.is_alive()
+    assert fake_server.count_actors == 2
+
+    context.running.use_sync_primary_mode(True, fixed_delta_time=0.05) \
+        .use_tick_pacing(TickPacer.PACING_AS_FAST_AS_POSSIBLE) \
+        .use_sensor_barrier(True)
+    frame = context.running.frame
+    context.running.wait_for_ticks(5, timeout=D_TIMEOUT)
+    assert context.running.frame >= frame + 5
+    assert vehicle.status is not None
+
+    context.running.use_sensor_barrier(False).use_sync_primary_mode(False)
+    context.actors.invoke_actor_destroy_batch(context.actors.registry)
+    context.running.wait_for_ticks(1, timeout=D_TIMEOUT)
+    assert not vehicle.is_alive() and not lidar.is_alive()
+    assert fake_server.count_actors == 0
+
+
+def test_sensor_decode(context):
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    lidar = context.actors.new_actor('sensor.lidar.ray_cast', parent=vehicle, channels='16')
+    camera = context.actors.new_actor('sensor.camera.rgb', parent=vehicle, image_size_x='64', image_size_y='48')
+    assert isinstance(camera, Camera)
+    context.actors.invoke_actor_spawn_batch([vehicle, lidar, camera])
+    for sensor in (lidar, camera):
+        sensor.wait_for_data_update(0, timeout=D_TIMEOUT)
+
+    lidar_data = lidar.data
+    assert isinstance(lidar_data, LidarData)
+    assert lidar_data.frame > 0
+    assert lidar_data.points_count > 0
+    assert numpy.array_equal(LidarData.decode_points(lidar_data.raw_data), lidar_data.points_array)
+
+    image_data = camera.data
+    assert isinstance(image_data, ImageData)
+    assert image_data.image.shape == (48, 64, 4)
+    assert isinstance(image_data.raw_data, bytes)
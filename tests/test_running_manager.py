@@ -0,0 +1,101 @@
+import pytest
+
+from carla_utils.manager import TickPacer
+
+D_TIMEOUT = 10.0  # in seconds
+
+
+def _use_fast_sync_mode(context):
+    context.running.use_sync_primary_mode(True, fixed_delta_time=0.05) \
+        .use_tick_pacing(TickPacer.PACING_AS_FAST_AS_POSSIBLE)
+
+
+def test_tick_notification_is_lossless(context):
+    _use_fast_sync_mode(context)
+    frames = []
+    on_tick = frames.append
+    context.running.add_tick_callback(on_tick)
+    tick_count = context.running.wait_for_ticks(1, timeout=D_TIMEOUT)
+    frames_begin = len(frames)
+
+    tick_count_end = context.running.wait_for_ticks(20, timeout=D_TIMEOUT)
+    # callbacks of a tick run before its waiters are woken up
+    assert context.running.frame in frames
+    assert tick_count_end >= tick_count + 20
+    # every tick is counted once, in frame order
+    frames_seen = frames[frames_begin:frames_begin + tick_count_end - tick_count]
+    assert frames_seen == list(range(frames_seen[0], frames_seen[0] + len(frames_seen)))
+    assert context.running.wait_for_frame(context.running.frame, timeout=0.0) == context.running.frame
+
+    context.running.remove_tick_callback(on_tick)
+    assert not context.running.tick_scheduler.callbacks
+    context.running.use_sync_primary_mode(False)
+
+
+@pytest.mark.filterwarnings('ignore:Tick callback failing raised:RuntimeWarning')
+def test_tick_callbacks_run_in_order_and_survive_errors(context):
+    calls = []
+
+    def on_tick_late(frame):
+        calls.append(('late', frame))
+
+    def on_tick_failing(frame):
+        calls.append(('failing', frame))
+        raise ValueError('failing tick callback')
+
+    def on_tick_early(frame):
+        calls.append(('early', frame))
+
+    def on_tick_every_second(frame):
+        calls.append(('every_second', frame))
+
+    context.running.add_tick_callback(on_tick_late, name='late') \
+        .add_tick_callback(on_tick_failing, name='failing') \
+        .add_tick_callback(on_tick_early, priority=-1, name='early') \
+        .add_tick_callback(on_tick_every_second, priority=1, period=2, name='every_second')
+    assert context.running.tick_scheduler.callbacks == [on_tick_early, on_tick_late, on_tick_failing,
+                                                        on_tick_every_second]
+    _use_fast_sync_mode(context)
+    context.running.wait_for_ticks(10, timeout=D_TIMEOUT)
+    statistics = context.running.tick_scheduler.statistics
+    for callback in (on_tick_late, on_tick_failing, on_tick_early, on_tick_every_second):
+        context.running.remove_tick_callback(callback)
+    context.running.use_sync_primary_mode(False)
+
+    # every tick runs the callbacks by priority then registration order, the failing one does not stop the rest
+    frames = sorted({frame for _, frame in calls})
+    for frame in frames[:-1]:
+        names = [name for name, f in calls if f == frame]
+        assert names[:3] == ['early', 'late', 'failing']
+        assert names[3:] in ([], ['every_second'])
+    assert 0 < statistics['every_second']['runs'] < statistics['late']['runs']
+    assert statistics['failing']['errors'] > 0
+    assert statistics['late']['errors'] == 0
+
+
+def test_sensor_barrier_counts_timeouts(context):
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    lidar = context.actors.new_actor('sensor.lidar.ray_cast', parent=vehicle, channels='16')
+    camera = context.actors.new_actor('sensor.camera.rgb', parent=vehicle, image_size_x='64', image_size_y='48')
+    context.actors.invoke_actor_spawn_batch([vehicle, lidar, camera])
+    _use_fast_sync_mode(context)
+    context.running.use_sensor_barrier(True, timeout=0.3)
+    context.running.wait_for_ticks(2, timeout=D_TIMEOUT)
+    count_timeouts = context.running.count_sensor_barrier_timeouts
+    context.running.wait_for_ticks(5, timeout=D_TIMEOUT)
+    assert context.running.count_sensor_barrier_timeouts == count_timeouts
+
+    # the camera stops delivering, every tick now waits for it until the timeout
+    camera.carla_actor.stop()
+    context.running.wait_for_ticks(3, timeout=D_TIMEOUT)
+    assert context.running.count_sensor_barrier_timeouts >= count_timeouts + 2
+    assert context.running.sensor_barrier_missing == [camera]
+
+    # a barrier on the lidar only does not wait for the camera
+    context.running.use_sensor_barrier(True, sensors=[lidar], timeout=0.3)
+    context.running.wait_for_ticks(1, timeout=D_TIMEOUT)
+    count_timeouts = context.running.count_sensor_barrier_timeouts
+    context.running.wait_for_ticks(5, timeout=D_TIMEOUT)
+    assert context.running.count_sensor_barrier_timeouts == count_timeouts
+
+    context.running.use_sensor_barrier(False).use_sync_primary_mode(False)
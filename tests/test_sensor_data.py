@@ -0,0 +1,65 @@
+import numpy
+import pytest
+
+from carla_utils.core.data import FrameHistory, LidarData, SensorData
+
+
+def test_lidar_points_ndarray_setter():
+    data = LidarData()
+    data.points_ndarray = numpy.arange(8).reshape(2, 4)
+    assert data.points_count == 2
+    assert data.points_array[1]['intensity'] == 7.0
+    assert data.raw_data == numpy.arange(8, dtype=numpy.float32).tobytes()
+
+    data.points_ndarray = None
+    assert data.points_count == 0
+    assert data.raw_data is None
+
+    with pytest.raises(ValueError):
+        data.points_ndarray = numpy.zeros((2, 3))
+
+
+def _history_frame(history: FrameHistory, frame: int, size: int = 8) -> SensorData:
+    data = SensorData()
+    data.frame = frame
+    data.set_raw_data(bytes([frame % 256]) * size, buffer_pool=history)
+    history.append(data)
+    return data
+
+
+def test_frame_history_wraparound():
+    history = FrameHistory(capacity=3, slot_size=8)
+    for frame in range(5):
+        _history_frame(history, frame)
+
+    assert len(history) == 3
+    assert history.frames == [2, 3, 4]
+    assert history.get(1) is None
+    assert history.get(3).raw_data == bytes([3]) * 8
+    assert [data.frame for data in history.latest(2)] == [4, 3]
+    assert history.count_detached == 0
+
+
+def test_frame_history_growth():
+    history = FrameHistory(capacity=2, slot_size=4)
+    _history_frame(history, 0, size=4)
+    _history_frame(history, 1, size=16)
+
+    assert history.slot_size == 16
+    assert history.get(0).raw_data == bytes([0]) * 4
+    assert history.get(1).raw_data == bytes([1]) * 16
+    assert history.nbytes == 4 + 16
+
+    _history_frame(history, 2, size=16)
+    assert history.nbytes == 16 + 16
+
+
+def test_frame_history_held_frame_not_overwritten():
+    history = FrameHistory(capacity=2, slot_size=8)
+    held = _history_frame(history, 0)
+    _history_frame(history, 1)
+    _history_frame(history, 2)
+
+    assert history.frames == [1, 2]
+    assert history.count_detached == 1
+    assert held.raw_data == bytes([0]) * 8
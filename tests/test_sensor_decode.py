@@ -0,0 +1,55 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Event
+
+D_TIMEOUT = 10.0  # in seconds
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """
+    A ThreadPoolExecutor keeping every future it returns.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.futures = []
+
+    def submit(self, *args, **kwargs):
+        future = super().submit(*args, **kwargs)
+        self.futures.append(future)
+        return future
+
+
+def test_decode_executor_drops_oldest_frames(context):
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    lidar = context.actors.new_actor('sensor.lidar.ray_cast', parent=vehicle, channels='16')
+    context.actors.invoke_actor_spawn_batch([vehicle, lidar])
+
+    frames_published = []
+    executor = RecordingExecutor(max_workers=1)
+    gate = Event()
+    # keep the only worker busy, measurements pile up in the decode queue
+    executor.submit(gate.wait)
+    lidar.use_decode_executor(executor, max_pending=2)
+    lidar.add_update_callback(lambda sensor: frames_published.append(sensor.data.frame))
+    try:
+        time_end = time.perf_counter() + D_TIMEOUT
+        while len(executor.futures) < 1 + 5:
+            assert time.perf_counter() < time_end
+            time.sleep(0.01)
+        lidar.carla_actor.stop()
+        gate.set()
+        futures = executor.futures[1:]
+        wait(futures, timeout=D_TIMEOUT)
+    finally:
+        gate.set()
+        executor.shutdown(wait=True)
+
+    cancelled = [future for future in futures if future.cancelled()]
+    assert len(cancelled) >= 3
+    assert lidar.count_frames_dropped == len(cancelled)
+    # the newest measurements are kept and published in frame order
+    assert not any(future.cancelled() for future in futures[-2:])
+    assert len(frames_published) == len(futures) - len(cancelled)
+    assert frames_published == sorted(frames_published)
+    assert lidar.data.frame == frames_published[-1]
@@ -0,0 +1,50 @@
+import gc
+import weakref
+
+from carla_utils.actor import SensorGroup
+
+D_TIMEOUT = 10.0  # in seconds
+
+
+def test_sensor_group_emits_partial_bundle_after_sensor_stops(context):
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    lidar = context.actors.new_actor('sensor.lidar.ray_cast', parent=vehicle, channels='16')
+    camera = context.actors.new_actor('sensor.camera.rgb', parent=vehicle, image_size_x='64', image_size_y='48')
+    context.actors.invoke_actor_spawn_batch([vehicle, lidar, camera])
+
+    group = SensorGroup([lidar, camera], timeout=0.2, partial_policy=SensorGroup.POLICY_EMIT).invoke_start()
+    try:
+        bundle = group.get(timeout=D_TIMEOUT)
+        assert bundle is not None and bundle.complete
+        assert bundle[lidar].frame == bundle[camera].frame == bundle.frame
+
+        # the camera stops, then the lidar after one more frame: the last frame expires without any group update
+        camera.carla_actor.stop()
+        lidar.wait_for_data_update(lidar.data_seq, timeout=D_TIMEOUT)
+        lidar.carla_actor.stop()
+        while True:
+            bundle = group.get(timeout=D_TIMEOUT)
+            assert bundle is not None
+            if not bundle.complete:
+                break
+        assert bundle.missing == [camera.id]
+        assert bundle[lidar] is not None
+        assert group.count_partial >= 1
+        assert group.arrival_skew[camera.id]['missing'] >= 1
+        assert group.bottleneck is camera
+    finally:
+        group.invoke_stop()
+
+
+def test_sensor_group_not_kept_alive_by_sensors(context):
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    lidar = context.actors.new_actor('sensor.lidar.ray_cast', parent=vehicle, channels='16')
+    context.actors.invoke_actor_spawn_batch([vehicle, lidar])
+
+    group = SensorGroup([lidar]).invoke_start()
+    assert group.get(timeout=D_TIMEOUT) is not None
+    group_ref = weakref.ref(group)
+    del group
+    gc.collect()
+    assert group_ref() is None
+    lidar.wait_for_data_update(lidar.data_seq, timeout=D_TIMEOUT)
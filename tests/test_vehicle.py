@@ -0,0 +1,22 @@
+from carla_utils.manager import TickPacer
+
+D_TIMEOUT = 10.0  # in seconds
+
+
+def test_vehicle_status_not_modified_by_later_calls(context):
+    vehicle = context.actors.new_actor('vehicle.tesla.model3')
+    context.actors.invoke_actor_spawn_batch([vehicle])
+    # one tick every two seconds, the calls below read the same frame
+    context.running.use_sync_primary_mode(True, fixed_delta_time=2.0) \
+        .use_tick_pacing(TickPacer.PACING_REALTIME)
+    context.running.wait_for_ticks(1, timeout=D_TIMEOUT)
+
+    status = vehicle.get_status()
+    assert vehicle.get_status() is status
+    status_wheels = vehicle.get_status(wheel_steer_angles=True)
+    assert status_wheels is not status
+    assert status_wheels.has_wheel_steer_angles
+    assert not status.has_wheel_steer_angles
+    assert vehicle.get_status(wheel_steer_angles=True) is status_wheels
+
+    context.running.use_sync_primary_mode(False)